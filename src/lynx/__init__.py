@@ -1,5 +1,6 @@
 """Lynx - A local backtest tracking system for quantitative analysts."""
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -7,6 +8,7 @@ from typing import Any
 import pandas as pd
 
 from lynx.backtest import backtest
+from lynx.config import _UNSET, ConfigContext
 from lynx.config import config as _config
 from lynx.data.exceptions import DataFetchError, InvalidSymbolError
 from lynx.exceptions import RunNotFoundError
@@ -15,7 +17,7 @@ from lynx.storage import parquet, sqlite
 
 # Public API
 __all__ = [
-    "log", "runs", "load", "delete", "dashboard", "config",
+    "log", "log_many", "runs", "load", "delete", "dashboard", "config",
     "runs_today", "runs_last_7_days", "runs_last_30_days",
     "Run", "RunSummary",
     # Watchlist functions (T061)
@@ -38,6 +40,7 @@ def log(
     params: dict[str, Any] | None = None,
     tags: list[str] | None = None,
     notes: str | None = None,
+    compute_metrics: bool = True,
     **artifacts: pd.DataFrame,
 ) -> Run:
     """Log a backtest run with trades and optional artifacts.
@@ -49,6 +52,8 @@ def log(
         params: Optional dict of strategy parameters
         tags: Optional list of tags for filtering
         notes: Optional text notes
+        compute_metrics: Calculate performance metrics (default: True). Pass
+                         False to skip the calculation and store empty metrics.
         **artifacts: Additional DataFrames to log as artifacts
                      (e.g., entry_signal=df, close_price=df)
 
@@ -65,7 +70,61 @@ def log(
     # Initialize database if needed
     sqlite.init_db()
 
-    # Create run and set trades
+    # Save and return
+    run = _build_run(name, trades=trades, params=params, tags=tags, notes=notes, **artifacts)
+    run.save(compute_metrics=compute_metrics)
+    return run
+
+
+def log_many(
+    specs: Iterable[dict[str, Any]],
+    *,
+    compute_metrics: bool = True,
+) -> list[Run]:
+    """Log several backtest runs in a single database transaction.
+
+    Each spec holds the keyword arguments accepted by log(). All run and
+    artifact records are written on one SQLite connection and committed
+    once; if any run fails, none of the batch is kept.
+
+    Args:
+        specs: Iterable of dicts with "name", "trades" and any of "params",
+               "tags", "notes" plus artifact DataFrames
+        compute_metrics: Calculate performance metrics for every run
+                         (default: True)
+
+    Returns:
+        List of saved Run objects, in the order given
+
+    Raises:
+        ValidationError: If any trades DataFrame is missing required columns
+
+    Example:
+        >>> runs = lynx.log_many([
+        ...     {"name": "momentum", "trades": trades_a, "params": {"window": 20}},
+        ...     {"name": "momentum", "trades": trades_b, "params": {"window": 60}},
+        ... ])
+    """
+    # Initialize database if needed
+    sqlite.init_db()
+
+    # Validate every spec before touching storage
+    batch = [_build_run(**spec) for spec in specs]
+
+    Run._save_many(batch, compute_metrics=compute_metrics)
+    return batch
+
+
+def _build_run(
+    name: str,
+    *,
+    trades: pd.DataFrame,
+    params: dict[str, Any] | None = None,
+    tags: list[str] | None = None,
+    notes: str | None = None,
+    **artifacts: pd.DataFrame,
+) -> Run:
+    """Create an unsaved Run with trades and artifacts attached."""
     run = Run(name=name, params=params, tags=tags, notes=notes)
     run.trades(trades)
 
@@ -78,8 +137,6 @@ def log(
         else:
             run.data(artifact_name, artifact_df)
 
-    # Save and return
-    run.save()
     return run
 
 
@@ -145,7 +202,7 @@ def load(run_id: str) -> Run:
         run_id: The run's unique identifier
 
     Returns:
-        Run object with all data loaded
+        Run object; artifact DataFrames are read from disk when first used
 
     Raises:
         RunNotFoundError: If run_id doesn't exist
@@ -177,21 +234,11 @@ def load(run_id: str) -> Run:
     run._metrics = run_dict["metrics"]
     run._saved = True
 
-    # Load artifacts
-    artifacts = sqlite.get_artifacts(run_id)
-
-    # Load trades (required)
-    trades_artifact = next((a for a in artifacts if a["name"] == "trades"), None)
-    if trades_artifact:
-        run._trades_df = parquet.load_artifact(trades_artifact["file_path"])
-
-    # Load other artifacts
-    for artifact in artifacts:
-        if artifact["name"] == "trades":
-            continue
-
-        df = parquet.load_artifact(artifact["file_path"])
-        run._artifacts[artifact["name"]] = (artifact["artifact_type"], df)
+    # Record artifacts; their Parquet files are only read when needed (metrics
+    # come from the database, so stats() never touches them)
+    run._unloaded = {
+        a["name"]: (a["artifact_type"], a["file_path"]) for a in sqlite.get_artifacts(run_id)
+    }
 
     return run
 
@@ -239,20 +286,28 @@ def dashboard(port: int = 8501, idle_timeout: int = 1800) -> None:
     launch_dashboard(port=port, open_browser=True, idle_timeout=idle_timeout)
 
 
-def config(data_dir: str | Path | None = None) -> dict[str, Any]:
+def config(
+    data_dir: str | Path | None = None,
+    parquet_compression: str | None = _UNSET,
+) -> ConfigContext:
     """Get or set global configuration.
 
     Args:
         data_dir: Override default data directory (~/.lynx/)
+        parquet_compression: Codec for artifact Parquet files (default:
+            "snappy"); None writes them uncompressed
 
     Returns:
-        Current configuration dict
+        Current configuration dict. Use it as a context manager to apply the
+        change only inside a with block.
 
     Example:
         >>> lynx.config(data_dir="/custom/path")
         >>> lynx.config()  # Returns current config
+        >>> with lynx.config(data_dir="/tmp/scratch"):
+        ...     run = lynx.log("my_strategy", trades=trades_df)
     """
-    return _config(data_dir)
+    return _config(data_dir, parquet_compression)
 
 
 def runs_today(strategy: str | None = None) -> list[RunSummary]:
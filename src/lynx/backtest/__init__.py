@@ -1,13 +1,18 @@
 """Backtest engine for lynx."""
 
-from lynx.backtest.costs import calculate_buy_cost, calculate_sell_revenue
+from lynx.backtest.costs import (
+    buy_cost_multiplier,
+    calculate_buy_cost,
+    calculate_sell_revenue,
+    sell_revenue_multiplier,
+)
 from lynx.backtest.defaults import (
     DEFAULT_FEES,
     DEFAULT_LOT_SIZE,
     get_fees_for_symbol,
     get_lot_size_for_symbol,
 )
-from lynx.backtest.engine import BacktestEngine, Position, backtest
+from lynx.backtest.engine import BacktestEngine, Position, PositionBook, TradeLog, backtest
 from lynx.backtest.validators import validate_backtest_inputs
 
 __all__ = [
@@ -18,7 +23,11 @@ __all__ = [
     "validate_backtest_inputs",
     "calculate_buy_cost",
     "calculate_sell_revenue",
+    "buy_cost_multiplier",
+    "sell_revenue_multiplier",
     "BacktestEngine",
     "Position",
+    "PositionBook",
+    "TradeLog",
     "backtest",
 ]
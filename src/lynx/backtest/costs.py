@@ -1,45 +1,36 @@
 """Trading cost calculations for backtest engine."""
 
+from collections.abc import Mapping
 
-def calculate_buy_cost(
-    price: float,
-    shares: int,
-    fees: dict[str, float],
-) -> float:
-    """Calculate total cost to buy shares including fees.
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def buy_cost_multiplier(fees: Mapping[str, float]) -> float:
+    """Get the factor applied to notional value when buying.
 
     Args:
-        price: Price per share
-        shares: Number of shares to buy
         fees: Fee configuration dict
 
     Returns:
-        Total cost including commission and slippage
+        1 + effective commission + slippage
     """
     commission_rate = fees.get("commission_rate", 0.0)
     commission_discount = fees.get("commission_discount", 1.0)
     slippage = fees.get("slippage", 0.0)
 
     effective_commission = commission_rate * commission_discount
-    multiplier = 1 + effective_commission + slippage
-
-    return price * shares * multiplier
+    return 1 + effective_commission + slippage
 
 
-def calculate_sell_revenue(
-    price: float,
-    shares: int,
-    fees: dict[str, float],
-) -> float:
-    """Calculate net revenue from selling shares after fees.
+def sell_revenue_multiplier(fees: Mapping[str, float]) -> float:
+    """Get the factor applied to notional value when selling.
 
     Args:
-        price: Price per share
-        shares: Number of shares to sell
         fees: Fee configuration dict
 
     Returns:
-        Net revenue after commission, tax, and slippage
+        1 - effective commission - sell tax - slippage
     """
     commission_rate = fees.get("commission_rate", 0.0)
     commission_discount = fees.get("commission_discount", 1.0)
@@ -47,6 +38,48 @@ def calculate_sell_revenue(
     slippage = fees.get("slippage", 0.0)
 
     effective_commission = commission_rate * commission_discount
-    multiplier = 1 - effective_commission - tax_sell - slippage
+    return 1 - effective_commission - tax_sell - slippage
+
+
+def calculate_buy_cost(
+    price: float | ArrayLike,
+    shares: int | ArrayLike,
+    fees: Mapping[str, float],
+) -> float | np.ndarray:
+    """Calculate total cost to buy shares including fees.
+
+    Scalar inputs return a float. Array inputs are broadcast against each
+    other and return an ndarray, so many fills can be costed in one call.
+
+    Args:
+        price: Price per share (scalar or array)
+        shares: Number of shares to buy (scalar or array)
+        fees: Fee configuration dict
+
+    Returns:
+        Total cost including commission and slippage
+    """
+    total = np.multiply(price, shares) * buy_cost_multiplier(fees)
+    return float(total) if np.ndim(total) == 0 else total
+
+
+def calculate_sell_revenue(
+    price: float | ArrayLike,
+    shares: int | ArrayLike,
+    fees: Mapping[str, float],
+) -> float | np.ndarray:
+    """Calculate net revenue from selling shares after fees.
+
+    Scalar inputs return a float. Array inputs are broadcast against each
+    other and return an ndarray, so many fills can be costed in one call.
+
+    Args:
+        price: Price per share (scalar or array)
+        shares: Number of shares to sell (scalar or array)
+        fees: Fee configuration dict
 
-    return price * shares * multiplier
+    Returns:
+        Net revenue after commission, tax, and slippage
+    """
+    total = np.multiply(price, shares) * sell_revenue_multiplier(fees)
+    return float(total) if np.ndim(total) == 0 else total
@@ -1,7 +1,11 @@
 """Default configurations for backtest engine."""
 
-# Default fees by market suffix
-DEFAULT_FEES: dict[str, dict[str, float]] = {
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+# Default fees by market suffix (read-only; pass custom_fees to override)
+_DEFAULT_FEES: dict[str, dict[str, float]] = {
     ".TW": {
         "commission_rate": 0.001425,     # 0.1425%
         "commission_discount": 0.6,       # 60% discount
@@ -25,6 +29,10 @@ DEFAULT_FEES: dict[str, dict[str, float]] = {
     },
 }
 
+DEFAULT_FEES: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    suffix: MappingProxyType(fees) for suffix, fees in _DEFAULT_FEES.items()
+})
+
 # Default lot sizes by market suffix
 DEFAULT_LOT_SIZE: dict[str, int] = {
     ".TW": 1000,
@@ -33,6 +41,7 @@ DEFAULT_LOT_SIZE: dict[str, int] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def _get_suffix(symbol: str) -> str:
     """Extract market suffix from symbol (e.g., '.TW' from '2330.TW')."""
     if "." in symbol:
@@ -40,30 +49,41 @@ def _get_suffix(symbol: str) -> str:
     return "_default"
 
 
+@lru_cache(maxsize=256)
+def _fees_for_suffix(
+    suffix: str,
+    overrides: tuple[tuple[str, float], ...],
+) -> Mapping[str, float]:
+    """Merge default fees for a suffix with overrides into a read-only mapping."""
+    fees = dict(DEFAULT_FEES.get(suffix, DEFAULT_FEES["_default"]))
+    fees.update(overrides)
+    return MappingProxyType(fees)
+
+
 def get_fees_for_symbol(
     symbol: str,
     custom_fees: dict[str, dict[str, float]] | None = None,
-) -> dict[str, float]:
+) -> Mapping[str, float]:
     """Get fee configuration for a symbol.
 
+    Results are cached per (suffix, overrides) pair and returned as a
+    read-only mapping; copy with ``dict(...)`` before modifying.
+
     Args:
         symbol: Stock symbol (e.g., '2330.TW')
         custom_fees: Optional custom fee overrides
 
     Returns:
-        Dict with fee configuration
+        Read-only mapping with fee configuration
     """
     suffix = _get_suffix(symbol)
 
-    # Start with default fees
-    base_fees = DEFAULT_FEES.get(suffix, DEFAULT_FEES["_default"]).copy()
-
-    # Apply custom overrides if provided
+    # Key the cache on the overrides' contents so edits to custom_fees are seen
+    overrides = ()
     if custom_fees:
-        custom_for_suffix = custom_fees.get(suffix, {})
-        base_fees.update(custom_for_suffix)
+        overrides = tuple(sorted(custom_fees.get(suffix, {}).items()))
 
-    return base_fees
+    return _fees_for_suffix(suffix, overrides)
 
 
 def get_lot_size_for_symbol(
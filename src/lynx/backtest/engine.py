@@ -1,9 +1,10 @@
 """Core backtest engine."""
 
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import date
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -12,15 +13,149 @@ if TYPE_CHECKING:
 ConflictMode = Literal["exit_first", "entry_first", "ignore"]
 
 
-@dataclass
+class PositionBook(Mapping[str, "Position"]):
+    """Open positions stored as parallel arrays, one slot per symbol.
+
+    Behaves as a read-only mapping of symbol -> Position (iterating in the
+    order positions were opened), while the engine's hot path works on the
+    arrays directly.
+    """
+
+    def __init__(self, symbols: Sequence[str]):
+        n = len(symbols)
+        self.symbols = list(symbols)
+        self._slots = {symbol: j for j, symbol in enumerate(self.symbols)}
+
+        self.shares = np.zeros(n, dtype=np.int64)
+        self.entry_price = np.zeros(n, dtype=np.float64)
+        self.entry_cost = np.zeros(n, dtype=np.float64)
+        self.entry_date = np.empty(n, dtype=object)
+        self.active = np.zeros(n, dtype=bool)
+
+        # Open order, so iteration matches the order positions were taken
+        self._opened = np.zeros(n, dtype=np.int64)
+        self._next_seq = 0
+
+    def slot(self, symbol: str) -> int:
+        """Get the array index for a symbol."""
+        return self._slots[symbol]
+
+    def open(
+        self,
+        slot: int,
+        shares: int,
+        entry_price: float,
+        entry_date: date,
+        entry_cost: float,
+    ) -> None:
+        """Open a position in the given slot."""
+        self.shares[slot] = shares
+        self.entry_price[slot] = entry_price
+        self.entry_cost[slot] = entry_cost
+        self.entry_date[slot] = entry_date
+        self.active[slot] = True
+        self._opened[slot] = self._next_seq
+        self._next_seq += 1
+
+    def close(self, slot: int) -> None:
+        """Mark the position in the given slot as closed."""
+        self.shares[slot] = 0
+        self.active[slot] = False
+
+    def open_slots(self) -> np.ndarray:
+        """Get slots of open positions, in the order they were opened."""
+        slots = np.flatnonzero(self.active)
+        return slots[np.argsort(self._opened[slots], kind="stable")]
+
+    def current_value_all(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate market value of every slot (0 where no position is open)."""
+        return np.where(self.active, self.shares * prices, 0.0)
+
+    def holdings_value(self, prices: np.ndarray) -> float:
+        """Calculate total market value of open positions as one dot product.
+
+        Only open slots are gathered, so closed columns (whose price may be
+        NaN) never enter the sum and days with nothing held cost no math.
+        """
+        held = np.flatnonzero(self.active)
+        if not held.size:
+            return 0.0
+        return float(np.dot(self.shares[held], prices[held]))
+
+    def return_pct_all(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate return of every slot from its entry price (NaN where closed)."""
+        out = np.full(len(self.symbols), np.nan)
+        np.divide(prices - self.entry_price, self.entry_price, out=out, where=self.active)
+        return out
+
+    def __getitem__(self, symbol: str) -> "Position":
+        slot = self._slots[symbol]
+        if not self.active[slot]:
+            raise KeyError(symbol)
+        return Position._view(self, slot)
+
+    def __contains__(self, symbol: object) -> bool:
+        slot = self._slots.get(symbol)  # type: ignore[call-overload]
+        return slot is not None and bool(self.active[slot])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.symbols[slot] for slot in self.open_slots())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.active))
+
+
 class Position:
-    """Represents an open position."""
+    """Represents an open position.
 
-    symbol: str
-    shares: int
-    entry_price: float
-    entry_date: date
-    entry_cost: float
+    A view onto one PositionBook slot. Constructing a Position directly gives
+    it a private single-slot book.
+    """
+
+    __slots__ = ("symbol", "_book", "_slot")
+
+    def __init__(
+        self,
+        symbol: str,
+        shares: int,
+        entry_price: float,
+        entry_date: date,
+        entry_cost: float,
+    ):
+        book = PositionBook([symbol])
+        book.open(0, shares, entry_price, entry_date, entry_cost)
+        self.symbol = symbol
+        self._book = book
+        self._slot = 0
+
+    @classmethod
+    def _view(cls, book: PositionBook, slot: int) -> "Position":
+        """Create a Position reading and writing the given book slot."""
+        pos = cls.__new__(cls)
+        pos.symbol = book.symbols[slot]
+        pos._book = book
+        pos._slot = slot
+        return pos
+
+    @property
+    def shares(self) -> int:
+        return int(self._book.shares[self._slot])
+
+    @shares.setter
+    def shares(self, value: int) -> None:
+        self._book.shares[self._slot] = value
+
+    @property
+    def entry_price(self) -> float:
+        return float(self._book.entry_price[self._slot])
+
+    @property
+    def entry_date(self) -> date:
+        return self._book.entry_date[self._slot]
+
+    @property
+    def entry_cost(self) -> float:
+        return float(self._book.entry_cost[self._slot])
 
     def current_value(self, current_price: float) -> float:
         """Calculate current market value of position."""
@@ -36,6 +171,153 @@ class Position:
         self.shares -= actual_exit
         return actual_exit
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        symbol, shares, entry_price, entry_date, entry_cost = self._fields()
+        return (
+            f"Position(symbol={symbol!r}, shares={shares!r}, entry_price={entry_price!r}, "
+            f"entry_date={entry_date!r}, entry_cost={entry_cost!r})"
+        )
+
+    def _fields(self) -> tuple:
+        return (self.symbol, self.shares, self.entry_price, self.entry_date, self.entry_cost)
+
+
+_TRADE_DTYPE = np.dtype([
+    ("symbol", object),
+    ("entry_date", object),
+    ("exit_date", object),
+    ("entry_price", np.float64),
+    ("exit_price", np.float64),
+    ("shares", np.int64),
+    ("return", np.float64),
+    ("exit_reason", object),
+])
+
+
+class TradeLog(Sequence[dict]):
+    """Closed trades stored in a preallocated NumPy record array.
+
+    Behaves as a read-only sequence of trade dicts (built on access). Each
+    trade is written into the next slot of the buffer, which doubles when
+    full, and to_frame() builds a DataFrame from the filled slots.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._records = np.empty(max(capacity, 1), dtype=_TRADE_DTYPE)
+        self._n = 0
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the buffer to hold at least ``capacity`` trades."""
+        if capacity > len(self._records):
+            records = np.empty(capacity, dtype=_TRADE_DTYPE)
+            records[: self._n] = self._records[: self._n]
+            self._records = records
+
+    def append(
+        self,
+        symbol: str,
+        entry_date: date,
+        exit_date: date,
+        entry_price: float,
+        exit_price: float,
+        shares: int,
+        trade_return: float,
+        exit_reason: str,
+    ) -> None:
+        """Record one closed trade."""
+        if self._n == len(self._records):
+            self.reserve(2 * self._n)
+        self._records[self._n] = (
+            symbol,
+            entry_date,
+            exit_date,
+            entry_price,
+            exit_price,
+            shares,
+            trade_return,
+            exit_reason,
+        )
+        self._n += 1
+
+    @property
+    def records(self) -> np.ndarray:
+        """View of the filled part of the buffer."""
+        return self._records[: self._n]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build a DataFrame with one row per trade."""
+        return pd.DataFrame(self.records)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        row = self.records[index]
+        return {name: row[name] for name in _TRADE_DTYPE.names}
+
+    def __len__(self) -> int:
+        return self._n
+
+
+def _new_equity_history(dates: pd.Index) -> np.ndarray:
+    """Allocate the per-day equity record array for the given dates.
+
+    Fields: date, equity, cash, holdings_value, daily_return. The array
+    converts directly with pd.DataFrame(history).
+    """
+    dtype = np.dtype([
+        ("date", dates.to_numpy().dtype),
+        ("equity", np.float64),
+        ("cash", np.float64),
+        ("holdings_value", np.float64),
+        ("daily_return", np.float64),
+    ])
+    return np.zeros(len(dates), dtype=dtype)
+
+
+def _size_entries(
+    allocation: np.ndarray,
+    price: np.ndarray,
+    cost_multiplier: np.ndarray,
+    lot_size: np.ndarray,
+    cash: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Size entry orders in whole lots, scaling all of them down if needed.
+
+    Works on plain arrays and scalars only, so a day's orders are sized in a
+    few array operations rather than per-candidate Python bookkeeping.
+
+    Args:
+        allocation: Cash allocated to each order
+        price: Entry price of each order
+        cost_multiplier: Buy cost multiplier (fees + slippage) of each order
+        lot_size: Lot size of each order
+        cash: Cash available for the day's orders
+
+    Returns:
+        (shares, cost) arrays aligned with the inputs. Orders that cannot be
+        filled (no price, or less than one lot) get 0 shares and 0 cost.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_shares = allocation / (price * cost_multiplier)
+    max_shares = np.where(np.isfinite(max_shares), max_shares, 0.0).astype(np.int64)
+    shares = (max_shares // lot_size) * lot_size
+    cost = np.where(shares > 0, price * shares * cost_multiplier, 0.0)
+
+    # Scale down if the total exceeds available cash
+    total_cost = sum(cost.tolist())
+    if total_cost > cash:
+        scale = cash / total_cost * 0.99  # 1% safety margin
+        shares = (shares * scale).astype(np.int64)
+        shares = (shares // lot_size) * lot_size
+        cost = np.where(shares > 0, price * shares * cost_multiplier, 0.0)
+
+    return shares, cost
+
 
 class BacktestEngine:
     """Vectorized backtest engine."""
@@ -80,26 +362,22 @@ class BacktestEngine:
 
         # State
         self.cash = initial_capital
-        self.positions: dict[str, Position] = {}  # symbol -> Position
-        self.trades: list[dict] = []
-        self.equity_history: list[dict] = []
+        self.positions = PositionBook(list(price.columns) if price is not None else [])
+        self.trades = TradeLog()
+        self.equity_history = _new_equity_history(pd.DatetimeIndex([]))
 
     def run(self) -> None:
         """Execute the backtest simulation."""
-        from lynx.backtest.costs import calculate_buy_cost
-        from lynx.backtest.defaults import get_fees_for_symbol, get_lot_size_for_symbol
-
         # Auto-fetch prices if needed
         if self.price is None and self.auto_fetch_prices:
-            from lynx.data.cache import fetch_prices_with_cache
+            from lynx.data.cache import fetch_prices_with_cache, validate_symbols_with_cache
             from lynx.data.exceptions import InvalidSymbolError
-            from lynx.data.yahoo import validate_symbols
 
             # Get symbols from entry signal columns
             symbols = list(self.entry_signal.columns)
 
             # Validate symbols
-            validation = validate_symbols(symbols)
+            validation = validate_symbols_with_cache(symbols)
             if validation.invalid_symbols:
                 raise InvalidSymbolError(
                     f"Cannot fetch from Yahoo Finance: {validation.invalid_symbols}"
@@ -133,197 +411,219 @@ class BacktestEngine:
             raise ValueError("price is required when auto_fetch_prices=False")
 
         symbols = list(self.price.columns)
-        dates = self.price.index.tolist()
-
-        # Align signals to price dates
-        entry_aligned = self.entry_signal.reindex(dates).fillna(0)
-        exit_aligned = self.exit_signal.reindex(dates).fillna(0)
+        dates = self.price.index
+
+        # Prices may only be known now (auto-fetch), so size the book here
+        if self.positions.symbols != symbols:
+            self.positions = PositionBook(symbols)
+        book = self.positions
+
+        # Resolve fee and lot size rules once per column, not per fill
+        self._resolve_symbol_costs(symbols)
+
+        # Convert inputs to aligned T x N float arrays once, instead of
+        # label-based DataFrame lookups on every day/symbol
+        prices = self.price.to_numpy(dtype=np.float64)
+        entries = (
+            self.entry_signal.reindex(index=dates, columns=symbols)
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+        exits = (
+            self.exit_signal.reindex(index=dates, columns=symbols)
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+
+        # Precompute signal masks across the full time x symbol matrix
+        entry_mask = entries > 0
+        exit_mask = exits > 0
+        conflict_mask = entry_mask & exit_mask
+        entry_totals = entries.sum(axis=1)
+
+        # Signals are sparse; days without any exit signal skip that step
+        has_exit = exit_mask.any(axis=1)
+
+        # Most entries close as exactly one trade, so size the log for that
+        self.trades.reserve(int(np.count_nonzero(entry_mask)))
+
+        # One preallocated equity record per day
+        history = self.equity_history = _new_equity_history(dates)
+        date_values = dates.to_numpy()
 
         # Track positions marked for exit (for next day execution)
-        pending_exits: dict[str, str] = {}  # symbol -> reason
+        pending_exits: dict[int, str] = {}  # slot -> reason
 
-        for _i, current_date in enumerate(dates):
-            current_prices = self.price.loc[current_date]
+        # Iterate by position; a date label is only boxed when an order fills
+        for t in range(len(dates)):
+            current_prices = prices[t]
 
             # Step 1: Execute pending exits (from previous day's stop/take profit)
-            for symbol, reason in list(pending_exits.items()):
-                if symbol in self.positions:
+            for j, reason in pending_exits.items():
+                if book.active[j]:
                     self._execute_exit(
-                        symbol=symbol,
-                        exit_date=current_date,
-                        price=current_prices[symbol],
+                        slot=j,
+                        exit_date=dates[t],
+                        price=current_prices[j],
                         exit_ratio=1.0,
                         reason=reason,
                     )
             pending_exits.clear()
 
             # Step 2: Check stop loss / take profit at current prices
-            for symbol, pos in list(self.positions.items()):
-                current_price = current_prices[symbol]
-                return_pct = pos.return_pct(current_price)
-
-                if self.stop_loss and return_pct <= -self.stop_loss:
-                    pending_exits[symbol] = "stop_loss"
-                elif self.take_profit and return_pct >= self.take_profit:
-                    pending_exits[symbol] = "take_profit"
+            if (self.stop_loss or self.take_profit) and book.active.any():
+                # Returns of the held slots only, then one compare per rule
+                held = book.open_slots()
+                entry_prices = book.entry_price[held]
+                returns = (current_prices[held] - entry_prices) / entry_prices
+
+                stop_hit = np.zeros(held.size, dtype=bool)
+                take_hit = np.zeros(held.size, dtype=bool)
+                if self.stop_loss:
+                    stop_hit = returns <= -self.stop_loss
+                if self.take_profit:
+                    take_hit = returns >= self.take_profit
+
+                # Usually empty; stop loss wins if both fire
+                for i in np.flatnonzero(stop_hit | take_hit).tolist():
+                    pending_exits[int(held[i])] = "stop_loss" if stop_hit[i] else "take_profit"
 
             # Step 3: Process exit signals
-            for symbol in symbols:
-                exit_value = exit_aligned.loc[current_date, symbol]
-                if exit_value > 0 and symbol in self.positions:
-                    # Check for conflict
-                    entry_value = entry_aligned.loc[current_date, symbol]
-                    if entry_value > 0:
-                        if self.conflict_mode == "entry_first":
-                            continue  # Skip exit
-                        elif self.conflict_mode == "ignore":
-                            continue  # Skip both (entry handled later)
+            if has_exit[t]:
+                for j in np.flatnonzero(exit_mask[t] & book.active):
+                    # Check for conflict: entry_first and ignore both skip the exit
+                    if conflict_mask[t, j] and self.conflict_mode in ("entry_first", "ignore"):
+                        continue
 
                     self._execute_exit(
-                        symbol=symbol,
-                        exit_date=current_date,
-                        price=current_prices[symbol],
-                        exit_ratio=exit_value,
+                        slot=j,
+                        exit_date=dates[t],
+                        price=current_prices[j],
+                        exit_ratio=exits[t, j],
                         reason="signal",
                     )
 
             # Step 4: Process entry signals
-            entry_row = entry_aligned.loc[current_date]
-            row_sum = entry_row.sum()
+            row_sum = entry_totals[t]
 
             if row_sum > 0:
                 # Cap investment at 100% of cash
                 invest_ratio = min(row_sum, 1.0)
                 investable = self.cash * invest_ratio
 
-                # Collect candidates for entry
-                candidates = []
-                for symbol in symbols:
-                    signal_value = entry_row[symbol]
-                    if signal_value <= 0:
-                        continue
-
-                    # Skip if already holding
-                    if symbol in self.positions:
-                        continue
-
-                    # Check for conflict in ignore mode
-                    exit_value = exit_aligned.loc[current_date, symbol]
-                    if exit_value > 0 and self.conflict_mode == "ignore":
-                        continue
-
-                    candidates.append((symbol, signal_value))
+                # Candidates: signalled symbols not already held (and, in
+                # ignore mode, without a conflicting exit signal)
+                eligible = entry_mask[t] & ~book.active
+                if self.conflict_mode == "ignore":
+                    eligible &= ~exit_mask[t]
+                candidates = np.flatnonzero(eligible)
 
-                if candidates:
+                if candidates.size:
                     # Calculate initial allocations
-                    candidate_sum = sum(sv for _, sv in candidates)
-                    purchases = []
-
-                    for symbol, signal_value in candidates:
-                        weight = signal_value / candidate_sum
-                        allocation = investable * weight
-
-                        lot_size = get_lot_size_for_symbol(symbol, self.custom_lot_size)
-                        fees = get_fees_for_symbol(symbol, self.custom_fees)
-                        price = current_prices[symbol]
-
-                        # Account for fees when calculating max shares
-                        commission_rate = fees.get("commission_rate", 0.0)
-                        commission_discount = fees.get("commission_discount", 1.0)
-                        slippage = fees.get("slippage", 0.0)
-                        effective_rate = 1 + commission_rate * commission_discount + slippage
-
-                        max_shares = int(allocation / (price * effective_rate))
-                        shares = (max_shares // lot_size) * lot_size
-
-                        if shares > 0:
-                            cost = calculate_buy_cost(price, shares, fees)
-                            purchases.append({
-                                "symbol": symbol,
-                                "shares": shares,
-                                "price": price,
-                                "cost": cost,
-                                "lot_size": lot_size,
-                                "fees": fees,
-                                "weight": weight,
-                            })
-
-                    # Check total cost and scale down if needed
-                    total_cost = sum(p["cost"] for p in purchases)
-                    if total_cost > self.cash and purchases:
-                        scale = self.cash / total_cost * 0.99  # 1% safety margin
-                        for p in purchases:
-                            new_shares = int(p["shares"] * scale)
-                            new_shares = (new_shares // p["lot_size"]) * p["lot_size"]
-                            p["shares"] = new_shares
-                            if new_shares > 0:
-                                p["cost"] = calculate_buy_cost(p["price"], new_shares, p["fees"])
-                            else:
-                                p["cost"] = 0
+                    signal_values = entries[t, candidates]
+                    weights = signal_values / sum(signal_values.tolist())
+                    allocations = investable * weights
+
+                    # Account for fees when calculating max shares
+                    shares, costs = _size_entries(
+                        allocations,
+                        current_prices[candidates],
+                        self._buy_multiplier[candidates],
+                        self._lot_size[candidates],
+                        self.cash,
+                    )
 
                     # Execute purchases
-                    for p in purchases:
-                        if p["shares"] <= 0:
+                    entry_date = dates[t]
+                    if hasattr(entry_date, "date"):
+                        entry_date = entry_date.date()
+                    for j, n_shares, cost in zip(
+                        candidates.tolist(), shares.tolist(), costs.tolist(), strict=True
+                    ):
+                        if n_shares <= 0:
                             continue
-                        if p["cost"] > self.cash:
+                        if cost > self.cash:
                             continue
 
-                        self.positions[p["symbol"]] = Position(
-                            symbol=p["symbol"],
-                            shares=p["shares"],
-                            entry_price=p["price"],
-                            entry_date=current_date.date() if hasattr(current_date, 'date') else current_date,
-                            entry_cost=p["cost"],
+                        book.open(
+                            j,
+                            shares=n_shares,
+                            entry_price=current_prices[j],
+                            entry_date=entry_date,
+                            entry_cost=cost,
                         )
-                        self.cash -= p["cost"]
+                        self.cash -= cost
 
             # Step 5: Record daily equity
-            holdings_value = sum(
-                pos.current_value(current_prices[pos.symbol])
-                for pos in self.positions.values()
-            )
+            holdings_value = book.holdings_value(current_prices)
             equity = self.cash + holdings_value
 
-            prev_equity = self.equity_history[-1]["equity"] if self.equity_history else self.initial_capital
+            prev_equity = history["equity"][t - 1] if t else self.initial_capital
             daily_return = (equity - prev_equity) / prev_equity if prev_equity > 0 else 0.0
 
-            self.equity_history.append({
-                "date": current_date,
-                "equity": equity,
-                "cash": self.cash,
-                "holdings_value": holdings_value,
-                "daily_return": daily_return,
-            })
+            history[t] = (date_values[t], equity, self.cash, holdings_value, daily_return)
 
         # Close any remaining positions at last price
         last_date = dates[-1]
-        last_prices = self.price.loc[last_date]
-        for symbol in list(self.positions.keys()):
+        last_prices = prices[-1]
+        for j in book.open_slots().tolist():
             self._execute_exit(
-                symbol=symbol,
+                slot=j,
                 exit_date=last_date,
-                price=last_prices[symbol],
+                price=last_prices[j],
                 exit_ratio=1.0,
                 reason="end_of_data",
             )
 
+    def _resolve_symbol_costs(self, symbols: list[str]) -> None:
+        """Precompute per-column cost multipliers and lot sizes.
+
+        Columns sharing a market suffix share fee and lot size rules, so each
+        rule is resolved once and mapped onto its columns by index. Fills
+        then only do an indexed array load.
+        """
+        from lynx.backtest.costs import buy_cost_multiplier, sell_revenue_multiplier
+        from lynx.backtest.defaults import (
+            _get_suffix,
+            get_fees_for_symbol,
+            get_lot_size_for_symbol,
+        )
+
+        rule_of_suffix: dict[str, int] = {}
+        representatives: list[str] = []  # first symbol seen for each suffix
+        rule_idx = np.empty(len(symbols), dtype=np.intp)
+        for j, symbol in enumerate(symbols):
+            suffix = _get_suffix(symbol)
+            if suffix not in rule_of_suffix:
+                rule_of_suffix[suffix] = len(representatives)
+                representatives.append(symbol)
+            rule_idx[j] = rule_of_suffix[suffix]
+
+        fees = [get_fees_for_symbol(symbol, self.custom_fees) for symbol in representatives]
+        buy = np.array([buy_cost_multiplier(f) for f in fees], dtype=np.float64)
+        sell = np.array([sell_revenue_multiplier(f) for f in fees], dtype=np.float64)
+        lot = np.array(
+            [get_lot_size_for_symbol(symbol, self.custom_lot_size) for symbol in representatives],
+            dtype=np.int64,
+        )
+
+        self._buy_multiplier = buy[rule_idx]
+        self._sell_multiplier = sell[rule_idx]
+        self._lot_size = lot[rule_idx]
+
     def _execute_exit(
         self,
-        symbol: str,
+        slot: int,
         exit_date,
         price: float,
         exit_ratio: float,
         reason: str,
     ) -> None:
-        """Execute an exit order."""
-        from lynx.backtest.costs import calculate_sell_revenue
-        from lynx.backtest.defaults import get_fees_for_symbol, get_lot_size_for_symbol
-
-        pos = self.positions.get(symbol)
-        if pos is None:
+        """Execute an exit order for the position in the given book slot."""
+        if not self.positions.active[slot]:
             return
 
-        fees = get_fees_for_symbol(symbol, self.custom_fees)
+        pos = Position._view(self.positions, slot)
 
         # Calculate shares to exit
         shares_to_exit = int(pos.shares * exit_ratio)
@@ -331,7 +631,7 @@ class BacktestEngine:
             return
 
         # Get lot size for rounding
-        lot_size = get_lot_size_for_symbol(symbol, self.custom_lot_size)
+        lot_size = int(self._lot_size[slot])
 
         # Round to lot size (for partial exits)
         if exit_ratio < 1.0:
@@ -340,7 +640,7 @@ class BacktestEngine:
                 return
 
         actual_exited = pos.reduce(shares_to_exit)
-        revenue = calculate_sell_revenue(price, actual_exited, fees)
+        revenue = float(price * actual_exited * self._sell_multiplier[slot])
         self.cash += revenue
 
         # Calculate return for this trade
@@ -349,20 +649,20 @@ class BacktestEngine:
         trade_return = (revenue - trade_cost) / trade_cost
 
         # Record trade
-        self.trades.append({
-            "symbol": symbol,
-            "entry_date": pos.entry_date,
-            "exit_date": exit_date.date() if hasattr(exit_date, 'date') else exit_date,
-            "entry_price": pos.entry_price,
-            "exit_price": price,
-            "shares": actual_exited,
-            "return": trade_return,
-            "exit_reason": reason,
-        })
+        self.trades.append(
+            symbol=pos.symbol,
+            entry_date=pos.entry_date,
+            exit_date=exit_date.date() if hasattr(exit_date, 'date') else exit_date,
+            entry_price=pos.entry_price,
+            exit_price=price,
+            shares=actual_exited,
+            trade_return=trade_return,
+            exit_reason=reason,
+        )
 
         # Remove position if fully exited
         if pos.shares <= 0:
-            del self.positions[symbol]
+            self.positions.close(slot)
 
 
 def backtest(
@@ -377,6 +677,7 @@ def backtest(
     fees: dict[str, dict[str, float]] | None = None,
     lot_size: dict[str, int] | None = None,
     auto_fetch_prices: bool = True,
+    validate: bool = True,
 ) -> "Run":
     """Run a backtest and return a saved Run object.
 
@@ -392,6 +693,8 @@ def backtest(
         fees: Custom fee configuration
         lot_size: Custom lot size configuration
         auto_fetch_prices: Auto-fetch prices from Yahoo Finance if price is None (default: True)
+        validate: Check signal and price inputs before running (default: True).
+            Parameter sweeps that reuse already-validated inputs can pass False.
 
     Returns:
         Run object with trades, metrics, and equity curve saved
@@ -404,7 +707,7 @@ def backtest(
     from lynx.storage import sqlite
 
     # Validate inputs - only validate price if provided
-    if price is not None:
+    if validate and price is not None:
         validate_backtest_inputs(entry_signal, exit_signal, price)
 
     # Initialize database
@@ -426,7 +729,7 @@ def backtest(
     engine.run()
 
     # Create trades DataFrame
-    trades_df = pd.DataFrame(engine.trades)
+    trades_df = engine.trades.to_frame()
 
     # Handle empty trades case
     if trades_df.empty:
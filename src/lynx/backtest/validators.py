@@ -1,10 +1,26 @@
 """Input validation for backtest engine."""
 
+import numpy as np
 import pandas as pd
 
 from lynx.exceptions import ValidationError
 
 
+def _value_range(df: pd.DataFrame) -> tuple[float, float]:
+    """Get the (min, max) of all values, ignoring NaN, in one pass per bound.
+
+    Uses fmin/fmax reductions over the whole array rather than building
+    elementwise boolean masks. Values are read as float64 so mixed-dtype
+    frames (e.g. bool and float signal columns) and nullable or Arrow-backed
+    columns reduce natively instead of through an object array. Returns
+    (nan, nan) for empty or all-NaN input.
+    """
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if values.size == 0:
+        return np.nan, np.nan
+    return np.fmin.reduce(values, axis=None), np.fmax.reduce(values, axis=None)
+
+
 def validate_backtest_inputs(
     entry_signal: pd.DataFrame,
     exit_signal: pd.DataFrame,
@@ -32,27 +48,35 @@ def validate_backtest_inputs(
     if price.empty:
         raise ValidationError("price DataFrame cannot be empty")
 
-    # Check columns match
-    entry_cols = set(entry_signal.columns)
-    exit_cols = set(exit_signal.columns)
-    price_cols = set(price.columns)
+    # Check columns match. Identical indexes (the usual case) compare in C
+    # without hashing every label; fall back to sets for reordered columns.
+    if not (
+        entry_signal.columns.equals(price.columns)
+        and exit_signal.columns.equals(price.columns)
+    ):
+        entry_cols = set(entry_signal.columns)
+        exit_cols = set(exit_signal.columns)
+        price_cols = set(price.columns)
 
-    if entry_cols != exit_cols or entry_cols != price_cols:
-        raise ValidationError(
-            f"All DataFrames columns must match. "
-            f"entry_signal: {sorted(entry_cols)}, "
-            f"exit_signal: {sorted(exit_cols)}, "
-            f"price: {sorted(price_cols)}"
-        )
+        if entry_cols != exit_cols or entry_cols != price_cols:
+            raise ValidationError(
+                f"All DataFrames columns must match. "
+                f"entry_signal: {sorted(entry_cols)}, "
+                f"exit_signal: {sorted(exit_cols)}, "
+                f"price: {sorted(price_cols)}"
+            )
 
     # Check entry_signal values in [0, 1]
-    if (entry_signal.values < 0).any() or (entry_signal.values > 1).any():
+    low, high = _value_range(entry_signal)
+    if low < 0 or high > 1:
         raise ValidationError("entry_signal values must be between 0 and 1")
 
     # Check exit_signal values in [0, 1]
-    if (exit_signal.values < 0).any() or (exit_signal.values > 1).any():
+    low, high = _value_range(exit_signal)
+    if low < 0 or high > 1:
         raise ValidationError("exit_signal values must be between 0 and 1")
 
     # Check price values are positive
-    if (price.values <= 0).any():
+    low, _ = _value_range(price)
+    if low <= 0:
         raise ValidationError("price values must be positive")
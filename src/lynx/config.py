@@ -1,13 +1,75 @@
 """Configuration management for lynx."""
 import os
+from contextvars import ContextVar, Token
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Default Parquet codec for artifacts (matches pandas' own default)
+DEFAULT_PARQUET_COMPRESSION = "snappy"
+
+# Sentinel for config() arguments where None is a meaningful value
+_UNSET: Any = object()
+
 # Module-level configuration
 _config: dict[str, Any] = {
     "data_dir": None,  # Will be set to default on first access
+    "parquet_compression": DEFAULT_PARQUET_COMPRESSION,
 }
 
+# Context-local overrides set by `with config(...)` blocks. They shadow the
+# module-level values for the current thread/task only.
+_overrides: ContextVar[dict[str, Any] | None] = ContextVar("lynx_config_overrides", default=None)
+
+
+def _get(key: str) -> Any:
+    """Get a setting, preferring the current context's override."""
+    overrides = _overrides.get()
+    if overrides is not None and key in overrides:
+        return overrides[key]
+    return _config[key]
+
+
+class ConfigContext(dict):
+    """Current configuration, returned by config().
+
+    Behaves as a plain dict. Used as a context manager, the settings passed to
+    config() apply only inside the with block (and only to the current
+    thread/task), and the previous configuration is restored on exit.
+
+    Example:
+        >>> with lynx.config(data_dir="/tmp/scratch") as cfg:
+        ...     lynx.log("test", trades=trades_df)
+    """
+
+    def __init__(
+        self,
+        values: dict[str, Any],
+        changes: dict[str, Any],
+        previous: dict[str, Any] | None,
+        in_override: bool,
+    ) -> None:
+        super().__init__(values)
+        self._changes = changes
+        self._previous = previous
+        self._in_override = in_override
+        self._token: Token | None = None
+
+    def __enter__(self) -> "ConfigContext":
+        # config() already applied the changes to the active layer; undo that
+        # and push them as a context-local override instead.
+        if self._in_override:
+            _overrides.set(self._previous)
+        else:
+            _config.update(self._previous or {})
+        self._token = _overrides.set({**(_overrides.get() or {}), **self._changes})
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _overrides.reset(self._token)
+            self._token = None
+
 
 def get_data_dir() -> Path:
     """Get the data directory path.
@@ -17,40 +79,87 @@ def get_data_dir() -> Path:
     2. LYNX_DATA_DIR environment variable
     3. Default: ~/.lynx/
     """
-    if _config["data_dir"] is not None:
-        return Path(_config["data_dir"])
+    return _resolve_data_dir(_get("data_dir"), os.environ.get("LYNX_DATA_DIR"))
+
+
+@lru_cache(maxsize=8)
+def _resolve_data_dir(data_dir: Path | None, env_dir: str | None) -> Path:
+    """Resolve the data directory for one combination of settings.
+
+    Cached because it runs on every storage access, and Path.home() does a
+    home-directory lookup each time. The cache is keyed on the raw settings,
+    so config() overrides and LYNX_DATA_DIR changes are always picked up.
+    """
+    if data_dir is not None:
+        return Path(data_dir)
 
-    env_dir = os.environ.get("LYNX_DATA_DIR")
     if env_dir:
         return Path(env_dir)
 
     return Path.home() / ".lynx"
 
 
-def config(data_dir: str | Path | None = None) -> dict[str, Any]:
+def get_parquet_compression() -> str | None:
+    """Get the Parquet compression codec for artifacts (None = uncompressed)."""
+    return _get("parquet_compression")
+
+
+def config(
+    data_dir: str | Path | None = None,
+    parquet_compression: str | None = _UNSET,
+) -> ConfigContext:
     """Get or set global configuration.
 
     Args:
         data_dir: Override default data directory
+        parquet_compression: Codec for artifact Parquet files, e.g. "snappy",
+            "zstd", or None to write them uncompressed
 
     Returns:
-        Current configuration dict
+        Current configuration dict, also usable as a context manager to scope
+        the change to a with block
 
     Example:
         >>> lynx.config(data_dir="/custom/path")
         >>> lynx.config()  # Returns current config
+        >>> with lynx.config(data_dir="/tmp/scratch"):
+        ...     ...  # data_dir reverts when the block exits
     """
+    changes: dict[str, Any] = {}
     if data_dir is not None:
-        _config["data_dir"] = Path(data_dir)
-
-    return {
-        "data_dir": str(get_data_dir()),
-    }
+        changes["data_dir"] = Path(data_dir)
+    if parquet_compression is not _UNSET:
+        changes["parquet_compression"] = parquet_compression
+
+    # Apply to the innermost active layer: a with-block override if one is
+    # active in this context, otherwise the module-level settings.
+    overrides = _overrides.get()
+    in_override = overrides is not None
+    if in_override:
+        previous = overrides
+        if changes:
+            _overrides.set({**overrides, **changes})
+    else:
+        previous = {key: _config[key] for key in changes}
+        _config.update(changes)
+
+    return ConfigContext(
+        {
+            "data_dir": str(get_data_dir()),
+            "parquet_compression": get_parquet_compression(),
+        },
+        changes,
+        previous,
+        in_override,
+    )
 
 
 def reset_config() -> None:
     """Reset configuration to defaults (mainly for testing)."""
     _config["data_dir"] = None
+    _config["parquet_compression"] = DEFAULT_PARQUET_COMPRESSION
+    _overrides.set(None)
+    _resolve_data_dir.cache_clear()
 
 
 def ensure_data_dir() -> Path:
@@ -1,15 +1,24 @@
 """Data fetching and caching module."""
 
-from lynx.data.cache import fetch_prices_with_cache, get_cache_dir
+from lynx.data.cache import fetch_prices_with_cache, get_cache_dir, validate_symbols_with_cache
 from lynx.data.exceptions import DataFetchError, InvalidSymbolError
-from lynx.data.yahoo import ValidationResult, fetch_adjusted_prices, validate_symbols
+from lynx.data.yahoo import (
+    ValidationResult,
+    YahooClient,
+    YFinanceClient,
+    fetch_adjusted_prices,
+    validate_symbols,
+)
 
 __all__ = [
     "fetch_adjusted_prices",
     "fetch_prices_with_cache",
     "get_cache_dir",
     "validate_symbols",
+    "validate_symbols_with_cache",
     "ValidationResult",
+    "YahooClient",
+    "YFinanceClient",
     "DataFetchError",
     "InvalidSymbolError",
 ]
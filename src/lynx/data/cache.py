@@ -1,12 +1,33 @@
 """Local cache management for price data."""
 
+import os
+import sqlite3
+import tempfile
+import time
 import warnings
-from datetime import date
+from contextlib import closing
+from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
 
-from lynx.data.yahoo import fetch_adjusted_prices
+from lynx.data.yahoo import ValidationResult, fetch_adjusted_prices, validate_symbols
+
+# Cached prices form one hive-partitioned dataset: prices/symbol=<SYMBOL>/...
+# Files are Feather v2 (Arrow IPC) with LZ4: a cache is read far more often
+# than written, and IPC decodes without Parquet's footer and page parsing.
+# The symbol partition key is read dictionary-encoded (see _partitioning).
+_PARTITION_SCHEMA = pa.schema([("symbol", pa.dictionary(pa.int32(), pa.string()))])
+
+
+# Symbols confirmed to exist on Yahoo are remembered for this long, so repeated
+# backtests skip the lookup. Failed lookups are never cached: they may be
+# transient network errors rather than unknown symbols.
+SYMBOL_CACHE_TTL = timedelta(hours=24)
 
 
 def get_cache_dir() -> Path:
@@ -16,35 +37,117 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+def _partition_file(cache_dir: Path, symbol: str) -> Path:
+    return cache_dir / f"symbol={symbol}" / "prices.feather"
+
+
 def get_cache_path(symbol: str) -> Path:
-    """Get the cache file path for a symbol."""
-    return get_cache_dir() / f"{symbol}.parquet"
+    """Get the cache file path for a symbol (inside its dataset partition)."""
+    return _partition_file(get_cache_dir(), symbol)
 
 
 def save_to_cache(symbol: str, df: pd.DataFrame) -> None:
-    """Save price data to cache with atomic write."""
+    """Save price data to cache with atomic write.
+
+    Prices are stored as (date, close) rows in the symbol's partition; the
+    symbol itself lives in the partition path.
+    """
     path = get_cache_path(symbol)
-    temp_path = path.with_suffix('.parquet.tmp')
+    path.parent.mkdir(exist_ok=True)
 
-    # Standardize column name to symbol
-    save_df = df.copy()
-    if len(save_df.columns) == 1 and save_df.columns[0] != symbol:
-        save_df = save_df.rename(columns={save_df.columns[0]: symbol})
+    close = df[symbol] if symbol in df.columns else df.iloc[:, 0]
+    table = pa.table({"date": df.index.to_numpy(), "close": close.to_numpy()})
 
-    save_df.to_parquet(temp_path)
-    temp_path.replace(path)  # Atomic on POSIX
+    # Unique temp name per writer, so concurrent saves of the same symbol
+    # never write into each other's file; readers only ever see a complete
+    # file because the rename is atomic.
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".prices.", suffix=".tmp")
+    os.close(fd)
+    try:
+        feather.write_feather(table, temp_name, compression="lz4")
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
 
 
-def load_from_cache(symbol: str) -> pd.DataFrame | None:
-    """Load price data from cache. Returns None if not found."""
-    path = get_cache_path(symbol)
-    if not path.exists():
-        return None
+_CACHE_COLUMNS = ["symbol", "date", "close"]
+
+
+def _partitioning(symbols: list[str]) -> ds.Partitioning:
+    """Hive partitioning that reads the symbol key as a dictionary column.
+
+    The symbol then arrives in pandas as a Categorical instead of one Python
+    string per row, which is cheaper both to convert and to group by.
+    Directory names are taken verbatim: save_to_cache writes the symbol
+    unencoded, so a "%" in it must not be URI-decoded on the way back.
+    """
+    return ds.HivePartitioning(
+        _PARTITION_SCHEMA,
+        dictionaries={"symbol": pa.array(list(dict.fromkeys(symbols)), pa.string())},
+        segment_encoding="none",
+    )
+
+
+def _scan_cache(symbols: list[str]) -> pd.DataFrame:
+    """Read cached (symbol, date, close) rows for several symbols in one scan.
+
+    Only the partitions of the requested symbols are opened, and they are
+    read and decoded together rather than one file at a time. The symbol
+    column is categorical.
+    """
+    empty = pd.DataFrame({
+        "symbol": pd.Categorical([], categories=list(dict.fromkeys(symbols))),
+        "date": pd.Series(dtype="datetime64[ns]"),
+        "close": pd.Series(dtype=float),
+    })
+    cache_dir = get_cache_dir()
+    paths = [
+        str(path)
+        for path in (_partition_file(cache_dir, symbol) for symbol in symbols)
+        if path.exists()
+    ]
+    if not paths:
+        return empty
+
     try:
-        return pd.read_parquet(path)
+        dataset = ds.dataset(
+            paths,
+            format="feather",
+            partitioning=_partitioning(symbols),
+            partition_base_dir=str(cache_dir),
+        )
+        return dataset.to_table(columns=_CACHE_COLUMNS).to_pandas()
     except Exception as e:
-        warnings.warn(f"Failed to read cache for {symbol}: {e}", stacklevel=2)
-        return None
+        warnings.warn(f"Failed to read price cache: {e}", stacklevel=3)
+        return empty
+
+
+def _split_by_symbol(rows: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Turn long cache rows into symbol -> single-column price DataFrame."""
+    return {
+        symbol: (
+            group.set_index("date")[["close"]]
+            .rename(columns={"close": symbol})
+            .rename_axis(None)
+        )
+        for symbol, group in rows.groupby("symbol", sort=False, observed=True)
+    }
+
+
+def load_many_from_cache(symbols: list[str]) -> dict[str, pd.DataFrame]:
+    """Load cached prices for several symbols with a single dataset scan.
+
+    Returns:
+        Dict of symbol -> single-column DataFrame (named after the symbol)
+        for every symbol found in the cache
+    """
+    return _split_by_symbol(_scan_cache(symbols))
+
+
+def load_from_cache(symbol: str) -> pd.DataFrame | None:
+    """Load price data from cache. Returns None if not found."""
+    return load_many_from_cache([symbol]).get(symbol)
 
 
 def fetch_prices_with_cache(
@@ -52,28 +155,28 @@ def fetch_prices_with_cache(
     start_date: date,
     end_date: date,
 ) -> pd.DataFrame:
-    """Fetch prices with local caching support."""
+    """Fetch prices with local caching support.
+
+    The cache is read in one scan, and the date coverage of every symbol
+    comes from one grouped min/max. Symbols the cache does not fully cover
+    are downloaded together in a single request.
+    """
     result_dfs = []
-    symbols_to_fetch = []
-    cached_data = {}  # Store already-loaded cache
+    cached = _scan_cache(symbols)
 
-    for symbol in symbols:
-        cached = load_from_cache(symbol)
-
-        if cached is not None and not cached.empty:
-            cached_data[symbol] = cached  # Store for later use
-            cached_start = cached.index.min().date()
-            cached_end = cached.index.max().date()
-
-            if cached_start <= start_date and cached_end >= end_date:
-                # Cache covers the range
-                mask = (cached.index.date >= start_date) & (cached.index.date <= end_date)
-                filtered = cached.loc[mask]
-                result_dfs.append(filtered)
-            else:
-                symbols_to_fetch.append(symbol)
-        else:
-            symbols_to_fetch.append(symbol)
+    # Cached date range per symbol, compared as dates like the final filter
+    coverage = cached.groupby("symbol", sort=False, observed=True)["date"].agg(["min", "max"])
+    is_covered = (coverage["min"].dt.date <= start_date) & (coverage["max"].dt.date >= end_date)
+    covered = set(coverage.index[is_covered])
+    symbols_to_fetch = [symbol for symbol in symbols if symbol not in covered]
+
+    if covered:
+        # Cache covers the range: one pivot instead of a filter per symbol
+        hits = cached[cached["symbol"].isin(covered)]
+        wide = hits.pivot(index="date", columns="symbol", values="close")
+        hit_symbols = [symbol for symbol in symbols if symbol in covered]
+        wide = wide[hit_symbols].set_axis(pd.Index(hit_symbols), axis=1)
+        result_dfs.append(wide.rename_axis(index=None))
 
     if symbols_to_fetch:
         fetched = fetch_adjusted_prices(
@@ -82,11 +185,13 @@ def fetch_prices_with_cache(
             end_date=end_date,
         )
 
+        # Partially cached symbols are merged with what is already stored
+        cached_data = _split_by_symbol(cached[cached["symbol"].isin(symbols_to_fetch)])
+
         for symbol in symbols_to_fetch:
             if symbol in fetched.columns:
                 symbol_df = fetched[[symbol]]
 
-                # Use cached_data instead of re-reading from disk
                 if symbol in cached_data:
                     existing = cached_data[symbol]
                     combined = pd.concat([existing, symbol_df])
@@ -103,5 +208,76 @@ def fetch_prices_with_cache(
 
     result = pd.concat(result_dfs, axis=1)
     result = result.sort_index()
-    mask = (result.index.date >= start_date) & (result.index.date <= end_date)
+    days = _calendar_days(result.index)
+    mask = (days >= np.datetime64(start_date, "D")) & (days <= np.datetime64(end_date, "D"))
     return result.loc[mask]
+
+
+def _calendar_days(index: pd.DatetimeIndex) -> np.ndarray:
+    """Calendar day of each timestamp (in the index's own timezone) as datetime64[D].
+
+    Same as index.date, without building a Python date object per row.
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype("datetime64[D]")
+
+
+def _symbol_cache_path() -> Path:
+    return get_cache_dir().parent / "symbols.db"
+
+
+def validate_symbols_with_cache(
+    symbols: list[str],
+    ttl: timedelta = SYMBOL_CACHE_TTL,
+) -> ValidationResult:
+    """Validate symbols, reusing successful lookups younger than ttl.
+
+    Only symbols without a recent successful lookup are checked on Yahoo
+    Finance; newly confirmed symbols are recorded for later calls.
+
+    Args:
+        symbols: List of symbols to validate
+        ttl: How long a successful lookup stays valid
+
+    Returns:
+        ValidationResult with valid/invalid symbols (in input order) and
+        error messages
+    """
+    if not symbols:
+        return ValidationResult()
+
+    now = time.time()
+    with closing(sqlite3.connect(_symbol_cache_path())) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS valid_symbols "
+            "(symbol TEXT PRIMARY KEY, checked_at REAL NOT NULL)"
+        )
+        placeholders = ", ".join("?" * len(symbols))
+        known = {
+            row[0]
+            for row in conn.execute(
+                f"SELECT symbol FROM valid_symbols "
+                f"WHERE checked_at > ? AND symbol IN ({placeholders})",
+                [now - ttl.total_seconds(), *symbols],
+            )
+        }
+
+        unknown = [symbol for symbol in dict.fromkeys(symbols) if symbol not in known]
+        checked = validate_symbols(unknown) if unknown else ValidationResult()
+
+        if checked.valid_symbols:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO valid_symbols (symbol, checked_at) VALUES (?, ?)",
+                    [(symbol, now) for symbol in checked.valid_symbols],
+                )
+
+    invalid = set(checked.invalid_symbols)
+    result = ValidationResult(errors=checked.errors)
+    for symbol in symbols:
+        if symbol in invalid:
+            result.invalid_symbols.append(symbol)
+        else:
+            result.valid_symbols.append(symbol)
+    return result
@@ -1,13 +1,55 @@
 """Yahoo Finance data fetching."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
+from typing import Any, Protocol
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 from lynx.data.exceptions import DataFetchError
 
+# Symbol lookups are network-bound, so they run concurrently. Kept modest
+# because Yahoo rate-limits bursts of requests.
+_VALIDATE_WORKERS = 8
+
+
+class YahooClient(Protocol):
+    """Source of Yahoo Finance data used by validate_symbols and fetch_adjusted_prices.
+
+    Pass an implementation as ``client=`` to use another transport, or a
+    lightweight stub in tests.
+    """
+
+    def info(self, symbol: str) -> dict[str, Any]:
+        """Return the quote info dict for one symbol."""
+        ...
+
+    def download(self, symbols: list[str], start_date: date, end_date: date) -> pd.DataFrame:
+        """Return yf.download-shaped daily data, with an "Adj Close" field."""
+        ...
+
+
+class YFinanceClient:
+    """YahooClient backed by the yfinance package (the default)."""
+
+    def info(self, symbol: str) -> dict[str, Any]:
+        return yf.Ticker(symbol).info
+
+    def download(self, symbols: list[str], start_date: date, end_date: date) -> pd.DataFrame:
+        return yf.download(
+            tickers=symbols,
+            start=start_date,
+            end=end_date,
+            auto_adjust=False,  # Keep Adj Close separate
+            progress=False,
+        )
+
+
+_DEFAULT_CLIENT = YFinanceClient()
+
 
 @dataclass
 class ValidationResult:
@@ -18,39 +60,60 @@ class ValidationResult:
     errors: dict[str, str] = field(default_factory=dict)
 
 
-def validate_symbols(symbols: list[str]) -> ValidationResult:
+def _check_symbol(symbol: str, client: YahooClient) -> str | None:
+    """Look up one symbol. Returns an error message, or None if it is valid."""
+    try:
+        info = client.info(symbol)
+
+        # Check if we got valid info back by checking multiple fields
+        # Note: regularMarketPrice is real-time and may be None outside trading hours,
+        # so we check multiple fields to verify symbol existence
+        if info and any([
+            info.get("regularMarketPrice") is not None,
+            info.get("previousClose") is not None,
+            info.get("symbol") == symbol,  # At least confirm symbol exists
+        ]):
+            return None
+        return "Symbol not found or no market data"
+    except Exception as e:
+        # Broad exception handling is acceptable here since yfinance can throw
+        # various exception types (network errors, API errors, etc.)
+        return str(e)
+
+
+def validate_symbols(
+    symbols: list[str],
+    *,
+    client: YahooClient | None = None,
+) -> ValidationResult:
     """Validate that symbols exist on Yahoo Finance.
 
+    Symbols are looked up concurrently, so validating many symbols costs
+    roughly one round-trip per batch of workers rather than one per symbol.
+
     Args:
         symbols: List of symbols to validate
+        client: Data source to query (default: yfinance)
 
     Returns:
-        ValidationResult with valid/invalid symbols and error messages
+        ValidationResult with valid/invalid symbols (in input order) and
+        error messages
     """
     result = ValidationResult()
+    client = client or _DEFAULT_CLIENT
 
-    for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-
-            # Check if we got valid info back by checking multiple fields
-            # Note: regularMarketPrice is real-time and may be None outside trading hours,
-            # so we check multiple fields to verify symbol existence
-            if info and any([
-                info.get("regularMarketPrice") is not None,
-                info.get("previousClose") is not None,
-                info.get("symbol") == symbol,  # At least confirm symbol exists
-            ]):
-                result.valid_symbols.append(symbol)
-            else:
-                result.invalid_symbols.append(symbol)
-                result.errors[symbol] = "Symbol not found or no market data"
-        except Exception as e:
-            # Broad exception handling is acceptable here since yfinance can throw
-            # various exception types (network errors, API errors, etc.)
+    if len(symbols) > 1:
+        with ThreadPoolExecutor(max_workers=min(_VALIDATE_WORKERS, len(symbols))) as pool:
+            errors = list(pool.map(_check_symbol, symbols, [client] * len(symbols)))
+    else:
+        errors = [_check_symbol(symbol, client) for symbol in symbols]
+
+    for symbol, error in zip(symbols, errors, strict=True):
+        if error is None:
+            result.valid_symbols.append(symbol)
+        else:
             result.invalid_symbols.append(symbol)
-            result.errors[symbol] = str(e)
+            result.errors[symbol] = error
 
     return result
 
@@ -59,6 +122,8 @@ def fetch_adjusted_prices(
     symbols: list[str],
     start_date: date,
     end_date: date,
+    *,
+    client: YahooClient | None = None,
 ) -> pd.DataFrame:
     """Fetch adjusted close prices from Yahoo Finance.
 
@@ -66,6 +131,7 @@ def fetch_adjusted_prices(
         symbols: List of Yahoo Finance compatible symbols
         start_date: Start date for price data
         end_date: End date for price data
+        client: Data source to query (default: yfinance)
 
     Returns:
         DataFrame with DatetimeIndex and symbol columns containing adjusted close prices
@@ -80,35 +146,36 @@ def fetch_adjusted_prices(
     if start_date > end_date:
         raise ValueError(f"start_date {start_date} must be before end_date {end_date}")
 
+    client = client or _DEFAULT_CLIENT
+
     try:
         # Download data from Yahoo Finance
-        data = yf.download(
-            tickers=symbols,
-            start=start_date,
-            end=end_date,
-            auto_adjust=False,  # Keep Adj Close separate
-            progress=False,
-        )
+        data = client.download(symbols, start_date, end_date)
 
         if data.empty:
             raise DataFetchError(f"No data returned for symbols: {symbols}")
 
-        # Extract Adj Close column(s)
-        if len(symbols) == 1:
+        # Extract Adj Close column(s) as one float block, building the result
+        # frame directly from it rather than slicing and copying the response
+        if isinstance(data.columns, pd.MultiIndex):
+            # (field, symbol) columns - multiple symbols, or one symbol on
+            # newer yfinance versions
+            if "Adj Close" not in data.columns.get_level_values(0):
+                raise DataFetchError("No Adj Close data in response")
+            adj_close = data.xs("Adj Close", axis=1, level=0)
+            columns = symbols if len(symbols) == 1 else adj_close.columns
+        else:
             # Single symbol: data has simple column names
-            if "Adj Close" in data.columns:
-                result = data[["Adj Close"]].copy()
-                result.columns = symbols
-            else:
+            if "Adj Close" not in data.columns:
                 raise DataFetchError(f"No Adj Close data for {symbols[0]}")
-        else:
-            # Multiple symbols: data has MultiIndex columns
-            if "Adj Close" in data.columns.get_level_values(0):
-                result = data["Adj Close"].copy()
-            else:
-                raise DataFetchError("No Adj Close data in response")
+            adj_close = data[["Adj Close"]]
+            columns = symbols
 
-        return result
+        return pd.DataFrame(
+            adj_close.to_numpy(dtype=np.float64),
+            index=data.index,
+            columns=columns,
+        )
 
     except DataFetchError:
         raise
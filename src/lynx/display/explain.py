@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from lynx.exceptions import ValidationError
@@ -33,32 +34,45 @@ def explain_symbol(
         ValidationError: If no signals are logged
     """
     # Get all signal artifacts
-    signals = _get_signal_artifacts(run)
+    symbols = symbol if isinstance(symbol, list) else [symbol]
+    signals = _get_signal_artifacts(run, symbols)
 
     if not signals:
         raise ValidationError(
             "No signal artifacts logged. Use run.signal(name, df) to log signals before calling explain()."
         )
 
+    # Align and date-filter the signals once, not once per explained symbol
+    signals, placeholders = _align_signals(signals, start_date, end_date)
+
     # Handle multiple symbols
     if isinstance(symbol, list):
-        return {s: _explain_single_symbol(signals, s, start_date, end_date) for s in symbol}
+        return {s: _explain_single_symbol(signals, placeholders, s) for s in symbol}
 
-    return _explain_single_symbol(signals, symbol, start_date, end_date)
+    return _explain_single_symbol(signals, placeholders, symbol)
 
 
-def _get_signal_artifacts(run: "Run") -> dict[str, pd.DataFrame]:
+def _get_signal_artifacts(run: "Run", symbols: list[str]) -> dict[str, pd.DataFrame]:
     """Get all signal-type artifacts from the run.
 
     Args:
         run: The Run object
+        symbols: Symbols being explained; signals still on disk are read
+            for these columns only
 
     Returns:
         Dict mapping signal name to DataFrame
     """
+    from lynx.storage import parquet
+
     signals = {}
 
-    # Check in-memory artifacts first
+    # Signals of a loaded run that have not been read yet
+    for name, (artifact_type, file_path) in run._unloaded.items():
+        if artifact_type == "signal":
+            signals[name] = parquet.load_artifact(file_path, columns=symbols)
+
+    # In-memory artifacts
     for name, (artifact_type, df) in run._artifacts.items():
         if artifact_type == "signal":
             signals[name] = df
@@ -66,20 +80,64 @@ def _get_signal_artifacts(run: "Run") -> dict[str, pd.DataFrame]:
     return signals
 
 
-def _explain_single_symbol(
+def _align_signals(
     signals: dict[str, pd.DataFrame],
-    symbol: str,
     start_date: str | datetime | None = None,
     end_date: str | datetime | None = None,
-) -> pd.DataFrame:
-    """Explain signal conditions for a single symbol.
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.Series]]:
+    """Put every signal on the combined date index and apply the date range.
 
     Args:
         signals: Dict of signal name to DataFrame
-        symbol: Stock symbol to analyze
         start_date: Optional start date filter
         end_date: Optional end date filter
 
+    Returns:
+        Tuple of (aligned signals, per-signal placeholder column for symbols
+        the signal does not contain)
+    """
+    dates = None
+    for df in signals.values():
+        dates = df.index if dates is None else dates.union(df.index)
+
+    # Apply date filters
+    keep = np.ones(len(dates), dtype=bool)
+    if start_date is not None:
+        if isinstance(start_date, str):
+            start_date = pd.to_datetime(start_date)
+        keep &= dates >= start_date
+
+    if end_date is not None:
+        if isinstance(end_date, str):
+            end_date = pd.to_datetime(end_date)
+        keep &= dates <= end_date
+
+    aligned = {}
+    placeholders = {}
+    for name, df in signals.items():
+        # Symbol not in this signal: NA on the signal's own dates, NaN elsewhere
+        placeholder = pd.Series([pd.NA] * len(df), index=df.index, name=name)
+        if not df.index.equals(dates):
+            df = df.reindex(dates)
+            placeholder = placeholder.reindex(dates)
+        aligned[name] = df[keep]
+        placeholders[name] = placeholder[keep]
+
+    return aligned, placeholders
+
+
+def _explain_single_symbol(
+    signals: dict[str, pd.DataFrame],
+    placeholders: dict[str, pd.Series],
+    symbol: str,
+) -> pd.DataFrame:
+    """Explain signal conditions for a single symbol.
+
+    Args:
+        signals: Dict of signal name to DataFrame, from _align_signals
+        placeholders: Per-signal column used when the symbol is missing
+        symbol: Stock symbol to analyze
+
     Returns:
         DataFrame with signal timeline for the symbol
     """
@@ -91,9 +149,7 @@ def _explain_single_symbol(
             timeline_data[signal_name] = signal_df[symbol]
         else:
             # Symbol not in this signal, fill with NaN
-            timeline_data[signal_name] = pd.Series(
-                [pd.NA] * len(signal_df), index=signal_df.index, name=signal_name
-            )
+            timeline_data[signal_name] = placeholders[signal_name]
 
     if not timeline_data:
         # No data found for symbol
@@ -102,17 +158,6 @@ def _explain_single_symbol(
     # Combine into single DataFrame
     result = pd.DataFrame(timeline_data)
 
-    # Apply date filters
-    if start_date is not None:
-        if isinstance(start_date, str):
-            start_date = pd.to_datetime(start_date)
-        result = result[result.index >= start_date]
-
-    if end_date is not None:
-        if isinstance(end_date, str):
-            end_date = pd.to_datetime(end_date)
-        result = result[result.index <= end_date]
-
     # Add summary column showing if all signals are True
     if len(result.columns) > 0 and result.columns[0] != "message":
         # For boolean signals, show combined status
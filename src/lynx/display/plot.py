@@ -10,6 +10,29 @@ if TYPE_CHECKING:
     from lynx.run import Run
 
 
+def _equity_series(trades: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Build the x/y arrays of an equity curve from a non-empty trades frame.
+
+    Equity starts at 1.0 on the first entry date and compounds each trade's
+    return at its exit date, in entry-date order.
+
+    Returns:
+        Tuple of (dates as datetime64[ns], equity values as float64)
+    """
+    sorted_trades = trades.sort_values("entry_date")
+    returns = sorted_trades["return"].to_numpy(dtype=np.float64)
+
+    equity = np.empty(len(returns) + 1, dtype=np.float64)
+    equity[0] = 1.0
+    np.cumprod(1.0 + returns, out=equity[1:])
+
+    dates = np.empty(len(returns) + 1, dtype="datetime64[ns]")
+    dates[0] = pd.to_datetime(sorted_trades["entry_date"]).min()
+    dates[1:] = pd.to_datetime(sorted_trades["exit_date"]).to_numpy("datetime64[ns]")
+
+    return dates, equity
+
+
 def create_equity_curve(
     trades: pd.DataFrame,
     strategy_name: str = "Strategy",
@@ -44,34 +67,21 @@ def create_equity_curve(
         )
         return fig
 
-    # Sort trades by entry date
-    sorted_trades = trades.sort_values("entry_date").reset_index(drop=True)
-
-    # Calculate cumulative equity
-    returns = sorted_trades["return"].values
-    equity = np.cumprod(1 + returns)
-
-    # Create dates for x-axis (use exit dates for when equity changes)
-    dates = [sorted_trades["entry_date"].min()]  # Start date
-    dates.extend(sorted_trades["exit_date"].tolist())
-
-    # Equity values (start at 1.0)
-    equity_values = [1.0]
-    equity_values.extend(equity.tolist())
-
-    # Create figure
-    fig = go.Figure()
-
-    # Add equity curve
-    fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=equity_values,
-            mode="lines",
-            name=strategy_name,
-            line={"color": "#2E86DE", "width": 2},
-            hovertemplate="Date: %{x|%Y-%m-%d}<br>Equity: %{y:.4f}<extra></extra>",
-        )
+    # Cumulative equity at each exit date, starting at 1.0 on the first entry
+    dates, equity_values = _equity_series(trades)
+
+    # Create figure (WebGL trace so long curves stay responsive)
+    fig = go.Figure(
+        data=[
+            go.Scattergl(
+                x=dates,
+                y=equity_values,
+                mode="lines",
+                name=strategy_name,
+                line={"color": "#2E86DE", "width": 2},
+                hovertemplate="Date: %{x|%Y-%m-%d}<br>Equity: %{y:.4f}<extra></extra>",
+            )
+        ]
     )
 
     # Add starting capital reference line
@@ -93,6 +103,7 @@ def create_equity_curve(
         hovermode="x unified",
         template="plotly_white",
         showlegend=True,
+        uirevision="equity",  # keep zoom/pan state across redraws
     )
 
     # Format y-axis as decimal
@@ -116,58 +127,28 @@ def compare_equity_curves(
     Returns:
         Plotly Figure object with overlaid curves
     """
-    # Get trades from both runs
-    trades1 = run1.get_trades()
-    trades2 = run2.get_trades()
-
-    # Create figure
-    fig = go.Figure()
-
-    # Add first equity curve
-    if not trades1.empty:
-        sorted_trades1 = trades1.sort_values("entry_date").reset_index(drop=True)
-        returns1 = sorted_trades1["return"].values
-        equity1 = np.cumprod(1 + returns1)
-
-        dates1 = [sorted_trades1["entry_date"].min()]
-        dates1.extend(sorted_trades1["exit_date"].tolist())
-
-        equity_values1 = [1.0]
-        equity_values1.extend(equity1.tolist())
-
-        fig.add_trace(
-            go.Scatter(
-                x=dates1,
-                y=equity_values1,
+    # Get trades from both runs (read-only, so no defensive copies)
+    trades1 = run1._read_trades()
+    trades2 = run2._read_trades()
+
+    # Build one WebGL trace per run with trades, then the figure in one go
+    traces = []
+    for run, trades, color in ((run1, trades1, "#2E86DE"), (run2, trades2, "#FF6B6B")):
+        if trades.empty:
+            continue
+        dates, equity_values = _equity_series(trades)
+        traces.append(
+            go.Scattergl(
+                x=dates,
+                y=equity_values,
                 mode="lines",
-                name=run1.strategy_name,
-                line={"color": "#2E86DE", "width": 2},
-                hovertemplate=f"{run1.strategy_name}<br>Date: %{{x|%Y-%m-%d}}<br>Equity: %{{y:.4f}}<extra></extra>",
+                name=run.strategy_name,
+                line={"color": color, "width": 2},
+                hovertemplate=f"{run.strategy_name}<br>Date: %{{x|%Y-%m-%d}}<br>Equity: %{{y:.4f}}<extra></extra>",
             )
         )
 
-    # Add second equity curve
-    if not trades2.empty:
-        sorted_trades2 = trades2.sort_values("entry_date").reset_index(drop=True)
-        returns2 = sorted_trades2["return"].values
-        equity2 = np.cumprod(1 + returns2)
-
-        dates2 = [sorted_trades2["entry_date"].min()]
-        dates2.extend(sorted_trades2["exit_date"].tolist())
-
-        equity_values2 = [1.0]
-        equity_values2.extend(equity2.tolist())
-
-        fig.add_trace(
-            go.Scatter(
-                x=dates2,
-                y=equity_values2,
-                mode="lines",
-                name=run2.strategy_name,
-                line={"color": "#FF6B6B", "width": 2},
-                hovertemplate=f"{run2.strategy_name}<br>Date: %{{x|%Y-%m-%d}}<br>Equity: %{{y:.4f}}<extra></extra>",
-            )
-        )
+    fig = go.Figure(data=traces)
 
     # Add starting capital reference line
     fig.add_hline(
@@ -188,6 +169,7 @@ def compare_equity_curves(
         hovermode="x unified",
         template="plotly_white",
         showlegend=True,
+        uirevision="equity",  # keep zoom/pan state across redraws
     )
 
     # Format y-axis as decimal
@@ -8,84 +8,63 @@ if TYPE_CHECKING:
     from lynx.run import Run
 
 
+# (display name, metrics key, default) for each row of the stats table
+_STATS_ROWS = [
+    ("Total Return", "total_return", 0.0),
+    ("Annualized Return", "annualized_return", 0.0),
+    ("Sharpe Ratio", "sharpe_ratio", 0.0),
+    ("Max Drawdown", "max_drawdown", 0.0),
+    ("Win Rate", "win_rate", 0.0),
+    ("Profit Factor", "profit_factor", 0.0),
+    ("Number of Trades", "num_trades", 0),
+    ("Avg Trade Duration (days)", "avg_trade_duration_days", 0.0),
+]
+
+
 def format_stats(metrics: dict):
     """Format metrics as a styled pandas DataFrame for Jupyter display.
 
+    Values are formatted straight from the metrics dict into a single
+    DataFrame; the Styler only records the colouring, which pandas applies
+    when the table is rendered.
+
     Args:
         metrics: Dictionary of metric name -> value pairs
 
     Returns:
         Styled pandas DataFrame (Styler object)
     """
-    # Create DataFrame with metric names and values
-    df = pd.DataFrame([
-        {"Metric": "Total Return", "Value": metrics.get("total_return", 0.0)},
-        {"Metric": "Annualized Return", "Value": metrics.get("annualized_return", 0.0)},
-        {"Metric": "Sharpe Ratio", "Value": metrics.get("sharpe_ratio", 0.0)},
-        {"Metric": "Max Drawdown", "Value": metrics.get("max_drawdown", 0.0)},
-        {"Metric": "Win Rate", "Value": metrics.get("win_rate", 0.0)},
-        {"Metric": "Profit Factor", "Value": metrics.get("profit_factor", 0.0)},
-        {"Metric": "Number of Trades", "Value": metrics.get("num_trades", 0)},
-        {"Metric": "Avg Trade Duration (days)", "Value": metrics.get("avg_trade_duration_days", 0.0)},
-    ])
-
-    # Set Metric as index
-    df = df.set_index("Metric")
-
-    # Apply formatting
-    styler = df.style.format({
-        "Value": lambda x: _format_metric_value(x, df.loc[df["Value"] == x].index[0] if x in df["Value"].values else "")
-    })
-
-    # Custom formatting based on metric type
-    def format_value(val, metric_name):
-        """Format value based on metric type."""
-        if metric_name in ["Total Return", "Annualized Return", "Max Drawdown", "Win Rate"]:
-            return f"{val:.2%}"
-        elif metric_name == "Profit Factor":
-            if val == float("inf"):
-                return "∞"
-            return f"{val:.2f}"
-        elif metric_name == "Sharpe Ratio":
-            return f"{val:.2f}"
-        elif metric_name == "Number of Trades":
-            return f"{int(val)}"
-        else:
-            return f"{val:.2f}"
-
-    # Create formatted strings
-    formatted_data = []
-    for idx, row in df.iterrows():
-        formatted_data.append({
-            "Metric": idx,
-            "Value": format_value(row["Value"], idx)
-        })
-
-    df_formatted = pd.DataFrame(formatted_data).set_index("Metric")
+    df_formatted = pd.DataFrame(
+        {
+            "Value": [
+                _format_metric_value(metrics.get(key, default), name)
+                for name, key, default in _STATS_ROWS
+            ]
+        },
+        index=pd.Index([name for name, _, _ in _STATS_ROWS], name="Metric"),
+    )
 
-    # Apply styling with colors
-    def color_negative_red(val):
-        """Color negative values red, positive green."""
-        try:
-            # Extract numeric value from formatted string
-            if "%" in val:
-                num_val = float(val.replace("%", ""))
-            elif val == "∞":
-                return "color: green"
-            else:
-                num_val = float(val)
+    return df_formatted.style.map(_color_by_sign, subset=["Value"])
 
-            if num_val < 0:
-                return "color: red"
-            elif num_val > 0:
-                return "color: green"
-        except (ValueError, AttributeError):
-            pass
-        return ""
 
-    styler = df_formatted.style.map(color_negative_red, subset=["Value"])
+def _color_by_sign(val):
+    """Color negative values red, positive green."""
+    try:
+        # Extract numeric value from formatted string
+        if "%" in val:
+            num_val = float(val.replace("%", ""))
+        elif val == "∞":
+            return "color: green"
+        else:
+            num_val = float(val)
 
-    return styler
+        if num_val < 0:
+            return "color: red"
+        elif num_val > 0:
+            return "color: green"
+    except (ValueError, AttributeError):
+        pass
+    return ""
 
 
 def _format_metric_value(value, metric_name):
@@ -117,78 +96,20 @@ def compare_stats(run1: "Run", run2: "Run"):
     metrics1 = run1.metrics
     metrics2 = run2.metrics
 
-    # Create comparison DataFrame
-    df = pd.DataFrame([
-        {
-            "Metric": "Total Return",
-            run1.strategy_name: metrics1.get("total_return", 0.0),
-            run2.strategy_name: metrics2.get("total_return", 0.0),
-        },
-        {
-            "Metric": "Annualized Return",
-            run1.strategy_name: metrics1.get("annualized_return", 0.0),
-            run2.strategy_name: metrics2.get("annualized_return", 0.0),
-        },
-        {
-            "Metric": "Sharpe Ratio",
-            run1.strategy_name: metrics1.get("sharpe_ratio", 0.0),
-            run2.strategy_name: metrics2.get("sharpe_ratio", 0.0),
-        },
-        {
-            "Metric": "Max Drawdown",
-            run1.strategy_name: metrics1.get("max_drawdown", 0.0),
-            run2.strategy_name: metrics2.get("max_drawdown", 0.0),
-        },
+    # Format values straight from both metrics dicts into one DataFrame
+    df_formatted = pd.DataFrame(
         {
-            "Metric": "Win Rate",
-            run1.strategy_name: metrics1.get("win_rate", 0.0),
-            run2.strategy_name: metrics2.get("win_rate", 0.0),
+            run1.strategy_name: [
+                _format_metric_value(metrics1.get(key, default), name)
+                for name, key, default in _STATS_ROWS
+            ],
+            run2.strategy_name: [
+                _format_metric_value(metrics2.get(key, default), name)
+                for name, key, default in _STATS_ROWS
+            ],
         },
-        {
-            "Metric": "Profit Factor",
-            run1.strategy_name: metrics1.get("profit_factor", 0.0),
-            run2.strategy_name: metrics2.get("profit_factor", 0.0),
-        },
-        {
-            "Metric": "Number of Trades",
-            run1.strategy_name: metrics1.get("num_trades", 0),
-            run2.strategy_name: metrics2.get("num_trades", 0),
-        },
-        {
-            "Metric": "Avg Trade Duration (days)",
-            run1.strategy_name: metrics1.get("avg_trade_duration_days", 0.0),
-            run2.strategy_name: metrics2.get("avg_trade_duration_days", 0.0),
-        },
-    ])
-
-    df = df.set_index("Metric")
-
-    # Format values based on metric type
-    def format_comparison_value(val, metric_name):
-        """Format value based on metric type."""
-        if metric_name in ["Total Return", "Annualized Return", "Max Drawdown", "Win Rate"]:
-            return f"{val:.2%}"
-        elif metric_name == "Profit Factor":
-            if val == float("inf"):
-                return "∞"
-            return f"{val:.2f}"
-        elif metric_name == "Sharpe Ratio":
-            return f"{val:.2f}"
-        elif metric_name == "Number of Trades":
-            return f"{int(val)}"
-        else:
-            return f"{val:.2f}"
-
-    # Create formatted DataFrame
-    formatted_data = []
-    for idx, row in df.iterrows():
-        formatted_data.append({
-            "Metric": idx,
-            run1.strategy_name: format_comparison_value(row[run1.strategy_name], idx),
-            run2.strategy_name: format_comparison_value(row[run2.strategy_name], idx),
-        })
-
-    df_formatted = pd.DataFrame(formatted_data).set_index("Metric")
+        index=pd.Index([name for name, _, _ in _STATS_ROWS], name="Metric"),
+    )
 
     # Highlight better values
     def highlight_better(row):
@@ -4,6 +4,95 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+# Metric kernels over plain arrays. The public functions below extract the
+# arrays they need from a trades DataFrame; calculate_all extracts them once
+# and shares them between every metric.
+
+
+def _returns(trades: pd.DataFrame) -> np.ndarray:
+    return trades["return"].to_numpy(dtype=np.float64)
+
+
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _timestamps(trades: pd.DataFrame, column: str) -> np.ndarray:
+    """A date column as a datetime64 array (in UTC for tz-aware columns)."""
+    dates = trades[column]
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_convert(None)
+    return dates.to_numpy()
+
+
+def _durations(entry: np.ndarray, exit: np.ndarray) -> np.ndarray:
+    """Whole days from entry to exit per trade, NaN where a date is missing."""
+    delta = (exit - entry).astype("m8[ns]")
+    days = (delta.view(np.int64) // _NS_PER_DAY).astype(np.float64)
+    days[np.isnat(delta)] = np.nan
+    return days
+
+
+def _mean_duration(durations: np.ndarray) -> float:
+    known = durations[~np.isnan(durations)]
+    return float(known.mean()) if len(known) else float("nan")
+
+
+def _entry_order_returns(entry: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    return returns[np.argsort(entry)]
+
+
+def _total_return(returns: np.ndarray) -> float:
+    return float(np.prod(1 + returns) - 1)
+
+
+def _annualized_return(entry: np.ndarray, exit: np.ndarray, total: float) -> float:
+    entry = entry[~np.isnat(entry)]
+    exit = exit[~np.isnat(exit)]
+    if len(entry) == 0 or len(exit) == 0:
+        return 0.0
+    span = (exit.max() - entry.min()).astype("m8[ns]")
+    days = int(span.view(np.int64)) // _NS_PER_DAY
+    if days <= 0:
+        return 0.0
+    years = days / 365.0
+    return float((1 + total) ** (1 / years) - 1) if years > 0 else 0.0
+
+
+def _sharpe_ratio(returns: np.ndarray, avg_duration: float, risk_free_rate: float) -> float:
+    # Skip missing returns, as pandas' mean/std did
+    returns = returns[~np.isnan(returns)]
+    if len(returns) < 2:
+        return 0.0
+    excess_returns = returns - risk_free_rate / 252  # Daily risk-free rate
+    std_return = excess_returns.std(ddof=1)
+    if std_return == 0:
+        return 0.0
+    # Annualize: multiply by sqrt(252) for daily returns
+    # But our returns are per-trade, so adjust based on avg trade duration
+    trades_per_year = 252 / avg_duration if avg_duration > 0 else 252
+    return float(excess_returns.mean() / std_return * np.sqrt(trades_per_year))
+
+
+def _equity_curve(ordered_returns: np.ndarray) -> np.ndarray:
+    return np.cumprod(1 + ordered_returns)
+
+
+def _max_drawdown(equity: np.ndarray) -> float:
+    peak = np.maximum.accumulate(equity)
+    drawdown = np.subtract(equity, peak)
+    return float(np.divide(drawdown, peak, out=drawdown).min())
+
+
+def _win_rate_and_profit_factor(returns: np.ndarray) -> tuple[float, float]:
+    """Both metrics from a single winning-trade mask."""
+    wins = returns > 0
+    gross_profit = returns[wins].sum()
+    gross_loss = abs(returns[returns < 0].sum())
+    win_rate = float(np.count_nonzero(wins) / len(returns))
+    if gross_loss == 0:
+        return win_rate, float("inf") if gross_profit > 0 else 0.0
+    return win_rate, float(gross_profit / gross_loss)
+
 
 def total_return(trades: pd.DataFrame) -> float:
     """Calculate total cumulative return.
@@ -18,9 +107,7 @@ def total_return(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    returns = trades["return"].values
-    cumulative = np.prod(1 + returns) - 1
-    return float(cumulative)
+    return _total_return(_returns(trades))
 
 
 def annualized_return(trades: pd.DataFrame) -> float:
@@ -37,14 +124,11 @@ def annualized_return(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    total = total_return(trades)
-    first_entry = trades["entry_date"].min()
-    last_exit = trades["exit_date"].max()
-    days = (last_exit - first_entry).days
-    if days <= 0:
-        return 0.0
-    years = days / 365.0
-    return float((1 + total) ** (1 / years) - 1) if years > 0 else 0.0
+    return _annualized_return(
+        _timestamps(trades, "entry_date"),
+        _timestamps(trades, "exit_date"),
+        _total_return(_returns(trades)),
+    )
 
 
 def sharpe_ratio(trades: pd.DataFrame, risk_free_rate: float = 0.0) -> float:
@@ -61,17 +145,8 @@ def sharpe_ratio(trades: pd.DataFrame, risk_free_rate: float = 0.0) -> float:
     """
     if trades.empty or len(trades) < 2:
         return 0.0
-    returns = trades["return"]
-    excess_returns = returns - risk_free_rate / 252  # Daily risk-free rate
-    mean_return = excess_returns.mean()
-    std_return = excess_returns.std()
-    if std_return == 0:
-        return 0.0
-    # Annualize: multiply by sqrt(252) for daily returns
-    # But our returns are per-trade, so adjust based on avg trade duration
-    avg_duration = avg_trade_duration(trades)
-    trades_per_year = 252 / avg_duration if avg_duration > 0 else 252
-    return float(mean_return / std_return * np.sqrt(trades_per_year))
+    durations = _durations(_timestamps(trades, "entry_date"), _timestamps(trades, "exit_date"))
+    return _sharpe_ratio(_returns(trades), _mean_duration(durations), risk_free_rate)
 
 
 def max_drawdown(trades: pd.DataFrame) -> float:
@@ -87,13 +162,9 @@ def max_drawdown(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    # Sort by entry date and calculate cumulative returns
-    sorted_trades = trades.sort_values("entry_date")
-    returns = sorted_trades["return"].values
-    cumulative = np.cumprod(1 + returns)
-    peak = np.maximum.accumulate(cumulative)
-    drawdown = (cumulative - peak) / peak
-    return float(drawdown.min())
+    # Compound returns in entry-date order
+    ordered = _entry_order_returns(_timestamps(trades, "entry_date"), _returns(trades))
+    return _max_drawdown(_equity_curve(ordered))
 
 
 def win_rate(trades: pd.DataFrame) -> float:
@@ -107,8 +178,7 @@ def win_rate(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    wins = (trades["return"] > 0).sum()
-    return float(wins / len(trades))
+    return _win_rate_and_profit_factor(_returns(trades))[0]
 
 
 def profit_factor(trades: pd.DataFrame) -> float:
@@ -124,11 +194,7 @@ def profit_factor(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    gross_profit = trades.loc[trades["return"] > 0, "return"].sum()
-    gross_loss = abs(trades.loc[trades["return"] < 0, "return"].sum())
-    if gross_loss == 0:
-        return float("inf") if gross_profit > 0 else 0.0
-    return float(gross_profit / gross_loss)
+    return _win_rate_and_profit_factor(_returns(trades))[1]
 
 
 def num_trades(trades: pd.DataFrame) -> int:
@@ -154,13 +220,29 @@ def avg_trade_duration(trades: pd.DataFrame) -> float:
     """
     if trades.empty:
         return 0.0
-    durations = (trades["exit_date"] - trades["entry_date"]).dt.days
-    return float(durations.mean())
+    durations = _durations(_timestamps(trades, "entry_date"), _timestamps(trades, "exit_date"))
+    return _mean_duration(durations)
+
+
+# Metrics for a run without trades; calculate_all returns a copy
+_EMPTY_METRICS: dict[str, Any] = {
+    "total_return": 0.0,
+    "annualized_return": 0.0,
+    "sharpe_ratio": 0.0,
+    "max_drawdown": 0.0,
+    "win_rate": 0.0,
+    "profit_factor": 0.0,
+    "num_trades": 0,
+    "avg_trade_duration_days": 0.0,
+}
 
 
 def calculate_all(trades: pd.DataFrame) -> dict[str, Any]:
     """Calculate all metrics for a trades DataFrame.
 
+    Columns are extracted once and shared between the metric kernels, rather
+    than each metric re-reading (and re-sorting) the DataFrame.
+
     Args:
         trades: DataFrame with columns: 'return', 'entry_date', 'exit_date'
 
@@ -168,13 +250,25 @@ def calculate_all(trades: pd.DataFrame) -> dict[str, Any]:
         dict with keys: total_return, annualized_return, sharpe_ratio,
         max_drawdown, win_rate, profit_factor, num_trades, avg_trade_duration_days
     """
+    if trades.empty:
+        return dict(_EMPTY_METRICS)
+
+    returns = _returns(trades)
+    entry = _timestamps(trades, "entry_date")
+    exit = _timestamps(trades, "exit_date")
+    avg_duration = _mean_duration(_durations(entry, exit))
+    # One equity curve in entry-date order serves both the total return
+    # (its final value) and the drawdown.
+    equity = _equity_curve(_entry_order_returns(entry, returns))
+    total = float(equity[-1] - 1)
+    win_stats = _win_rate_and_profit_factor(returns)
     return {
-        "total_return": total_return(trades),
-        "annualized_return": annualized_return(trades),
-        "sharpe_ratio": sharpe_ratio(trades),
-        "max_drawdown": max_drawdown(trades),
-        "win_rate": win_rate(trades),
-        "profit_factor": profit_factor(trades),
-        "num_trades": num_trades(trades),
-        "avg_trade_duration_days": avg_trade_duration(trades),
+        "total_return": total,
+        "annualized_return": _annualized_return(entry, exit, total),
+        "sharpe_ratio": _sharpe_ratio(returns, avg_duration, 0.0),
+        "max_drawdown": _max_drawdown(equity),
+        "win_rate": win_stats[0],
+        "profit_factor": win_stats[1],
+        "num_trades": len(trades),
+        "avg_trade_duration_days": avg_duration,
     }
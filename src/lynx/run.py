@@ -55,10 +55,36 @@ def _generate_run_id(strategy_name: str) -> str:
     Returns:
         Unique run ID string
     """
-    now = datetime.now()
-    timestamp = now.strftime("%Y%m%d_%H%M%S")
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"{strategy_name}_{timestamp}_{random_suffix}"
+    return _generate_run_ids([strategy_name])[0]
+
+
+def _generate_run_ids(strategy_names: list[str]) -> list[str]:
+    """Generate run IDs for a batch of runs saved together.
+
+    The IDs share one timestamp, and a random suffix is redrawn if it would
+    repeat an ID earlier in the batch, so runs of the same strategy saved in
+    the same second cannot collide with each other.
+
+    Args:
+        strategy_names: Strategy name of each run
+
+    Returns:
+        One unique run ID per strategy name, in order
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_ids: list[str] = []
+    seen: set[str] = set()
+    for strategy_name in strategy_names:
+        run_id = f"{strategy_name}_{timestamp}_{_random_suffix()}"
+        while run_id in seen:
+            run_id = f"{strategy_name}_{timestamp}_{_random_suffix()}"
+        seen.add(run_id)
+        run_ids.append(run_id)
+    return run_ids
+
+
+def _random_suffix() -> str:
+    return "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
 
 
 class Run:
@@ -97,7 +123,9 @@ class Run:
         self._notes = notes
         self._trades_df: pd.DataFrame | None = None
         self._artifacts: dict[str, tuple[str, pd.DataFrame]] = {}  # name -> (type, df)
+        self._unloaded: dict[str, tuple[str, str]] = {}  # name -> (type, file path)
         self._metrics: dict[str, Any] = {}
+        self._metrics_cache: dict[str, Any] | None = None  # for the current trades
         self._saved = False
 
     @property
@@ -145,6 +173,8 @@ class Run:
         """
         _validate_trades(df)
         self._trades_df = df.copy()
+        self._unloaded.pop("trades", None)
+        self._metrics_cache = None
         return self
 
     def signal(self, name: str, df: pd.DataFrame) -> "Run":
@@ -158,6 +188,7 @@ class Run:
             self (for method chaining)
         """
         self._artifacts[name] = ("signal", df.copy())
+        self._unloaded.pop(name, None)
         return self
 
     def data(self, name: str, df: pd.DataFrame) -> "Run":
@@ -171,74 +202,129 @@ class Run:
             self (for method chaining)
         """
         self._artifacts[name] = ("data", df.copy())
+        self._unloaded.pop(name, None)
         return self
 
-    def save(self) -> "Run":
+    def save(self, *, compute_metrics: bool = True) -> "Run":
         """Persist the run to storage.
 
+        Args:
+            compute_metrics: Calculate performance metrics from trades. Pass
+                False to skip the calculation and store empty metrics.
+
         Returns:
             self (for method chaining)
 
         Raises:
             ValidationError: If trades not set
         """
-        if self._trades_df is None:
-            raise ValidationError("trades must be set before saving")
-
-        # Update timestamp on every save
-        self._updated_at = datetime.now()
-
-        # Generate run ID if not already set
-        if self._id is None:
-            self._id = _generate_run_id(self._strategy_name)
-
-        # Save to database
-        self._save_to_db()
-        self._saved = True
+        return self._save(compute_metrics=compute_metrics)
 
+    def _save(self, *, compute_metrics: bool = True) -> "Run":
+        """Persist the run and its artifacts in one transaction."""
+        Run._save_many([self], compute_metrics=compute_metrics)
         return self
 
-    def _save_to_db(self) -> None:
-        """Save run and artifacts to SQLite and Parquet storage."""
-        from lynx.metrics import calculate_all
+    @staticmethod
+    def _save_many(runs: list["Run"], *, compute_metrics: bool = True) -> None:
+        """Persist several runs with a single SQLite transaction.
+
+        Run rows are inserted first, so a run that already exists fails on
+        its id before any of its stored Parquet files are overwritten. The
+        artifacts are then written and their rows inserted, and everything is
+        committed once. If anything fails no rows are kept, the Parquet files
+        written by this call are removed, and new runs get their id back to
+        None. Files this call did not write are never touched, so a failed
+        save cannot damage a stored run that shares the id.
+        """
         from lynx.storage import parquet, sqlite
 
-        # Calculate metrics from trades
-        self._metrics = calculate_all(self._trades_df)  # type: ignore
-
-        # Insert run record into SQLite
-        sqlite.insert_run(
-            run_id=self._id,  # type: ignore
-            strategy_name=self._strategy_name,
-            created_at=self._created_at,
-            updated_at=self._updated_at,
-            metrics=self._metrics,
-            params=self._params if self._params else None,
-            tags=self._tags if self._tags else None,
-            notes=self._notes,
-        )
-
-        # Save trades artifact
-        file_path = parquet.save_artifact(self._id, "trades", self._trades_df)  # type: ignore
-        sqlite.insert_artifact(
-            run_id=self._id,  # type: ignore
-            name="trades",
-            artifact_type="trades",
-            file_path=file_path,
-            rows=len(self._trades_df),  # type: ignore
-            columns=list(self._trades_df.columns),  # type: ignore
-        )
+        for run in runs:
+            run._load_artifacts()
+            if run._trades_df is None:
+                raise ValidationError("trades must be set before saving")
+
+        new_runs = [run for run in runs if run._id is None]
+        run_ids = _generate_run_ids([run._strategy_name for run in new_runs])
+        for run, run_id in zip(new_runs, run_ids, strict=True):
+            run._id = run_id
+
+        artifact_records: list[dict[str, Any]] = []
+        try:
+            run_records = [run._run_record(compute_metrics=compute_metrics) for run in runs]
+            with sqlite.transaction() as conn:
+                sqlite.insert_runs_bulk(run_records, conn=conn)
+                for run in runs:
+                    run._write_artifacts(artifact_records)
+                sqlite.insert_artifacts_bulk(artifact_records, conn=conn)
+        except Exception:
+            for record in artifact_records:
+                parquet.delete_artifact(record["file_path"])
+            for run in new_runs:
+                run._id = None
+            raise
+
+        for run in runs:
+            run._saved = True
+
+    def _load_artifacts(self) -> None:
+        """Read the stored artifacts that lynx.load() deferred into memory."""
+        if not self._unloaded:
+            return
+
+        from lynx.storage import parquet
+
+        for name, (artifact_type, file_path) in self._unloaded.items():
+            df = parquet.load_artifact(file_path)
+            if name == "trades":
+                self._trades_df = df
+            else:
+                self._artifacts[name] = (artifact_type, df)
+        self._unloaded = {}
+
+    def _run_record(self, *, compute_metrics: bool = True) -> dict[str, Any]:
+        """Build the run's database record, refreshing metrics and updated_at."""
+        # Update timestamp on every save
+        self._updated_at = datetime.now()
 
-        # Save other artifacts
-        for name, (artifact_type, df) in self._artifacts.items():
+        # Calculate metrics from trades
+        self._metrics = dict(self._calculate_metrics()) if compute_metrics else {}
+
+        return {
+            "run_id": self._id,
+            "strategy_name": self._strategy_name,
+            "created_at": self._created_at,
+            "updated_at": self._updated_at,
+            "metrics": self._metrics,
+            "params": self._params if self._params else None,
+            "tags": self._tags if self._tags else None,
+            "notes": self._notes,
+        }
+
+    def _write_artifacts(self, artifact_records: list[dict[str, Any]]) -> None:
+        """Write Parquet artifacts, appending each one's database record.
+
+        A record is appended as soon as its file is written, so on failure
+        ``artifact_records`` lists exactly the files written so far.
+        """
+        from lynx.storage import parquet
+
+        # Trades first, then the other artifacts
+        artifacts = [("trades", "trades", self._trades_df)]
+        artifacts += [
+            (name, artifact_type, df) for name, (artifact_type, df) in self._artifacts.items()
+        ]
+        for name, artifact_type, df in artifacts:
             file_path = parquet.save_artifact(self._id, name, df)  # type: ignore
-            sqlite.insert_artifact(
-                run_id=self._id,  # type: ignore
-                name=name,
-                artifact_type=artifact_type,
-                file_path=file_path,
-                rows=len(df),
-                columns=list(df.columns),
+            artifact_records.append(
+                {
+                    "run_id": self._id,
+                    "name": name,
+                    "artifact_type": artifact_type,
+                    "file_path": file_path,
+                    "rows": len(df),  # type: ignore
+                    "columns": list(df.columns),  # type: ignore
+                }
             )
 
     def get_trades(self) -> pd.DataFrame:
@@ -263,6 +349,14 @@ class Run:
 
         return parquet.load_artifact(trades_artifact["file_path"])
 
+    def _read_trades(self) -> pd.DataFrame:
+        """Get trades for read-only internal use, skipping get_trades()'s copy."""
+        if not self._saved:
+            if self._trades_df is None:
+                raise ValidationError("trades not set")
+            return self._trades_df
+        return self.get_trades()
+
     def get_signal(self, name: str) -> pd.DataFrame:
         """Get a signal DataFrame by name.
 
@@ -354,14 +448,25 @@ class Run:
 
         # If not saved yet, calculate metrics on the fly
         if not self._saved and self._trades_df is not None:
-            from lynx.metrics import calculate_all
-
-            metrics = calculate_all(self._trades_df)
+            metrics = self._calculate_metrics()
         else:
             metrics = self._metrics
 
         return format_stats(metrics)
 
+    def _calculate_metrics(self) -> dict[str, Any]:
+        """Calculate metrics from trades, reusing the result until trades change.
+
+        The trades DataFrame is a private copy replaced only by trades(), so
+        the cached result cannot go stale. Treat the returned dict as
+        read-only.
+        """
+        if self._metrics_cache is None:
+            from lynx.metrics import calculate_all
+
+            self._metrics_cache = calculate_all(self._trades_df)  # type: ignore
+        return self._metrics_cache
+
     def plot(self, figsize: tuple[int, int] = (10, 6)) -> "go.Figure":
         """Display interactive equity curve in Jupyter.
 
@@ -374,8 +479,7 @@ class Run:
 
         from lynx.display.plot import create_equity_curve
 
-        trades = self.get_trades()
-        return create_equity_curve(trades, self.strategy_name, figsize)
+        return create_equity_curve(self._read_trades(), self.strategy_name, figsize)
 
     def compare(self, other: "Run"):
         """Compare this run with another run.
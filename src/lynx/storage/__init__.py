@@ -1,6 +1,13 @@
 """Storage layer for lynx."""
 
 from .parquet import delete_artifacts, load_artifact, save_artifact
-from .sqlite import get_connection, init_db
+from .sqlite import get_connection, init_db, transaction
 
-__all__ = ["init_db", "get_connection", "save_artifact", "load_artifact", "delete_artifacts"]
+__all__ = [
+    "init_db",
+    "get_connection",
+    "transaction",
+    "save_artifact",
+    "load_artifact",
+    "delete_artifacts",
+]
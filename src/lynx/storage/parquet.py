@@ -4,6 +4,8 @@ import shutil
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def get_artifacts_dir() -> Path:
@@ -18,18 +20,48 @@ def save_artifact(run_id: str, name: str, df: pd.DataFrame) -> str:
     artifact_dir = get_artifacts_dir() / run_id
     artifact_dir.mkdir(parents=True, exist_ok=True)
     file_path = artifact_dir / f"{name}.parquet"
-    df.to_parquet(file_path, index=True)
-    from lynx.config import get_data_dir
+    from lynx.config import get_data_dir, get_parquet_compression
+
+    # Same file as df.to_parquet(index=True), without pandas' engine dispatch
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    pq.write_table(table, file_path, compression=get_parquet_compression())
 
     return str(file_path.relative_to(get_data_dir()))
 
 
-def load_artifact(file_path: str) -> pd.DataFrame:
-    """Load a DataFrame from Parquet."""
+def load_artifact(file_path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load a DataFrame from Parquet.
+
+    Args:
+        file_path: Path relative to the data directory
+        columns: Read only these columns (the index is always read); names
+            not in the file are skipped. None reads every column.
+    """
+    from lynx.config import get_data_dir
+
+    full_path = get_data_dir() / file_path
+    if columns is not None:
+        available = set(pq.read_schema(full_path).names)
+        columns = [column for column in columns if column in available]
+    table = pq.read_table(full_path, columns=columns, use_pandas_metadata=True)
+    return table.to_pandas()
+
+
+def delete_artifact(file_path: str) -> None:
+    """Delete one artifact file, and its run directory once that is empty.
+
+    Args:
+        file_path: Path relative to the data directory, as returned by
+            save_artifact()
+    """
     from lynx.config import get_data_dir
 
     full_path = get_data_dir() / file_path
-    return pd.read_parquet(full_path)
+    full_path.unlink(missing_ok=True)
+    try:
+        full_path.parent.rmdir()
+    except OSError:
+        pass  # Other artifacts remain in the directory
 
 
 def delete_artifacts(run_id: str) -> None:
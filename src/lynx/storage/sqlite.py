@@ -1,11 +1,39 @@
 """SQLite storage for run metadata."""
 
 import json
+import os
 import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Per-connection pragmas. In WAL mode synchronous=NORMAL only fsyncs at
+# checkpoints, so a commit costs no fsync while staying safe against crashes.
+_DEFAULT_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+)
+
+# Durability-relaxing pragmas applied when LYNX_TEST=1. Test databases are
+# thrown away after each test, so skipping fsync entirely is safe there.
+_TEST_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+# Compact JSON for the params/metrics/tags/columns TEXT columns. A prebuilt
+# encoder, since json.dumps builds a new one whenever it is given options.
+_json_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _is_testing() -> bool:
+    """Check whether the LYNX_TEST environment flag is set."""
+    return os.environ.get("LYNX_TEST") == "1"
+
 
 def get_db_path() -> Path:
     """Get the path to the SQLite database."""
@@ -21,6 +49,9 @@ def _migrate_add_updated_at(conn: sqlite3.Connection) -> None:
     1. Adds the updated_at column
     2. Backfills existing rows with created_at value
     3. Creates indexes for efficient sorting/filtering
+
+    The sort indexes end in id because list_runs breaks ties on it; without
+    that column SQLite sorts the tied rows in a temporary B-tree.
     """
     # Check if column already exists
     cursor = conn.execute("PRAGMA table_info(runs)")
@@ -34,10 +65,14 @@ def _migrate_add_updated_at(conn: sqlite3.Connection) -> None:
         conn.commit()
 
     # Create indexes (IF NOT EXISTS handles idempotency)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_updated_at ON runs(updated_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_updated_id ON runs(updated_at, id)")
     conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_runs_strategy_updated ON runs(strategy_name, updated_at)"
+        "CREATE INDEX IF NOT EXISTS idx_runs_strategy_updated_id "
+        "ON runs(strategy_name, updated_at, id)"
     )
+    # Superseded by the indexes above
+    for index in ("idx_runs_updated_at", "idx_runs_strategy_updated", "idx_runs_created_at"):
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
     conn.commit()
 
 
@@ -45,10 +80,30 @@ def get_connection() -> sqlite3.Connection:
     """Get a database connection with row factory."""
     conn = sqlite3.connect(get_db_path())
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _DEFAULT_PRAGMAS:
+        conn.execute(pragma)
+    if _is_testing():
+        for pragma in _TEST_PRAGMAS:
+            conn.execute(pragma)
     return conn
 
 
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Open a connection whose writes commit together on exit.
+
+    Pass the yielded connection as ``conn`` to the insert functions. The
+    transaction rolls back if the block raises, and the connection is closed
+    either way.
+    """
+    conn = get_connection()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
 def init_db() -> None:
     """Initialize the database schema."""
     # Ensure the data directory exists
@@ -56,6 +111,8 @@ def init_db() -> None:
     ensure_data_dir()
 
     conn = get_connection()
+    # journal_mode is stored in the database file, so set it once here
+    conn.execute("PRAGMA journal_mode = WAL")
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS runs (
             id TEXT PRIMARY KEY,
@@ -69,7 +126,7 @@ def init_db() -> None:
         );
 
         CREATE INDEX IF NOT EXISTS idx_runs_strategy_name ON runs(strategy_name);
-        CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at);
+        CREATE INDEX IF NOT EXISTS idx_runs_created_id ON runs(created_at, id);
 
         CREATE TABLE IF NOT EXISTS artifacts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -124,48 +181,105 @@ def insert_run(
     params: dict[str, Any] | None = None,
     tags: list[str] | None = None,
     notes: str | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> None:
-    """Insert a new run record."""
-    conn = get_connection()
-    conn.execute(
-        """
-        INSERT INTO runs (id, strategy_name, created_at, updated_at, params, metrics, tags, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            run_id,
-            strategy_name,
-            created_at.isoformat(timespec="milliseconds"),
-            updated_at.isoformat(timespec="milliseconds"),
-            json.dumps(params) if params else None,
-            json.dumps(metrics),
-            json.dumps(tags) if tags else None,
-            notes,
-        ),
+    """Insert a new run record.
+
+    If ``conn`` is given the insert joins the caller's transaction and the
+    connection is neither committed nor closed here.
+    """
+    insert_runs_bulk(
+        [
+            {
+                "run_id": run_id,
+                "strategy_name": strategy_name,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "metrics": metrics,
+                "params": params,
+                "tags": tags,
+                "notes": notes,
+            }
+        ],
+        conn=conn,
     )
-    conn.commit()
-    conn.close()
+
+
+def insert_runs_bulk(
+    runs: Iterable[dict[str, Any]],
+    conn: sqlite3.Connection | None = None,
+) -> None:
+    """Insert many run records with a single executemany call.
+
+    Each dict holds the keyword arguments accepted by insert_run(). Without
+    ``conn`` all rows are committed together in one transaction; with it the
+    rows join the caller's transaction and the connection is left open.
+    """
+    rows = [
+        (
+            run["run_id"],
+            run["strategy_name"],
+            run["created_at"].isoformat(timespec="milliseconds"),
+            run["updated_at"].isoformat(timespec="milliseconds"),
+            _json_dumps(run["params"]) if run.get("params") else None,
+            _json_dumps(run["metrics"]),
+            _json_dumps(run["tags"]) if run.get("tags") else None,
+            run.get("notes"),
+        )
+        for run in runs
+    ]
+    own_conn = conn is None
+    if conn is None:
+        conn = get_connection()
+    try:
+        conn.executemany(
+            """
+            INSERT INTO runs (id, strategy_name, created_at, updated_at, params, metrics, tags, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        if own_conn:
+            conn.commit()
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# Columns are listed explicitly so rows can be unpacked by position: in
+# databases migrated by _migrate_add_updated_at, updated_at is the last column.
+_RUN_COLUMNS = "id, strategy_name, created_at, updated_at, params, metrics, tags, notes"
+_ARTIFACT_COLUMNS = "id, run_id, name, artifact_type, file_path, rows, columns, created_at"
+
+
+def _run_from_row(row: sqlite3.Row, metrics: dict | None = None) -> dict:
+    """Build a run dict from a row selected with _RUN_COLUMNS.
+
+    Pass ``metrics`` if the caller has already decoded that column.
+    """
+    id_, strategy_name, created_at, updated_at, params, raw_metrics, tags, notes = row
+    return {
+        "id": id_,
+        "strategy_name": strategy_name,
+        "created_at": datetime.fromisoformat(created_at),
+        "updated_at": datetime.fromisoformat(updated_at),
+        "params": json.loads(params) if params else None,
+        "metrics": json.loads(raw_metrics) if metrics is None else metrics,
+        "tags": json.loads(tags) if tags else None,
+        "notes": notes,
+    }
 
 
 def get_run(run_id: str) -> dict | None:
     """Get a run by ID, returns None if not found."""
     conn = get_connection()
-    row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+    row = conn.execute(f"SELECT {_RUN_COLUMNS} FROM runs WHERE id = ?", (run_id,)).fetchone()
     conn.close()
 
     if row is None:
         return None
 
-    return {
-        "id": row["id"],
-        "strategy_name": row["strategy_name"],
-        "created_at": datetime.fromisoformat(row["created_at"]),
-        "updated_at": datetime.fromisoformat(row["updated_at"]),
-        "params": json.loads(row["params"]) if row["params"] else None,
-        "metrics": json.loads(row["metrics"]),
-        "tags": json.loads(row["tags"]) if row["tags"] else None,
-        "notes": row["notes"],
-    }
+    return _run_from_row(row)
 
 
 def update_run_timestamp(run_id: str, updated_at: datetime) -> bool:
@@ -196,40 +310,88 @@ def insert_artifact(
     file_path: str,
     rows: int,
     columns: list[str],
+    conn: sqlite3.Connection | None = None,
 ) -> None:
-    """Insert artifact metadata."""
-    conn = get_connection()
-    conn.execute(
-        """
-        INSERT INTO artifacts (run_id, name, artifact_type, file_path, rows, columns)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (run_id, name, artifact_type, file_path, rows, json.dumps(columns)),
+    """Insert artifact metadata.
+
+    If ``conn`` is given the insert joins the caller's transaction and the
+    connection is neither committed nor closed here.
+    """
+    insert_artifacts_bulk(
+        [
+            {
+                "run_id": run_id,
+                "name": name,
+                "artifact_type": artifact_type,
+                "file_path": file_path,
+                "rows": rows,
+                "columns": columns,
+            }
+        ],
+        conn=conn,
     )
-    conn.commit()
-    conn.close()
+
+
+def insert_artifacts_bulk(
+    artifacts: Iterable[dict[str, Any]],
+    conn: sqlite3.Connection | None = None,
+) -> None:
+    """Insert many artifact records with a single executemany call.
+
+    Each dict holds the keyword arguments accepted by insert_artifact().
+    Transaction handling follows insert_runs_bulk().
+    """
+    rows = [
+        (
+            artifact["run_id"],
+            artifact["name"],
+            artifact["artifact_type"],
+            artifact["file_path"],
+            artifact["rows"],
+            _json_dumps(artifact["columns"]),
+        )
+        for artifact in artifacts
+    ]
+    own_conn = conn is None
+    if conn is None:
+        conn = get_connection()
+    try:
+        conn.executemany(
+            """
+            INSERT INTO artifacts (run_id, name, artifact_type, file_path, rows, columns)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        if own_conn:
+            conn.commit()
+    finally:
+        if own_conn:
+            conn.close()
 
 
 def get_artifacts(run_id: str) -> list[dict]:
     """Get all artifacts for a run."""
     conn = get_connection()
     rows = conn.execute(
-        "SELECT * FROM artifacts WHERE run_id = ? ORDER BY created_at", (run_id,)
+        f"SELECT {_ARTIFACT_COLUMNS} FROM artifacts WHERE run_id = ? ORDER BY created_at",
+        (run_id,),
     ).fetchall()
     conn.close()
 
     return [
         {
-            "id": row["id"],
-            "run_id": row["run_id"],
-            "name": row["name"],
-            "artifact_type": row["artifact_type"],
-            "file_path": row["file_path"],
-            "rows": row["rows"],
-            "columns": json.loads(row["columns"]),
-            "created_at": datetime.fromisoformat(row["created_at"]),
+            "id": id_,
+            "run_id": artifact_run_id,
+            "name": name,
+            "artifact_type": artifact_type,
+            "file_path": file_path,
+            "rows": n_rows,
+            "columns": json.loads(columns),
+            "created_at": datetime.fromisoformat(created_at),
         }
-        for row in rows
+        for id_, artifact_run_id, name, artifact_type, file_path, n_rows, columns, created_at
+        in rows
     ]
 
 
@@ -285,7 +447,7 @@ def list_runs(
     conn = get_connection()
 
     # Build query
-    query = "SELECT * FROM runs"
+    query = f"SELECT {_RUN_COLUMNS} FROM runs"
     params: list[Any] = []
     conditions: list[str] = []
 
@@ -331,31 +493,25 @@ def list_runs(
     rows = conn.execute(query, params).fetchall()
     conn.close()
 
-    results = [
-        {
-            "id": row["id"],
-            "strategy_name": row["strategy_name"],
-            "created_at": datetime.fromisoformat(row["created_at"]),
-            "updated_at": datetime.fromisoformat(row["updated_at"]),
-            "params": json.loads(row["params"]) if row["params"] else None,
-            "metrics": json.loads(row["metrics"]),
-            "tags": json.loads(row["tags"]) if row["tags"] else None,
-            "notes": row["notes"],
-        }
-        for row in rows
-    ]
+    metrics = [json.loads(row["metrics"]) for row in rows]
 
-    # Sort by metrics field in Python if needed
+    # Sort by metrics field in Python if needed. Only metrics are decoded up
+    # front; the other columns are decoded for the rows within the limit.
     if sort_in_python:
-        results.sort(
-            key=lambda r: r["metrics"].get(order_by) or 0,
+        order = sorted(
+            range(len(rows)),
+            key=lambda i: metrics[i].get(order_by) or 0,
             reverse=descending,
         )
         # Apply limit after Python sorting
         if limit is not None:
-            results = results[:limit]
+            order = order[:limit]
+        rows = [rows[i] for i in order]
+        metrics = [metrics[i] for i in order]
 
-    return results
+    return [
+        _run_from_row(row, run_metrics) for row, run_metrics in zip(rows, metrics, strict=True)
+    ]
 
 
 # Watchlist functions (T055-T058)
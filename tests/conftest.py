@@ -2,6 +2,9 @@
 """Shared fixtures for lynx tests."""
 
 
+import os
+import shutil
+
 import pandas as pd
 import pytest
 
@@ -16,6 +19,8 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
+    # Per-test databases are disposable; let sqlite skip fsync on commit
+    os.environ.setdefault("LYNX_TEST", "1")
     config.addinivalue_line("markers", "integration: mark test as integration test")
 
 
@@ -27,6 +32,41 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_integration)
 
 
+def _assert_frame_hash_equal(left: pd.DataFrame, right: pd.DataFrame, **kwargs) -> None:
+    """Assert two DataFrames are equal, comparing row hashes first.
+
+    Falls back to ``pd.testing.assert_frame_equal`` (with ``kwargs``) only when
+    the shapes, column or index labels, names, dtypes or hashes diverge, to
+    keep its diagnostic output. Row hashes cannot tell an index's dtype apart
+    (a DatetimeIndex hashes like its int64 values), so that is checked here.
+    """
+    if (
+        left.shape == right.shape
+        and left.columns.equals(right.columns)
+        and left.columns.names == right.columns.names
+        and left.index.equals(right.index)
+        and left.index.dtype == right.index.dtype
+        and left.index.names == right.index.names
+        and (
+            not kwargs.get("check_freq", True)
+            or getattr(left.index, "freq", None) == getattr(right.index, "freq", None)
+        )
+        and left.dtypes.equals(right.dtypes)
+    ):
+        left_hash = pd.util.hash_pandas_object(left, index=True).values.tobytes()
+        right_hash = pd.util.hash_pandas_object(right, index=True).values.tobytes()
+        if left_hash == right_hash:
+            return
+
+    pd.testing.assert_frame_equal(left, right, **kwargs)
+
+
+@pytest.fixture
+def assert_frame_hash_equal():
+    """Provide the hash-first DataFrame equality assertion."""
+    return _assert_frame_hash_equal
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path, monkeypatch):
     """Create a temporary data directory for tests and configure lynx to use it."""
@@ -36,16 +76,57 @@ def temp_data_dir(tmp_path, monkeypatch):
     # Set the data directory for the test
     monkeypatch.setenv("LYNX_DATA_DIR", str(data_dir))
 
-    # Also update the config module
+    # Also point the config module at it for the duration of the test.
+    # Artifacts are thrown away, so skip Parquet compression.
+    from lynx import config
+    with config(data_dir=data_dir, parquet_compression=None):
+        yield data_dir
+
+
+@pytest.fixture
+def skip_parquet_writes(monkeypatch):
+    """Write empty marker files instead of Parquet artifacts.
+
+    For tests that only check database rows and artifact directories.
+    """
+    from lynx.storage import parquet
+
+    monkeypatch.setattr(parquet.pq, "write_table", lambda table, path, **kwargs: path.touch())
+
+
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory):
+    """Build an initialized lynx database once per session.
+
+    Treat as read-only; use ``initialized_db`` for a per-test copy.
+    """
     from lynx import config
-    config(data_dir=data_dir)
+    from lynx.storage import sqlite
 
-    return data_dir
+    with config(data_dir=tmp_path_factory.mktemp("db_template")):
+        sqlite.init_db()
+        return sqlite.get_db_path()
 
 
 @pytest.fixture
-def sample_trades_df():
-    """Create a sample trades DataFrame for testing."""
+def initialized_db(temp_data_dir, db_template):
+    """Copy the template database into the test data directory.
+
+    One file copy instead of running the schema DDL for every test.
+    """
+    from lynx.storage import sqlite
+
+    db_path = sqlite.get_db_path()
+    shutil.copyfile(db_template, db_path)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def sample_trades_template():
+    """Build the sample trades DataFrame once per session.
+
+    Treat as read-only; use ``sample_trades_df`` for a per-test copy.
+    """
     return pd.DataFrame({
         "symbol": ["2330", "2317", "2454", "2330", "2317"],
         "entry_date": pd.to_datetime([
@@ -63,8 +144,17 @@ def sample_trades_df():
 
 
 @pytest.fixture
-def sample_signal_df():
-    """Create a sample signal DataFrame for testing."""
+def sample_trades_df(sample_trades_template):
+    """Create a sample trades DataFrame for testing."""
+    return sample_trades_template.copy()
+
+
+@pytest.fixture(scope="session")
+def sample_signal_template():
+    """Build the sample signal DataFrame once per session.
+
+    Treat as read-only; use ``sample_signal_df`` for a per-test copy.
+    """
     dates = pd.date_range("2024-01-01", periods=10, freq="D")
     return pd.DataFrame({
         "2330": [True, False, True, True, False, True, False, True, False, True],
@@ -74,8 +164,17 @@ def sample_signal_df():
 
 
 @pytest.fixture
-def sample_price_df():
-    """Create a sample price DataFrame for testing."""
+def sample_signal_df(sample_signal_template):
+    """Create a sample signal DataFrame for testing."""
+    return sample_signal_template.copy()
+
+
+@pytest.fixture(scope="session")
+def sample_price_template():
+    """Build the sample price DataFrame once per session.
+
+    Treat as read-only; use ``sample_price_df`` for a per-test copy.
+    """
     dates = pd.date_range("2024-01-01", periods=10, freq="D")
     return pd.DataFrame({
         "2330": [580.0, 582.0, 585.0, 590.0, 588.0, 592.0, 595.0, 598.0, 600.0, 602.0],
@@ -84,6 +183,12 @@ def sample_price_df():
     }, index=dates)
 
 
+@pytest.fixture
+def sample_price_df(sample_price_template):
+    """Create a sample price DataFrame for testing."""
+    return sample_price_template.copy()
+
+
 @pytest.fixture
 def empty_trades_df():
     """Create an empty trades DataFrame with correct schema."""
@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 
 import lynx
+from lynx.exceptions import ValidationError
 
 
 @pytest.fixture
@@ -146,3 +147,13 @@ class TestLynxBacktest:
         runs_list = lynx.runs(strategy="list_test_strategy")
         assert len(runs_list) == 1
         assert runs_list[0].id == run.id
+
+    def test_backtest_skips_validation_when_disabled(self, temp_data_dir, backtest_data):
+        entry, exit_, price = backtest_data
+        entry = entry * 3  # signal values above 1 fail validation
+
+        with pytest.raises(ValidationError):
+            lynx.backtest("unvalidated", entry, exit_, price=price)
+
+        run = lynx.backtest("unvalidated", entry, exit_, price=price, validate=False)
+        assert run.id is not None
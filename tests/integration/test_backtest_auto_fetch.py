@@ -27,7 +27,7 @@ class TestBacktestAPIAutoFetch:
         dates = pd.date_range("2024-01-02", periods=5, freq="D")
         return pd.DataFrame({"AAPL": [150.0, 151.0, 152.0, 153.0, 154.0]}, index=dates)
 
-    @patch("lynx.data.yahoo.validate_symbols")
+    @patch("lynx.data.cache.validate_symbols_with_cache")
     @patch("lynx.data.cache.fetch_prices_with_cache")
     def test_backtest_without_price_parameter(
         self, mock_fetch, mock_validate, entry_signal, exit_signal, mock_prices
@@ -4,26 +4,16 @@ import pytest
 from fastapi.testclient import TestClient
 
 import lynx
-from lynx.config import config, reset_config
-from lynx.storage import sqlite
+from lynx.dashboard.server import app
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestDashboardAPI:
     """Test Dashboard REST API endpoints."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
     @pytest.fixture
     def client(self):
         """Create test client for FastAPI app."""
-        from lynx.dashboard.server import app
         return TestClient(app)
 
     def test_get_runs_empty(self, client):
@@ -35,8 +25,10 @@ class TestDashboardAPI:
     def test_get_runs_with_data(self, client, sample_trades_df):
         """Test GET /api/runs with saved runs."""
         # Create some runs
-        run1 = lynx.log("strategy1", trades=sample_trades_df)
-        run2 = lynx.log("strategy2", trades=sample_trades_df)
+        run1, run2 = lynx.log_many([
+            {"name": "strategy1", "trades": sample_trades_df},
+            {"name": "strategy2", "trades": sample_trades_df},
+        ])
 
         response = client.get("/api/runs")
         assert response.status_code == 200
@@ -49,9 +41,10 @@ class TestDashboardAPI:
 
     def test_get_runs_filter_by_strategy(self, client, sample_trades_df):
         """Test GET /api/runs with strategy filter."""
-        lynx.log("strategy1", trades=sample_trades_df)
-        lynx.log("strategy2", trades=sample_trades_df)
-        lynx.log("strategy1", trades=sample_trades_df)
+        lynx.log_many([
+            {"name": name, "trades": sample_trades_df}
+            for name in ("strategy1", "strategy2", "strategy1")
+        ])
 
         response = client.get("/api/runs?strategy=strategy1")
         assert response.status_code == 200
@@ -63,8 +56,7 @@ class TestDashboardAPI:
 
     def test_get_runs_sort_and_limit(self, client, sample_trades_df):
         """Test GET /api/runs with sort and limit."""
-        for i in range(5):
-            lynx.log(f"strategy{i}", trades=sample_trades_df)
+        lynx.log_many([{"name": f"strategy{i}", "trades": sample_trades_df} for i in range(5)])
 
         response = client.get("/api/runs?limit=3&sort_by=created_at&order=desc")
         assert response.status_code == 200
@@ -153,22 +145,13 @@ class TestDashboardAPI:
         assert set(strategies) == {"strategy_a", "strategy_b"}
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestDashboardCompareAPI:
     """Test Dashboard comparison API endpoints."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
     @pytest.fixture
     def client(self):
         """Create test client for FastAPI app."""
-        from lynx.dashboard.server import app
         return TestClient(app)
 
     def test_compare_runs(self, client, sample_trades_df):
@@ -198,7 +181,6 @@ class TestDashboardStaticFiles:
     @pytest.fixture
     def client(self):
         """Create test client for FastAPI app."""
-        from lynx.dashboard.server import app
         return TestClient(app)
 
     def test_index_html_fallback(self, client):
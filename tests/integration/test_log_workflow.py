@@ -5,26 +5,38 @@ import pandas as pd
 import pytest
 
 import lynx
-from lynx.config import config, reset_config
+from lynx.config import config
 from lynx.exceptions import ValidationError
 from lynx.storage import sqlite
 
 
-class TestLogWorkflow:
-    """Test the complete lynx.log() workflow."""
+@pytest.fixture(scope="class")
+def class_data_dir(tmp_path_factory):
+    """Create a data directory shared by every test in a class."""
+    data_dir = tmp_path_factory.mktemp("lynx_data")
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
+    with (
+        pytest.MonkeyPatch.context() as mp,
+        config(data_dir=data_dir, parquet_compression=None),
+    ):
+        mp.setenv("LYNX_DATA_DIR", str(data_dir))
         sqlite.init_db()
-        yield
-        reset_config()
+        yield data_dir
+
 
-    def test_log_basic_workflow(self, sample_trades_df):
+@pytest.fixture(scope="class")
+def logged_run(class_data_dir, sample_trades_template):
+    """Log a trades-only run once per class for read-only assertions."""
+    return lynx.log("test_strategy", trades=sample_trades_template)
+
+
+@pytest.mark.usefixtures("class_data_dir")
+class TestLogWorkflow:
+    """Test the complete lynx.log() workflow."""
+
+    def test_log_basic_workflow(self, logged_run):
         """Test basic log workflow with just trades."""
-        run = lynx.log("test_strategy", trades=sample_trades_df)
+        run = logged_run
 
         # Should return a Run object
         assert isinstance(run, lynx.Run)
@@ -32,8 +44,11 @@ class TestLogWorkflow:
         assert run.id.startswith("test_strategy_")
         assert run.strategy_name == "test_strategy"
         assert run.metrics is not None
-        assert "total_return" in run.metrics
-        assert "sharpe_ratio" in run.metrics
+
+    @pytest.mark.parametrize("metric", ["total_return", "sharpe_ratio"])
+    def test_log_basic_workflow_metrics(self, logged_run, metric):
+        """Test that log computes the expected metrics."""
+        assert metric in logged_run.metrics
 
     def test_log_with_params_and_tags(self, sample_trades_df):
         """Test log with parameters and tags."""
@@ -45,6 +60,7 @@ class TestLogWorkflow:
             trades=sample_trades_df,
             params=params,
             tags=tags,
+            compute_metrics=False,
         )
 
         assert run.params == params
@@ -58,6 +74,7 @@ class TestLogWorkflow:
             "test_strategy",
             trades=sample_trades_df,
             notes=notes,
+            compute_metrics=False,
         )
 
         # Notes should be stored (will add notes property in Run class)
@@ -70,6 +87,7 @@ class TestLogWorkflow:
             trades=sample_trades_df,
             entry_signal=sample_signal_df,
             close_price=sample_price_df,
+            compute_metrics=False,
         )
 
         assert run is not None
@@ -86,9 +104,9 @@ class TestLogWorkflow:
         with pytest.raises(ValidationError):
             lynx.log("test_strategy", trades=invalid_df)
 
-    def test_log_persists_to_storage(self, sample_trades_df, temp_data_dir):
+    def test_log_persists_to_storage(self, logged_run, class_data_dir):
         """Test that log() persists data to storage."""
-        run = lynx.log("test_strategy", trades=sample_trades_df)
+        run = logged_run
 
         # Verify SQLite record exists
         stored_run = sqlite.get_run(run.id)
@@ -102,28 +120,20 @@ class TestLogWorkflow:
         assert any(a["name"] == "trades" for a in artifacts)
 
         # Verify Parquet files exist
-        artifacts_dir = temp_data_dir / "artifacts" / run.id
+        artifacts_dir = class_data_dir / "artifacts" / run.id
         assert artifacts_dir.exists()
         assert (artifacts_dir / "trades.parquet").exists()
 
 
+@pytest.mark.usefixtures("class_data_dir")
 class TestRunWorkflow:
     """Test the complete Run() workflow with method chaining."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
     def test_run_basic_workflow(self, sample_trades_df):
         """Test basic Run workflow."""
         run = lynx.Run("test_strategy")
         run.trades(sample_trades_df)
-        run.save()
+        run.save(compute_metrics=False)
 
         # Should have ID after save
         assert run.id is not None
@@ -135,7 +145,7 @@ class TestRunWorkflow:
             lynx.Run("test_strategy")
             .trades(sample_trades_df)
             .signal("entry", sample_signal_df)
-            .save()
+            .save(compute_metrics=False)
         )
 
         assert run.id is not None
@@ -152,7 +162,7 @@ class TestRunWorkflow:
             tags=tags,
             notes=notes,
         )
-        run.trades(sample_trades_df).save()
+        run.trades(sample_trades_df).save(compute_metrics=False)
 
         assert run.params == params
 
@@ -164,7 +174,7 @@ class TestRunWorkflow:
             run.save()
 
     def test_run_persists_all_artifacts(
-        self, sample_trades_df, sample_signal_df, sample_price_df, temp_data_dir
+        self, sample_trades_df, sample_signal_df, sample_price_df, class_data_dir
     ):
         """Test that all artifacts are persisted."""
         run = (
@@ -172,7 +182,7 @@ class TestRunWorkflow:
             .trades(sample_trades_df)
             .signal("entry", sample_signal_df)
             .data("close_price", sample_price_df)
-            .save()
+            .save(compute_metrics=False)
         )
 
         # Verify all artifacts in SQLite
@@ -183,54 +193,48 @@ class TestRunWorkflow:
         assert "close_price" in artifact_names
 
         # Verify all Parquet files
-        artifacts_dir = temp_data_dir / "artifacts" / run.id
+        artifacts_dir = class_data_dir / "artifacts" / run.id
         assert (artifacts_dir / "trades.parquet").exists()
         assert (artifacts_dir / "entry.parquet").exists()
         assert (artifacts_dir / "close_price.parquet").exists()
 
-    def test_run_get_trades(self, sample_trades_df):
+    def test_run_get_trades(self, logged_run, sample_trades_df, assert_frame_hash_equal):
         """Test getting trades back from Run."""
-        run = lynx.Run("test_strategy").trades(sample_trades_df).save()
-
-        retrieved_trades = run.get_trades()
+        retrieved_trades = logged_run.get_trades()
         assert isinstance(retrieved_trades, pd.DataFrame)
         assert len(retrieved_trades) == len(sample_trades_df)
-        pd.testing.assert_frame_equal(
+        assert_frame_hash_equal(
             retrieved_trades.reset_index(drop=True),
             sample_trades_df.reset_index(drop=True),
         )
 
-    def test_run_get_signal(self, sample_trades_df, sample_signal_df):
+    def test_run_get_signal(self, sample_trades_df, sample_signal_df, assert_frame_hash_equal):
         """Test getting signal artifact."""
         run = (
             lynx.Run("test_strategy")
             .trades(sample_trades_df)
             .signal("entry", sample_signal_df)
-            .save()
+            .save(compute_metrics=False)
         )
 
         retrieved_signal = run.get_signal("entry")
         assert isinstance(retrieved_signal, pd.DataFrame)
         # Compare values and shape (ignore index frequency metadata)
-        pd.testing.assert_frame_equal(
-            retrieved_signal, sample_signal_df, check_freq=False
-        )
+        assert_frame_hash_equal(retrieved_signal, sample_signal_df, check_freq=False)
 
-    def test_run_get_data(self, sample_trades_df, sample_price_df):
+    def test_run_get_data(self, sample_trades_df, sample_price_df, assert_frame_hash_equal):
         """Test getting data artifact."""
         run = (
             lynx.Run("test_strategy")
             .trades(sample_trades_df)
             .data("close_price", sample_price_df)
-            .save()
+            .save(compute_metrics=False)
         )
 
         retrieved_data = run.get_data("close_price")
         assert isinstance(retrieved_data, pd.DataFrame)
         # Compare values and shape (ignore index frequency metadata)
-        pd.testing.assert_frame_equal(
-            retrieved_data, sample_price_df, check_freq=False
-        )
+        assert_frame_hash_equal(retrieved_data, sample_price_df, check_freq=False)
 
     def test_run_list_artifacts(self, sample_trades_df, sample_signal_df, sample_price_df):
         """Test listing all artifacts."""
@@ -239,7 +243,7 @@ class TestRunWorkflow:
             .trades(sample_trades_df)
             .signal("entry", sample_signal_df)
             .data("close_price", sample_price_df)
-            .save()
+            .save(compute_metrics=False)
         )
 
         artifacts = run.list_artifacts()
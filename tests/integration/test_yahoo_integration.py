@@ -4,51 +4,76 @@ These tests make actual network calls and are skipped by default.
 Run with: pytest tests/integration/test_yahoo_integration.py --run-integration
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
 import pytest
 
+from lynx.data.yahoo import fetch_adjusted_prices, validate_symbols
+
 # Mark all tests in this module as integration tests
 pytestmark = pytest.mark.integration
 
+START_DATE = date(2024, 1, 2)
+END_DATE = date(2024, 1, 10)
+
+
+def _fetch_sequentially(symbols: list[str]) -> dict:
+    """Fetch each symbol on its own, keeping exceptions per symbol.
+
+    yf.download resets module-level state on every call, so downloads are
+    kept on a single thread rather than run concurrently with each other.
+    """
+    results = {}
+    for symbol in symbols:
+        try:
+            results[symbol] = fetch_adjusted_prices(
+                symbols=[symbol],
+                start_date=START_DATE,
+                end_date=END_DATE,
+            )
+        except Exception as e:
+            results[symbol] = e
+    return results
+
+
+@pytest.fixture(scope="module")
+def yahoo_responses():
+    """Issue every network call once, overlapping validation with downloads."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        prices = pool.submit(_fetch_sequentially, ["AAPL", "2330.TW"])
+        validation = pool.submit(validate_symbols, ["AAPL", "INVALID_SYMBOL_XYZ123"])
+        return {"prices": prices.result(), "validation": validation}
+
+
+def _prices_for(responses: dict, symbol: str):
+    result = responses["prices"][symbol]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
 
 class TestYahooFinanceIntegration:
     """Real Yahoo Finance API tests."""
 
-    def test_fetch_real_prices(self):
+    def test_fetch_real_prices(self, yahoo_responses):
         """Test fetching real prices from Yahoo Finance."""
-        from datetime import date
-
-        from lynx.data.yahoo import fetch_adjusted_prices
-
-        prices = fetch_adjusted_prices(
-            symbols=["AAPL"],
-            start_date=date(2024, 1, 2),
-            end_date=date(2024, 1, 10),
-        )
+        prices = _prices_for(yahoo_responses, "AAPL")
 
         assert not prices.empty
         assert "AAPL" in prices.columns
         assert len(prices) > 0
 
-    def test_validate_real_symbols(self):
+    def test_validate_real_symbols(self, yahoo_responses):
         """Test validating real symbols."""
-        from lynx.data.yahoo import validate_symbols
-
-        result = validate_symbols(["AAPL", "INVALID_SYMBOL_XYZ123"])
+        result = yahoo_responses["validation"].result()
 
         assert "AAPL" in result.valid_symbols
         assert "INVALID_SYMBOL_XYZ123" in result.invalid_symbols
 
-    def test_fetch_taiwan_stock(self):
+    def test_fetch_taiwan_stock(self, yahoo_responses):
         """Test fetching Taiwan stock (2330.TW = TSMC)."""
-        from datetime import date
-
-        from lynx.data.yahoo import fetch_adjusted_prices
-
-        prices = fetch_adjusted_prices(
-            symbols=["2330.TW"],
-            start_date=date(2024, 1, 2),
-            end_date=date(2024, 1, 10),
-        )
+        prices = _prices_for(yahoo_responses, "2330.TW")
 
         assert not prices.empty
         assert "2330.TW" in prices.columns
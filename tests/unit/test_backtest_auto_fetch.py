@@ -1,7 +1,5 @@
 """Tests for backtest auto-fetch functionality."""
 
-from unittest.mock import patch
-
 import pandas as pd
 import pytest
 
@@ -10,81 +8,117 @@ from lynx.data.exceptions import InvalidSymbolError
 from lynx.data.yahoo import ValidationResult
 
 
+@pytest.fixture(scope="module")
+def entry_signal():
+    dates = pd.date_range("2024-01-02", periods=5, freq="D")
+    return pd.DataFrame({"AAPL": [1, 0, 0, 0, 0]}, index=dates)
+
+
+@pytest.fixture(scope="module")
+def exit_signal():
+    dates = pd.date_range("2024-01-02", periods=5, freq="D")
+    return pd.DataFrame({"AAPL": [0, 0, 1, 0, 0]}, index=dates)
+
+
+@pytest.fixture(scope="module")
+def mock_prices():
+    dates = pd.date_range("2024-01-02", periods=5, freq="D")
+    return pd.DataFrame({"AAPL": [150.0, 151.0, 152.0, 153.0, 154.0]}, index=dates)
+
+
+class FakeYahoo:
+    """Stand-in for the Yahoo validation and price-fetch entry points.
+
+    Records every call and serves canned prices; symbols listed in
+    ``invalid_symbols`` are reported as not found.
+    """
+
+    def __init__(self, prices: pd.DataFrame):
+        self.prices = prices
+        self.reset()
+
+    def reset(self) -> None:
+        self.invalid_symbols: list[str] = []
+        self.validate_calls: list[list[str]] = []
+        self.fetch_calls: list[list[str]] = []
+
+    def validate_symbols(self, symbols: list[str]) -> ValidationResult:
+        self.validate_calls.append(list(symbols))
+        invalid = [s for s in symbols if s in self.invalid_symbols]
+        return ValidationResult(
+            valid_symbols=[s for s in symbols if s not in invalid],
+            invalid_symbols=invalid,
+            errors=dict.fromkeys(invalid, "Not found"),
+        )
+
+    def fetch_prices_with_cache(self, symbols, start_date, end_date) -> pd.DataFrame:
+        self.fetch_calls.append(list(symbols))
+        return self.prices[symbols]
+
+
+@pytest.fixture(scope="module")
+def _patched_yahoo(mock_prices):
+    """Patch the Yahoo entry points once for the whole module."""
+    fake = FakeYahoo(mock_prices)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("lynx.data.cache.validate_symbols_with_cache", fake.validate_symbols)
+        mp.setattr("lynx.data.cache.fetch_prices_with_cache", fake.fetch_prices_with_cache)
+        yield fake
+
+
+@pytest.fixture
+def fake_yahoo(_patched_yahoo):
+    """Give each test a freshly reset view of the module-level fake."""
+    _patched_yahoo.reset()
+    return _patched_yahoo
+
+
+@pytest.fixture
+def engine_factory(entry_signal, exit_signal):
+    """Build a BacktestEngine over the shared module-level signals.
+
+    The signal and price frames are shared across tests and must be treated
+    as read-only; keyword arguments override the engine defaults per test.
+    """
+    def _make(**kwargs) -> BacktestEngine:
+        kwargs.setdefault("entry_signal", entry_signal)
+        kwargs.setdefault("exit_signal", exit_signal)
+        kwargs.setdefault("price", None)
+        kwargs.setdefault("initial_capital", 1_000_000)
+        return BacktestEngine(**kwargs)
+
+    return _make
+
+
 class TestBacktestAutoFetch:
     """Tests for auto-fetching prices in backtest."""
 
-    @pytest.fixture
-    def entry_signal(self):
-        dates = pd.date_range("2024-01-02", periods=5, freq="D")
-        return pd.DataFrame({"AAPL": [1, 0, 0, 0, 0]}, index=dates)
-
-    @pytest.fixture
-    def exit_signal(self):
-        dates = pd.date_range("2024-01-02", periods=5, freq="D")
-        return pd.DataFrame({"AAPL": [0, 0, 1, 0, 0]}, index=dates)
-
-    @pytest.fixture
-    def mock_prices(self):
-        dates = pd.date_range("2024-01-02", periods=5, freq="D")
-        return pd.DataFrame({"AAPL": [150.0, 151.0, 152.0, 153.0, 154.0]}, index=dates)
-
-    @patch("lynx.data.yahoo.validate_symbols")
-    @patch("lynx.data.cache.fetch_prices_with_cache")
-    def test_auto_fetch_when_price_not_provided(
-        self, mock_fetch, mock_validate, entry_signal, exit_signal, mock_prices
-    ):
+    def test_auto_fetch_when_price_not_provided(self, fake_yahoo, engine_factory):
         """Should auto-fetch prices when not provided."""
-        mock_validate.return_value = ValidationResult(valid_symbols=["AAPL"], invalid_symbols=[])
-        mock_fetch.return_value = mock_prices
-
-        engine = BacktestEngine(
-            entry_signal=entry_signal,
-            exit_signal=exit_signal,
-            price=None,
-            initial_capital=1_000_000,
-            auto_fetch_prices=True,
-        )
+        engine = engine_factory(auto_fetch_prices=True)
         engine.run()
 
-        mock_validate.assert_called_once()
-        mock_fetch.assert_called_once()
+        assert fake_yahoo.validate_calls == [["AAPL"]]
+        assert fake_yahoo.fetch_calls == [["AAPL"]]
 
-    def test_uses_provided_prices(self, entry_signal, exit_signal, mock_prices):
+    def test_uses_provided_prices(self, fake_yahoo, engine_factory, mock_prices):
         """Should use provided prices without fetching."""
-        engine = BacktestEngine(
-            entry_signal=entry_signal,
-            exit_signal=exit_signal,
-            price=mock_prices,
-            initial_capital=1_000_000,
-        )
+        engine = engine_factory(price=mock_prices)
         engine.run()
         assert len(engine.trades) > 0
+        assert fake_yahoo.fetch_calls == []
 
-    @patch("lynx.data.yahoo.validate_symbols")
-    def test_raises_on_invalid_symbols(self, mock_validate, entry_signal, exit_signal):
+    def test_raises_on_invalid_symbols(self, fake_yahoo, engine_factory):
         """Should raise InvalidSymbolError for invalid symbols."""
-        mock_validate.return_value = ValidationResult(
-            valid_symbols=[], invalid_symbols=["AAPL"], errors={"AAPL": "Not found"}
-        )
+        fake_yahoo.invalid_symbols = ["AAPL"]
 
-        engine = BacktestEngine(
-            entry_signal=entry_signal,
-            exit_signal=exit_signal,
-            price=None,
-            initial_capital=1_000_000,
-        )
+        engine = engine_factory()
 
         with pytest.raises(InvalidSymbolError):
             engine.run()
 
-    def test_auto_fetch_disabled_requires_price(self, entry_signal, exit_signal):
+    def test_auto_fetch_disabled_requires_price(self, engine_factory):
         """Should raise error when auto_fetch=False and no price."""
-        engine = BacktestEngine(
-            entry_signal=entry_signal,
-            exit_signal=exit_signal,
-            price=None,
-            initial_capital=1_000_000,
-            auto_fetch_prices=False,
-        )
+        engine = engine_factory(auto_fetch_prices=False)
         with pytest.raises(ValueError, match="price.*required"):
             engine.run()
@@ -1,5 +1,6 @@
 """Tests for trading cost calculations."""
 
+import numpy as np
 import pytest
 
 from lynx.backtest.costs import calculate_buy_cost, calculate_sell_revenue
@@ -42,6 +43,20 @@ class TestCalculateBuyCost:
         # 100 * 100 * (1 + 0 + 0.001) = 10010
         assert cost == pytest.approx(10010.0)
 
+    def test_array_inputs(self):
+        fees = {
+            "commission_rate": 0.001,
+            "commission_discount": 1.0,
+            "slippage": 0.001,
+        }
+        prices = np.array([100.0, 50.0, 25.0])
+        shares = np.array([1000, 100, 10])
+        costs = calculate_buy_cost(price=prices, shares=shares, fees=fees)
+
+        assert isinstance(costs, np.ndarray)
+        expected = [calculate_buy_cost(p, s, fees) for p, s in zip(prices, shares, strict=True)]
+        np.testing.assert_allclose(costs, expected)
+
 
 class TestCalculateSellRevenue:
     def test_basic_sell_revenue(self):
@@ -80,3 +95,16 @@ class TestCalculateSellRevenue:
         revenue = calculate_sell_revenue(price=150.0, shares=100, fees=fees)
         # 150 * 100 * (1 - 0 - 0 - 0.001) = 14985
         assert revenue == pytest.approx(14985.0)
+
+    def test_array_prices_broadcast_scalar_shares(self):
+        fees = {
+            "commission_rate": 0.001,
+            "commission_discount": 1.0,
+            "tax_sell": 0.003,
+            "slippage": 0.001,
+        }
+        prices = np.array([100.0, 150.0])
+        revenues = calculate_sell_revenue(price=prices, shares=100, fees=fees)
+
+        assert isinstance(revenues, np.ndarray)
+        np.testing.assert_allclose(revenues, prices * 100 * (1 - 0.001 - 0.003 - 0.001))
@@ -1,5 +1,7 @@
 """Tests for backtest default configurations."""
 
+import pytest
+
 from lynx.backtest.defaults import (
     DEFAULT_FEES,
     DEFAULT_LOT_SIZE,
@@ -64,6 +66,18 @@ class TestGetFeesForSymbol:
         assert fees["commission_discount"] == 0.28
         assert fees["commission_rate"] == 0.001425  # inherited from default
 
+    def test_results_are_cached_and_read_only(self):
+        fees = get_fees_for_symbol("2330.TW")
+        assert get_fees_for_symbol("2317.TW") is fees
+        with pytest.raises(TypeError):
+            fees["slippage"] = 0.0  # type: ignore[index]
+
+    def test_custom_fees_edits_are_seen(self):
+        custom = {".TW": {"commission_discount": 0.28}}
+        assert get_fees_for_symbol("2330.TW", custom)["commission_discount"] == 0.28
+        custom[".TW"]["commission_discount"] = 0.5
+        assert get_fees_for_symbol("2330.TW", custom)["commission_discount"] == 0.5
+
 
 class TestGetLotSizeForSymbol:
     def test_tw_symbol(self):
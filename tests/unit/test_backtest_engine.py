@@ -2,14 +2,21 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from lynx.backtest.engine import (
+    BacktestEngine,
+    Position,
+    PositionBook,
+    TradeLog,
+    _size_entries,
+)
+
 
 class TestPosition:
     def test_create_position(self):
-        from lynx.backtest.engine import Position
-
         pos = Position(
             symbol="2330.TW",
             shares=1000,
@@ -23,8 +30,6 @@ class TestPosition:
         assert pos.entry_cost == 581000.0
 
     def test_position_current_value(self):
-        from lynx.backtest.engine import Position
-
         pos = Position(
             symbol="2330.TW",
             shares=1000,
@@ -35,8 +40,6 @@ class TestPosition:
         assert pos.current_value(600.0) == 600000.0
 
     def test_position_return_pct(self):
-        from lynx.backtest.engine import Position
-
         pos = Position(
             symbol="2330.TW",
             shares=1000,
@@ -48,8 +51,6 @@ class TestPosition:
         assert pos.return_pct(600.0) == pytest.approx(0.0345, rel=0.01)
 
     def test_position_partial_exit(self):
-        from lynx.backtest.engine import Position
-
         pos = Position(
             symbol="2330.TW",
             shares=1000,
@@ -62,8 +63,6 @@ class TestPosition:
         assert pos.shares == 500
 
     def test_position_full_exit(self):
-        from lynx.backtest.engine import Position
-
         pos = Position(
             symbol="2330.TW",
             shares=1000,
@@ -76,27 +75,157 @@ class TestPosition:
         assert pos.shares == 0
 
 
-class TestBacktestEngine:
-    @pytest.fixture
-    def sample_data(self):
-        dates = pd.date_range("2024-01-01", periods=5, freq="D")
-        entry_signal = pd.DataFrame({
-            "2330.TW": [0.5, 0.0, 0.0, 0.0, 0.0],
-            "2317.TW": [0.5, 0.0, 0.0, 0.0, 0.0],
-        }, index=dates)
-        exit_signal = pd.DataFrame({
-            "2330.TW": [0.0, 0.0, 0.0, 1.0, 0.0],
-            "2317.TW": [0.0, 0.0, 0.0, 1.0, 0.0],
-        }, index=dates)
-        price = pd.DataFrame({
-            "2330.TW": [580.0, 585.0, 590.0, 595.0, 600.0],
-            "2317.TW": [112.0, 113.0, 114.0, 115.0, 116.0],
-        }, index=dates)
-        return entry_signal, exit_signal, price
+class TestPositionBook:
+    def test_open_and_mapping_view(self):
+        book = PositionBook(["2330.TW", "2317.TW"])
+        assert len(book) == 0
+
+        book.open(1, shares=2000, entry_price=112.0, entry_date=date(2024, 1, 2), entry_cost=224100.0)
+        assert len(book) == 1
+        assert "2317.TW" in book
+        assert "2330.TW" not in book
+
+        pos = book["2317.TW"]
+        assert pos.shares == 2000
+        assert pos.entry_price == 112.0
+        assert pos.entry_date == date(2024, 1, 2)
+
+    def test_position_view_writes_through(self):
+        book = PositionBook(["2330.TW"])
+        book.open(0, shares=1000, entry_price=580.0, entry_date=date(2024, 1, 2), entry_cost=581000.0)
+
+        book["2330.TW"].reduce(400)
+        assert book.shares[0] == 600
+
+    def test_iterates_in_open_order(self):
+        book = PositionBook(["A.US", "B.US", "C.US"])
+        book.open(2, shares=1, entry_price=1.0, entry_date=date(2024, 1, 2), entry_cost=1.0)
+        book.open(0, shares=1, entry_price=1.0, entry_date=date(2024, 1, 3), entry_cost=1.0)
+
+        assert list(book) == ["C.US", "A.US"]
+        assert book.open_slots().tolist() == [2, 0]
+
+    def test_close_removes_position(self):
+        book = PositionBook(["A.US"])
+        book.open(0, shares=10, entry_price=5.0, entry_date=date(2024, 1, 2), entry_cost=50.0)
+        book.close(0)
+
+        assert len(book) == 0
+        with pytest.raises(KeyError):
+            book["A.US"]
+
+    def test_vectorized_value_and_return(self):
+        book = PositionBook(["A.US", "B.US", "C.US"])
+        book.open(0, shares=10, entry_price=100.0, entry_date=date(2024, 1, 2), entry_cost=1000.0)
+        book.open(2, shares=5, entry_price=50.0, entry_date=date(2024, 1, 2), entry_cost=250.0)
+        prices = np.array([110.0, np.nan, 45.0])
+
+        np.testing.assert_allclose(book.current_value_all(prices), [1100.0, 0.0, 225.0])
+        assert book.holdings_value(prices) == pytest.approx(1325.0)
+        assert PositionBook(["A.US"]).holdings_value(np.array([np.nan])) == 0.0
+        returns = book.return_pct_all(prices)
+        assert returns[0] == pytest.approx(0.10)
+        assert np.isnan(returns[1])
+        assert returns[2] == pytest.approx(-0.10)
+
+
+class TestTradeLog:
+    def test_rows_read_back_as_dicts(self):
+        log = TradeLog()
+        log.append("A.US", date(2024, 1, 2), date(2024, 1, 5), 100.0, 110.0, 10, 0.1, "signal")
+        log.append("B.US", date(2024, 1, 3), date(2024, 1, 6), 50.0, 45.0, 20, -0.1, "stop_loss")
+
+        assert len(log) == 2
+        assert log[0] == {
+            "symbol": "A.US",
+            "entry_date": date(2024, 1, 2),
+            "exit_date": date(2024, 1, 5),
+            "entry_price": 100.0,
+            "exit_price": 110.0,
+            "shares": 10,
+            "return": 0.1,
+            "exit_reason": "signal",
+        }
+        assert [trade["symbol"] for trade in log] == ["A.US", "B.US"]
+        assert log[-1]["exit_reason"] == "stop_loss"
+
+    def test_grows_past_initial_capacity(self):
+        log = TradeLog(capacity=1)
+        for i in range(5):
+            log.append("A.US", date(2024, 1, 2), date(2024, 1, 5), 100.0, 110.0, i, 0.1, "signal")
+
+        assert len(log) == 5
+        assert log.records["shares"].tolist() == [0, 1, 2, 3, 4]
+        assert log[1:3] == [log[1], log[2]]
+
+    def test_to_frame_keeps_numeric_dtypes(self):
+        log = TradeLog()
+        log.append("A.US", date(2024, 1, 2), date(2024, 1, 5), 100.0, 110.0, 10, 0.1, "signal")
+
+        df = log.to_frame()
+        assert list(df.columns) == list(log[0])
+        assert df["shares"].dtype == np.int64
+        assert df["entry_price"].dtype == np.float64
+        assert df["return"].tolist() == [0.1]
+
+
+class TestSizeEntries:
+    def test_rounds_down_to_lot_size(self):
+        shares, costs = _size_entries(
+            allocation=np.array([600_000.0, 10_000.0]),
+            price=np.array([580.0, 100.0]),
+            cost_multiplier=np.array([1.0, 1.0]),
+            lot_size=np.array([1000, 1]),
+            cash=1_000_000.0,
+        )
+        assert shares.tolist() == [1000, 100]
+        np.testing.assert_allclose(costs, [580_000.0, 10_000.0])
+
+    def test_missing_price_is_not_filled(self):
+        shares, costs = _size_entries(
+            allocation=np.array([5_000.0, 5_000.0]),
+            price=np.array([np.nan, 50.0]),
+            cost_multiplier=np.array([1.0, 1.0]),
+            lot_size=np.array([1, 1]),
+            cash=10_000.0,
+        )
+        assert shares.tolist() == [0, 100]
+        assert costs[0] == 0.0
+
+    def test_scales_down_when_cost_exceeds_cash(self):
+        shares, costs = _size_entries(
+            allocation=np.array([10_000.0, 10_000.0]),
+            price=np.array([10.0, 10.0]),
+            cost_multiplier=np.array([1.0, 1.0]),
+            lot_size=np.array([1, 1]),
+            cash=10_000.0,
+        )
+        # 2000 shares wanted, cash covers 1000; scaled by 0.5 * 0.99
+        assert shares.tolist() == [495, 495]
+        assert costs.sum() <= 10_000.0
+
+
+@pytest.fixture(scope="module")
+def sample_data():
+    """Build the shared engine inputs once; the engine never mutates them."""
+    dates = pd.date_range("2024-01-01", periods=5, freq="D")
+    entry_signal = pd.DataFrame({
+        "2330.TW": [0.5, 0.0, 0.0, 0.0, 0.0],
+        "2317.TW": [0.5, 0.0, 0.0, 0.0, 0.0],
+    }, index=dates)
+    exit_signal = pd.DataFrame({
+        "2330.TW": [0.0, 0.0, 0.0, 1.0, 0.0],
+        "2317.TW": [0.0, 0.0, 0.0, 1.0, 0.0],
+    }, index=dates)
+    price = pd.DataFrame({
+        "2330.TW": [580.0, 585.0, 590.0, 595.0, 600.0],
+        "2317.TW": [112.0, 113.0, 114.0, 115.0, 116.0],
+    }, index=dates)
+    return entry_signal, exit_signal, price
 
-    def test_engine_initialization(self, sample_data):
-        from lynx.backtest.engine import BacktestEngine
 
+class TestBacktestEngine:
+    def test_engine_initialization(self, sample_data):
         entry, exit_, price = sample_data
         engine = BacktestEngine(
             entry_signal=entry,
@@ -109,8 +238,6 @@ class TestBacktestEngine:
         assert len(engine.positions) == 0
 
     def test_engine_with_stop_loss(self, sample_data):
-        from lynx.backtest.engine import BacktestEngine
-
         entry, exit_, price = sample_data
         engine = BacktestEngine(
             entry_signal=entry,
@@ -122,8 +249,6 @@ class TestBacktestEngine:
         assert engine.stop_loss == 0.05
 
     def test_engine_with_take_profit(self, sample_data):
-        from lynx.backtest.engine import BacktestEngine
-
         entry, exit_, price = sample_data
         engine = BacktestEngine(
             entry_signal=entry,
@@ -135,8 +260,6 @@ class TestBacktestEngine:
         assert engine.take_profit == 0.10
 
     def test_engine_run_simple_trade(self, sample_data):
-        from lynx.backtest.engine import BacktestEngine
-
         entry, exit_, price = sample_data
         engine = BacktestEngine(
             entry_signal=entry,
@@ -152,9 +275,23 @@ class TestBacktestEngine:
         # Should have equity history for each day
         assert len(engine.equity_history) == 5
 
-    def test_engine_generates_correct_trades(self):
-        from lynx.backtest.engine import BacktestEngine
+    def test_engine_equity_history_records(self, sample_data):
+        entry, exit_, price = sample_data
+        engine = BacktestEngine(
+            entry_signal=entry,
+            exit_signal=exit_,
+            price=price,
+            initial_capital=1_000_000,
+        )
+        engine.run()
+
+        history = engine.equity_history
+        assert history.dtype.names == ("date", "equity", "cash", "holdings_value", "daily_return")
+        np.testing.assert_allclose(history["equity"], history["cash"] + history["holdings_value"])
+        assert history["daily_return"][0] == pytest.approx(history["equity"][0] / 1_000_000 - 1)
+        assert list(pd.DataFrame(history)["date"]) == list(price.index)
 
+    def test_engine_generates_correct_trades(self):
         dates = pd.date_range("2024-01-01", periods=3, freq="D")
         entry_signal = pd.DataFrame({
             "TEST.US": [1.0, 0.0, 0.0],
@@ -184,8 +321,6 @@ class TestBacktestEngine:
         assert trade["exit_reason"] == "signal"
 
     def test_engine_respects_lot_size(self):
-        from lynx.backtest.engine import BacktestEngine
-
         dates = pd.date_range("2024-01-01", periods=2, freq="D")
         entry_signal = pd.DataFrame({
             "2330.TW": [1.0, 0.0],
@@ -210,8 +345,6 @@ class TestBacktestEngine:
         assert trade["shares"] % 1000 == 0
 
     def test_engine_stop_loss_triggers(self):
-        from lynx.backtest.engine import BacktestEngine
-
         dates = pd.date_range("2024-01-01", periods=4, freq="D")
         entry_signal = pd.DataFrame({
             "TEST.US": [1.0, 0.0, 0.0, 0.0],
@@ -239,8 +372,6 @@ class TestBacktestEngine:
         assert engine.trades[0]["exit_reason"] == "stop_loss"
 
     def test_engine_take_profit_triggers(self):
-        from lynx.backtest.engine import BacktestEngine
-
         dates = pd.date_range("2024-01-01", periods=4, freq="D")
         entry_signal = pd.DataFrame({
             "TEST.US": [1.0, 0.0, 0.0, 0.0],
@@ -265,3 +396,99 @@ class TestBacktestEngine:
 
         assert len(engine.trades) == 1
         assert engine.trades[0]["exit_reason"] == "take_profit"
+
+    def test_engine_stop_loss_and_take_profit_same_day(self):
+        dates = pd.date_range("2024-01-01", periods=4, freq="D")
+        entry_signal = pd.DataFrame({
+            "DOWN.US": [0.5, 0.0, 0.0, 0.0],
+            "UP.US": [0.5, 0.0, 0.0, 0.0],
+        }, index=dates)
+        exit_signal = entry_signal * 0
+        price = pd.DataFrame({
+            "DOWN.US": [100.0, 88.0, 85.0, 85.0],
+            "UP.US": [100.0, 112.0, 115.0, 115.0],
+        }, index=dates)
+
+        engine = BacktestEngine(
+            entry_signal=entry_signal,
+            exit_signal=exit_signal,
+            price=price,
+            initial_capital=10_000,
+            stop_loss=0.10,
+            take_profit=0.10,
+            fees={".US": {"commission_rate": 0.0, "slippage": 0.0}},
+        )
+        engine.run()
+
+        reasons = {trade["symbol"]: trade["exit_reason"] for trade in engine.trades}
+        assert reasons == {"DOWN.US": "stop_loss", "UP.US": "take_profit"}
+        assert all(trade["exit_date"] == dates[2].date() for trade in engine.trades)
+
+    def test_engine_aligns_signal_columns_to_price(self):
+        dates = pd.date_range("2024-01-01", periods=3, freq="D")
+        price = pd.DataFrame({
+            "A.US": [10.0, 11.0, 12.0],
+            "B.US": [20.0, 21.0, 22.0],
+        }, index=dates)
+        # Same symbols as price, but in a different column order
+        entry_signal = pd.DataFrame({
+            "B.US": [0.0, 0.0, 0.0],
+            "A.US": [1.0, 0.0, 0.0],
+        }, index=dates)
+        exit_signal = pd.DataFrame({
+            "B.US": [0.0, 0.0, 0.0],
+            "A.US": [0.0, 1.0, 0.0],
+        }, index=dates)
+
+        engine = BacktestEngine(
+            entry_signal=entry_signal,
+            exit_signal=exit_signal,
+            price=price,
+            initial_capital=10_000,
+            fees={".US": {"commission_rate": 0.0, "slippage": 0.0}},
+        )
+        engine.run()
+
+        assert len(engine.trades) == 1
+        trade = engine.trades[0]
+        assert trade["symbol"] == "A.US"
+        assert trade["entry_price"] == 10.0
+        assert trade["exit_price"] == 11.0
+
+    def test_engine_resolves_costs_per_column(self):
+        dates = pd.date_range("2024-01-01", periods=2, freq="D")
+        signal = pd.DataFrame({"2330.TW": [0.0, 0.0], "AAPL.US": [0.0, 0.0]}, index=dates)
+        price = pd.DataFrame({"2330.TW": [580.0, 600.0], "AAPL.US": [190.0, 191.0]}, index=dates)
+
+        engine = BacktestEngine(
+            entry_signal=signal,
+            exit_signal=signal,
+            price=price,
+            fees={".US": {"commission_rate": 0.0, "slippage": 0.0}},
+            lot_size={".TW": 100},
+        )
+        engine.run()
+
+        assert engine._lot_size.tolist() == [100, 1]
+        assert engine._buy_multiplier[1] == 1.0
+        assert engine._sell_multiplier[0] < 1.0
+
+    def test_engine_shares_cost_rules_by_suffix(self):
+        dates = pd.date_range("2024-01-01", periods=2, freq="D")
+        symbols = ["2330.TW", "AAPL.US", "2317.TW", "NOSUFFIX", "MSFT.US"]
+        signal = pd.DataFrame(0.0, index=dates, columns=symbols)
+        price = pd.DataFrame(100.0, index=dates, columns=symbols)
+
+        engine = BacktestEngine(
+            entry_signal=signal,
+            exit_signal=signal,
+            price=price,
+            fees={".US": {"commission_rate": 0.0, "slippage": 0.0}},
+        )
+        engine.run()
+
+        assert engine._lot_size.tolist() == [1000, 1, 1000, 1, 1]
+        assert engine._buy_multiplier[0] == engine._buy_multiplier[2]
+        assert engine._buy_multiplier[1] == engine._buy_multiplier[4] == 1.0
+        assert engine._buy_multiplier[3] == pytest.approx(1.002)
+
@@ -58,6 +58,11 @@ class TestValidateBacktestInputs:
         with pytest.raises(ValidationError, match="columns must match"):
             validate_backtest_inputs(entry_with_extra, valid_exit_signal, valid_price)
 
+    def test_reordered_columns_pass(self, valid_entry_signal, valid_exit_signal, valid_price):
+        # Same symbols in a different order are accepted
+        reordered = valid_entry_signal[["2317.TW", "2330.TW"]]
+        validate_backtest_inputs(reordered, valid_exit_signal, valid_price)
+
     def test_entry_signal_values_out_of_range_raises(self, valid_exit_signal, valid_price):
         dates = pd.date_range("2024-01-01", periods=5, freq="D")
         bad_entry = pd.DataFrame({
@@ -89,3 +94,34 @@ class TestValidateBacktestInputs:
         empty_price = pd.DataFrame()
         with pytest.raises(ValidationError, match="price DataFrame cannot be empty"):
             validate_backtest_inputs(valid_entry_signal, valid_exit_signal, empty_price)
+
+    def test_missing_values_are_ignored(self, valid_entry_signal, valid_exit_signal, valid_price):
+        entry = valid_entry_signal.copy()
+        entry.iloc[1, 0] = float("nan")
+        price = valid_price.copy()
+        price.iloc[2, 1] = float("nan")
+        # Should not raise
+        validate_backtest_inputs(entry, valid_exit_signal, price)
+
+    def test_mixed_and_nullable_dtypes(self, valid_exit_signal, valid_price):
+        dates = valid_price.index
+        entry = pd.DataFrame({
+            "2330.TW": [True, False, False, False, False],
+            "2317.TW": pd.array([0.5, None, 0.0, 0.0, 0.0], dtype="Float64"),
+        }, index=dates)
+        # Should not raise
+        validate_backtest_inputs(entry, valid_exit_signal, valid_price)
+
+        entry["2317.TW"] = pd.array([0.5, None, 1.5, 0.0, 0.0], dtype="Float64")
+        with pytest.raises(ValidationError, match="entry_signal values must be between 0 and 1"):
+            validate_backtest_inputs(entry, valid_exit_signal, valid_price)
+
+    def test_out_of_range_value_next_to_nan_raises(self, valid_exit_signal, valid_price):
+        dates = pd.date_range("2024-01-01", periods=5, freq="D")
+        bad_entry = pd.DataFrame({
+            "2330.TW": [float("nan"), 0.0, 0.0, 0.0, 0.0],
+            "2317.TW": [0.0, 0.0, 2.0, 0.0, 0.0],
+        }, index=dates)
+        with pytest.raises(ValidationError, match="entry_signal values must be between 0 and 1"):
+            validate_backtest_inputs(bad_entry, valid_exit_signal, valid_price)
+
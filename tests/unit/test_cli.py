@@ -5,26 +5,17 @@ from click.testing import CliRunner
 
 import lynx
 from lynx.cli import cli
-from lynx.config import config, reset_config
-from lynx.storage import sqlite
 
 
-class TestCLIList:
-    """Test lynx list command."""
+@pytest.fixture(scope="module")
+def runner():
+    """Create one CLI test runner for the module; it holds no state."""
+    return CliRunner()
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
+@pytest.mark.usefixtures("initialized_db")
+class TestCLIList:
+    """Test lynx list command."""
 
     def test_list_empty(self, runner):
         """Test list command with no runs."""
@@ -62,23 +53,10 @@ class TestCLIList:
         # Output should only show 3 runs
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestCLIShow:
     """Test lynx show command."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_show_existing_run(self, runner, sample_trades_df):
         """Test show command for existing run."""
         run = lynx.log("test_strategy", trades=sample_trades_df, params={"threshold": 50})
@@ -95,23 +73,10 @@ class TestCLIShow:
         assert result.exit_code != 0 or "not found" in result.output.lower()
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestCLIDelete:
     """Test lynx delete command."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_delete_existing_run(self, runner, sample_trades_df):
         """Test delete command for existing run."""
         run = lynx.log("test_strategy", trades=sample_trades_df)
@@ -132,23 +97,10 @@ class TestCLIDelete:
         assert result.exit_code != 0 or "not found" in result.output.lower()
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestCLIExport:
     """Test lynx export command."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self, temp_data_dir):
-        """Set up and tear down test environment."""
-        reset_config()
-        config(data_dir=temp_data_dir)
-        sqlite.init_db()
-        yield
-        reset_config()
-
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_export_existing_run(self, runner, sample_trades_df, tmp_path):
         """Test export command for existing run."""
         run = lynx.log("test_strategy", trades=sample_trades_df)
@@ -172,11 +124,6 @@ class TestCLIExport:
 class TestCLIServe:
     """Test lynx serve command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_serve_help(self, runner):
         """Test serve command help."""
         result = runner.invoke(cli, ["serve", "--help"])
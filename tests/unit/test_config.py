@@ -1,32 +1,44 @@
 """Tests for lynx configuration."""
-import os
 from pathlib import Path
 
+import pytest
+
 from lynx.config import config, ensure_data_dir, get_data_dir, reset_config
 
 
 class TestConfig:
-    def setup_method(self):
-        """Reset config before each test."""
+    @pytest.fixture(autouse=True)
+    def clean_config(self, monkeypatch):
+        """Start from the defaults with LYNX_DATA_DIR unset.
+
+        monkeypatch restores the environment afterwards, and the closing
+        reset_config() keeps explicit config out of other test modules.
+        """
+        reset_config()
+        monkeypatch.delenv("LYNX_DATA_DIR", raising=False)
+        yield
         reset_config()
-        # Clear env var if set
-        if "LYNX_DATA_DIR" in os.environ:
-            del os.environ["LYNX_DATA_DIR"]
 
     def test_default_data_dir(self):
         """Default data dir should be ~/.lynx/"""
         assert get_data_dir() == Path.home() / ".lynx"
 
-    def test_env_var_overrides_default(self, tmp_path):
+    def test_env_var_overrides_default(self, tmp_path, monkeypatch):
         """LYNX_DATA_DIR env var should override default."""
-        os.environ["LYNX_DATA_DIR"] = str(tmp_path)
+        monkeypatch.setenv("LYNX_DATA_DIR", str(tmp_path))
+        assert get_data_dir() == tmp_path
+
+    def test_env_var_change_after_lookup(self, tmp_path, monkeypatch):
+        """A cached lookup should not hide a later LYNX_DATA_DIR change."""
+        assert get_data_dir() == Path.home() / ".lynx"
+        monkeypatch.setenv("LYNX_DATA_DIR", str(tmp_path))
         assert get_data_dir() == tmp_path
 
-    def test_explicit_config_overrides_env(self, tmp_path):
+    def test_explicit_config_overrides_env(self, tmp_path, monkeypatch):
         """Explicit config() should override env var."""
         env_path = tmp_path / "env"
         explicit_path = tmp_path / "explicit"
-        os.environ["LYNX_DATA_DIR"] = str(env_path)
+        monkeypatch.setenv("LYNX_DATA_DIR", str(env_path))
         config(data_dir=explicit_path)
         assert get_data_dir() == explicit_path
 
@@ -43,3 +55,57 @@ class TestConfig:
         result = ensure_data_dir()
         assert result.exists()
         assert result == test_dir
+
+    def test_config_context_manager_restores_previous(self, tmp_path):
+        """with config(...) should only apply inside the block."""
+        outer = tmp_path / "outer"
+        inner = tmp_path / "inner"
+        config(data_dir=outer)
+
+        with config(data_dir=inner) as cfg:
+            assert cfg["data_dir"] == str(inner)
+            assert get_data_dir() == inner
+
+        assert get_data_dir() == outer
+
+    def test_config_context_manager_nested(self, tmp_path):
+        """Nested with blocks should unwind in order."""
+        with config(data_dir=tmp_path / "a"):
+            with config(data_dir=tmp_path / "b"):
+                assert get_data_dir() == tmp_path / "b"
+            assert get_data_dir() == tmp_path / "a"
+
+        assert get_data_dir() == Path.home() / ".lynx"
+
+    def test_plain_config_inside_block_is_scoped(self, tmp_path):
+        """A plain config() call inside a with block ends with the block."""
+        with config(data_dir=tmp_path / "a"):
+            config(data_dir=tmp_path / "b")
+            assert get_data_dir() == tmp_path / "b"
+
+        assert get_data_dir() == Path.home() / ".lynx"
+
+    def test_config_context_manager_is_context_local(self, tmp_path):
+        """A with-block override should not leak into other threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        config(data_dir=tmp_path / "global")
+
+        with config(data_dir=tmp_path / "local"):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                other_thread = pool.submit(get_data_dir).result()
+            assert get_data_dir() == tmp_path / "local"
+
+        assert other_thread == tmp_path / "global"
+
+    def test_parquet_compression_default_and_override(self):
+        """parquet_compression defaults to snappy and accepts None."""
+        from lynx.config import get_parquet_compression
+
+        assert get_parquet_compression() == "snappy"
+
+        with config(parquet_compression=None) as cfg:
+            assert cfg["parquet_compression"] is None
+            assert get_parquet_compression() is None
+
+        assert get_parquet_compression() == "snappy"
@@ -1,17 +1,21 @@
 """Tests for price data caching."""
 
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
 
 from lynx.data.cache import (
     fetch_prices_with_cache,
     get_cache_dir,
     get_cache_path,
     load_from_cache,
+    load_many_from_cache,
     save_to_cache,
+    validate_symbols_with_cache,
 )
+from lynx.data.yahoo import ValidationResult
 
 
 class TestCacheDir:
@@ -25,10 +29,12 @@ class TestCacheDir:
             assert cache_dir == tmp_path / ".lynx" / "cache" / "prices"
 
     def test_get_cache_path(self, tmp_path):
-        """Cache path should be based on symbol."""
+        """Cache path should be the symbol's dataset partition."""
         with patch("lynx.data.cache.Path.home", return_value=tmp_path):
             path = get_cache_path("2330.TW")
-            assert path.name == "2330.TW.parquet"
+            assert path.parent.name == "symbol=2330.TW"
+            assert path.suffix == ".feather"
+            assert path.parent.parent == get_cache_dir()
 
 
 class TestCacheOperations:
@@ -52,6 +58,58 @@ class TestCacheOperations:
             )
             pd.testing.assert_frame_equal(expected, loaded, check_freq=False)
 
+    def test_failed_save_keeps_previous_cache(self, tmp_path):
+        """A write that fails part-way should leave the old file and no temp files."""
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            df = pd.DataFrame(
+                {"close": [100.0, 101.0]},
+                index=pd.date_range("2024-01-01", periods=2),
+            )
+            save_to_cache("AAPL", df)
+
+            with (
+                patch("lynx.data.cache.feather.write_feather", side_effect=OSError("disk full")),
+                pytest.raises(OSError),
+            ):
+                save_to_cache("AAPL", df * 2)
+
+            path = get_cache_path("AAPL")
+            assert list(path.parent.iterdir()) == [path]
+            assert load_from_cache("AAPL")["AAPL"].tolist() == [100.0, 101.0]
+
+    def test_load_many_reads_only_requested_symbols(self, tmp_path):
+        """One scan should return each requested symbol's own rows."""
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            save_to_cache("AAPL", pd.DataFrame(
+                {"AAPL": [100.0, 101.0]}, index=pd.date_range("2024-01-01", periods=2)
+            ))
+            save_to_cache("^TWII", pd.DataFrame(
+                {"close": [17000.0]}, index=pd.date_range("2024-01-03", periods=1)
+            ))
+            save_to_cache("MSFT", pd.DataFrame(
+                {"MSFT": [400.0]}, index=pd.date_range("2024-01-01", periods=1)
+            ))
+
+            loaded = load_many_from_cache(["AAPL", "^TWII", "MISSING"])
+
+            assert set(loaded) == {"AAPL", "^TWII"}
+            assert loaded["AAPL"]["AAPL"].tolist() == [100.0, 101.0]
+            assert list(loaded["^TWII"].columns) == ["^TWII"]
+            assert loaded["^TWII"].index.tolist() == [pd.Timestamp("2024-01-03")]
+
+    def test_load_many_keeps_percent_in_symbol(self, tmp_path):
+        """A "%" in a symbol should not be URI-decoded when read back."""
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            for symbol in ["X%20Y", "2330.TW"]:
+                save_to_cache(symbol, pd.DataFrame(
+                    {"close": [10.0]}, index=pd.date_range("2024-01-01", periods=1)
+                ))
+
+            loaded = load_many_from_cache(["X%20Y", "2330.TW"])
+
+            assert set(loaded) == {"X%20Y", "2330.TW"}
+            assert list(loaded["X%20Y"].columns) == ["X%20Y"]
+
     def test_load_nonexistent_cache_returns_none(self, tmp_path):
         """Loading non-existent cache should return None."""
         with patch("lynx.data.cache.Path.home", return_value=tmp_path):
@@ -92,7 +150,7 @@ class TestFetchWithCache:
             )
             save_to_cache("AAPL", cached_df)
 
-            fetch_prices_with_cache(
+            result = fetch_prices_with_cache(
                 symbols=["AAPL"],
                 start_date=date(2024, 1, 1),
                 end_date=date(2024, 1, 2),
@@ -100,6 +158,7 @@ class TestFetchWithCache:
 
             # Should not call API since cache covers the range
             mock_fetch.assert_not_called()
+            pd.testing.assert_frame_equal(result, cached_df, check_freq=False)
 
     @patch("lynx.data.cache.fetch_adjusted_prices")
     def test_fetches_missing_dates(self, mock_fetch, tmp_path):
@@ -127,3 +186,60 @@ class TestFetchWithCache:
 
             # Should have called API for missing dates
             mock_fetch.assert_called_once()
+
+    @patch("lynx.data.cache.fetch_adjusted_prices")
+    def test_mixed_hits_fetch_missing_symbols_once(self, mock_fetch, tmp_path):
+        """Covered symbols come from cache; the rest share one download."""
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            dates = pd.date_range("2024-01-01", periods=3)
+            save_to_cache("AAPL", pd.DataFrame({"AAPL": [1.0, 2.0, 3.0]}, index=dates))
+            save_to_cache("MSFT", pd.DataFrame({"MSFT": [10.0]}, index=dates[:1]))
+            mock_fetch.return_value = pd.DataFrame(
+                {"MSFT": [11.0, 12.0], "NVDA": [20.0, 21.0]}, index=dates[1:]
+            )
+
+            result = fetch_prices_with_cache(
+                symbols=["NVDA", "AAPL", "MSFT"],
+                start_date=date(2024, 1, 2),
+                end_date=date(2024, 1, 3),
+            )
+
+            mock_fetch.assert_called_once()
+            assert mock_fetch.call_args.kwargs["symbols"] == ["NVDA", "MSFT"]
+            assert list(result.columns) == ["AAPL", "NVDA", "MSFT"]
+            assert result["AAPL"].tolist() == [2.0, 3.0]
+            assert load_from_cache("MSFT")["MSFT"].tolist() == [10.0, 11.0, 12.0]
+
+
+class TestValidateSymbolsWithCache:
+    """Tests for cached symbol validation."""
+
+    @patch("lynx.data.cache.validate_symbols")
+    def test_reuses_successful_lookups(self, mock_validate, tmp_path):
+        """Confirmed symbols are not looked up again; failed ones are."""
+        mock_validate.return_value = ValidationResult(
+            valid_symbols=["AAPL"],
+            invalid_symbols=["BAD"],
+            errors={"BAD": "Symbol not found or no market data"},
+        )
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            first = validate_symbols_with_cache(["BAD", "AAPL"])
+            second = validate_symbols_with_cache(["BAD", "AAPL"])
+
+        assert mock_validate.call_args_list[0].args == (["BAD", "AAPL"],)
+        assert mock_validate.call_args_list[1].args == (["BAD"],)
+        for result in (first, second):
+            assert result.valid_symbols == ["AAPL"]
+            assert result.invalid_symbols == ["BAD"]
+            assert "BAD" in result.errors
+
+    @patch("lynx.data.cache.validate_symbols")
+    def test_expired_lookups_are_repeated(self, mock_validate, tmp_path):
+        """Lookups older than the TTL are checked again."""
+        mock_validate.return_value = ValidationResult(valid_symbols=["AAPL"])
+        with patch("lynx.data.cache.Path.home", return_value=tmp_path):
+            validate_symbols_with_cache(["AAPL"])
+            result = validate_symbols_with_cache(["AAPL"], ttl=timedelta(0))
+
+        assert mock_validate.call_count == 2
+        assert result.valid_symbols == ["AAPL"]
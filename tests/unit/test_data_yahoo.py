@@ -1,5 +1,6 @@
 """Tests for Yahoo Finance data fetching."""
 
+from dataclasses import dataclass, field
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +11,22 @@ from lynx.data.exceptions import DataFetchError
 from lynx.data.yahoo import fetch_adjusted_prices, validate_symbols
 
 
+@dataclass
+class StubClient:
+    """YahooClient serving canned data; symbols in ``failing`` raise on lookup."""
+
+    prices: pd.DataFrame | None = None
+    failing: set[str] = field(default_factory=set)
+
+    def info(self, symbol):
+        if symbol in self.failing:
+            raise RuntimeError("boom")
+        return {"symbol": symbol}
+
+    def download(self, symbols, start_date, end_date):
+        return self.prices
+
+
 class TestValidateSymbols:
     """Tests for symbol validation."""
 
@@ -76,6 +93,16 @@ class TestValidateSymbols:
         assert result.valid_symbols == ["AAPL"]
         assert result.invalid_symbols == ["INVALID"]
 
+    def test_many_symbols_keep_input_order(self):
+        """Concurrent lookups should still report symbols in input order."""
+        symbols = [f"S{i}" for i in range(20)]
+        client = StubClient(failing=set(symbols[::3]))
+
+        result = validate_symbols(symbols, client=client)
+        assert result.invalid_symbols == symbols[::3]
+        assert result.valid_symbols == [s for s in symbols if s not in symbols[::3]]
+        assert result.errors == dict.fromkeys(symbols[::3], "boom")
+
 
 class TestFetchAdjustedPrices:
     """Tests for price fetching."""
@@ -139,6 +166,44 @@ class TestFetchAdjustedPrices:
         assert "AAPL" in result.columns
         assert "MSFT" in result.columns
 
+    @patch("lynx.data.yahoo.yf.download")
+    def test_fetch_single_symbol_multiindex(self, mock_download):
+        """Newer yfinance returns (field, symbol) columns even for one symbol."""
+        mock_df = pd.DataFrame(
+            {
+                ("Adj Close", "AAPL"): [100.0, 101.0],
+                ("Close", "AAPL"): [110.0, 111.0],
+            },
+            index=pd.date_range("2024-01-01", periods=2),
+        )
+        mock_df.columns = pd.MultiIndex.from_tuples(mock_df.columns)
+        mock_download.return_value = mock_df
+
+        result = fetch_adjusted_prices(
+            symbols=["AAPL"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 2),
+        )
+
+        assert list(result.columns) == ["AAPL"]
+        assert result["AAPL"].tolist() == [100.0, 101.0]
+
+    def test_fetch_with_client(self):
+        """An injected client replaces the yfinance download."""
+        prices = pd.DataFrame(
+            {"Adj Close": [100.0, 101.0]},
+            index=pd.date_range("2024-01-01", periods=2),
+        )
+
+        result = fetch_adjusted_prices(
+            symbols=["AAPL"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 2),
+            client=StubClient(prices=prices),
+        )
+
+        assert result["AAPL"].tolist() == [100.0, 101.0]
+
     @patch("lynx.data.yahoo.yf.download")
     def test_fetch_failure_raises_error(self, mock_download):
         """Network failure should raise DataFetchError."""
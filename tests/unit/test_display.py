@@ -86,6 +86,29 @@ class TestStatsDisplay:
 
         assert hasattr(result, "data")
 
+    def test_stats_reuses_metrics_until_trades_change(self, sample_trades_df, monkeypatch):
+        """Test that stats() recalculates metrics only when trades are replaced."""
+        import lynx.metrics
+        from lynx.run import Run
+
+        calls = []
+        calculate_all = lynx.metrics.calculate_all
+
+        def counting_calculate_all(df):
+            calls.append(df)
+            return calculate_all(df)
+
+        monkeypatch.setattr(lynx.metrics, "calculate_all", counting_calculate_all)
+
+        run = Run("test_strategy").trades(sample_trades_df)
+        run.stats()
+        run.stats()
+        assert len(calls) == 1
+
+        run.trades(sample_trades_df.iloc[:2])
+        run.stats()
+        assert len(calls) == 2
+
 
 class TestPlotDisplay:
     """Test run.plot() method for equity curve visualization."""
@@ -184,6 +207,15 @@ class TestPlotDisplay:
         expected_final = 1.0 + metrics["total_return"]
         assert np.isclose(equity_values[-1], expected_final, rtol=0.01)
 
+    def test_plot_uses_webgl_trace(self, sample_trades_df):
+        """Test that the equity curve is drawn with a WebGL trace."""
+        from lynx.run import Run
+
+        fig = Run("test_strategy").trades(sample_trades_df).plot()
+
+        assert fig.data[0].type == "scattergl"
+        assert fig.layout.uirevision == "equity"
+
 
 class TestCompareDisplay:
     """Test run.compare(other_run) method for comparing runs."""
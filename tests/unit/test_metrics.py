@@ -1,4 +1,5 @@
 """Unit tests for metrics calculations."""
+import math
 from datetime import datetime
 
 import pandas as pd
@@ -17,7 +18,7 @@ from lynx.metrics import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_trades():
     """Create sample trades DataFrame for testing."""
     return pd.DataFrame({
@@ -39,7 +40,7 @@ def sample_trades():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def winning_trades():
     """Create trades with all winners."""
     return pd.DataFrame({
@@ -49,7 +50,7 @@ def winning_trades():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def losing_trades():
     """Create trades with all losers."""
     return pd.DataFrame({
@@ -59,7 +60,7 @@ def losing_trades():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_trades():
     """Create empty trades DataFrame."""
     return pd.DataFrame({
@@ -69,27 +70,18 @@ def empty_trades():
     })
 
 
-def test_total_return(sample_trades):
-    """Test total return calculation."""
-    result = total_return(sample_trades)
-    # (1.05 * 0.98 * 1.03 * 0.99 * 1.04) - 1
-    expected = (1.05 * 0.98 * 1.03 * 0.99 * 1.04) - 1
-    assert pytest.approx(result, rel=1e-6) == expected
-
-
-def test_total_return_all_winners(winning_trades):
-    """Test total return with all winning trades."""
-    result = total_return(winning_trades)
-    expected = (1.10 * 1.05) - 1
-    assert pytest.approx(result, rel=1e-6) == expected
-
-
-def test_total_return_all_losers(losing_trades):
-    """Test total return with all losing trades."""
-    result = total_return(losing_trades)
-    expected = (0.95 * 0.97) - 1
-    assert result < 0
-    assert pytest.approx(result, rel=1e-6) == expected
+@pytest.mark.parametrize(
+    ("trades_fixture", "expected"),
+    [
+        ("sample_trades", (1.05 * 0.98 * 1.03 * 0.99 * 1.04) - 1),
+        ("winning_trades", (1.10 * 1.05) - 1),
+        ("losing_trades", (0.95 * 0.97) - 1),
+    ],
+)
+def test_total_return(request, trades_fixture, expected):
+    """Test total return compounds mixed, all-winning and all-losing trades."""
+    result = total_return(request.getfixturevalue(trades_fixture))
+    assert math.isclose(result, expected, rel_tol=1e-6)
 
 
 def test_annualized_return(sample_trades):
@@ -101,7 +93,7 @@ def test_annualized_return(sample_trades):
     days = (last_exit - first_entry).days
     years = days / 365.0
     expected = (1 + total_ret) ** (1 / years) - 1
-    assert pytest.approx(result, rel=1e-6) == expected
+    assert math.isclose(result, expected, rel_tol=1e-6)
 
 
 def test_annualized_return_short_period():
@@ -153,6 +145,19 @@ def test_sharpe_ratio_no_volatility():
     assert result == 0.0
 
 
+def test_sharpe_ratio_skips_missing_returns(sample_trades):
+    """Test that a NaN return is left out of the Sharpe ratio, not propagated."""
+    trades = pd.DataFrame({
+        "entry_date": [*sample_trades["entry_date"], pd.NaT],
+        "exit_date": [*sample_trades["exit_date"], pd.NaT],
+        "return": [*sample_trades["return"], float("nan")],
+    })
+
+    expected = sharpe_ratio(sample_trades)
+    assert math.isclose(sharpe_ratio(trades), expected)
+    assert math.isclose(calculate_all(trades)["sharpe_ratio"], expected)
+
+
 def test_max_drawdown(sample_trades):
     """Test maximum drawdown calculation."""
     result = max_drawdown(sample_trades)
@@ -187,45 +192,33 @@ def test_max_drawdown_steep_decline():
     assert result < -0.20  # Should capture the decline
 
 
-def test_win_rate(sample_trades):
-    """Test win rate calculation."""
-    result = win_rate(sample_trades)
-    # 3 wins out of 5 trades = 0.6
-    expected = 3 / 5
-    assert pytest.approx(result, rel=1e-6) == expected
-
-
-def test_win_rate_all_winners(winning_trades):
-    """Test win rate with all winning trades."""
-    result = win_rate(winning_trades)
-    assert result == 1.0
-
-
-def test_win_rate_all_losers(losing_trades):
-    """Test win rate with all losing trades."""
-    result = win_rate(losing_trades)
-    assert result == 0.0
-
-
-def test_profit_factor(sample_trades):
-    """Test profit factor calculation."""
-    result = profit_factor(sample_trades)
-    gross_profit = 0.05 + 0.03 + 0.04  # 0.12
-    gross_loss = abs(-0.02 + -0.01)  # 0.03
-    expected = gross_profit / gross_loss
-    assert pytest.approx(result, rel=1e-6) == expected
-
-
-def test_profit_factor_all_winners(winning_trades):
-    """Test profit factor with all winning trades."""
-    result = profit_factor(winning_trades)
-    assert result == float("inf")
-
-
-def test_profit_factor_all_losers(losing_trades):
-    """Test profit factor with all losing trades."""
-    result = profit_factor(losing_trades)
-    assert result == 0.0
+@pytest.mark.parametrize(
+    ("trades_fixture", "expected"),
+    [
+        ("sample_trades", 3 / 5),  # 3 wins out of 5 trades
+        ("winning_trades", 1.0),
+        ("losing_trades", 0.0),
+    ],
+)
+def test_win_rate(request, trades_fixture, expected):
+    """Test win rate for mixed, all-winning and all-losing trades."""
+    result = win_rate(request.getfixturevalue(trades_fixture))
+    assert math.isclose(result, expected, rel_tol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("trades_fixture", "expected"),
+    [
+        # gross profit 0.05 + 0.03 + 0.04 over gross loss |-0.02 + -0.01|
+        ("sample_trades", (0.05 + 0.03 + 0.04) / abs(-0.02 + -0.01)),
+        ("winning_trades", float("inf")),
+        ("losing_trades", 0.0),
+    ],
+)
+def test_profit_factor(request, trades_fixture, expected):
+    """Test profit factor for mixed, all-winning and all-losing trades."""
+    result = profit_factor(request.getfixturevalue(trades_fixture))
+    assert math.isclose(result, expected, rel_tol=1e-6)
 
 
 def test_num_trades(sample_trades):
@@ -246,7 +239,7 @@ def test_avg_trade_duration(sample_trades):
         (datetime(2024, 5, 8) - datetime(2024, 5, 1)).days,
     ]
     expected = sum(durations) / len(durations)
-    assert pytest.approx(result, rel=1e-6) == expected
+    assert math.isclose(result, expected, rel_tol=1e-6)
 
 
 def test_calculate_all_metrics(sample_trades):
@@ -267,14 +260,22 @@ def test_calculate_all_metrics(sample_trades):
     assert set(result.keys()) == expected_keys
 
     # Check values match individual calculations
-    assert pytest.approx(result["total_return"], rel=1e-6) == total_return(sample_trades)
-    assert pytest.approx(result["annualized_return"], rel=1e-6) == annualized_return(sample_trades)
-    assert pytest.approx(result["sharpe_ratio"], rel=1e-6) == sharpe_ratio(sample_trades)
-    assert pytest.approx(result["max_drawdown"], rel=1e-6) == max_drawdown(sample_trades)
-    assert pytest.approx(result["win_rate"], rel=1e-6) == win_rate(sample_trades)
-    assert pytest.approx(result["profit_factor"], rel=1e-6) == profit_factor(sample_trades)
+    assert math.isclose(result["total_return"], total_return(sample_trades), rel_tol=1e-6)
+    assert math.isclose(result["annualized_return"], annualized_return(sample_trades), rel_tol=1e-6)
+    assert math.isclose(result["sharpe_ratio"], sharpe_ratio(sample_trades), rel_tol=1e-6)
+    assert math.isclose(result["max_drawdown"], max_drawdown(sample_trades), rel_tol=1e-6)
+    assert math.isclose(result["win_rate"], win_rate(sample_trades), rel_tol=1e-6)
+    assert math.isclose(result["profit_factor"], profit_factor(sample_trades), rel_tol=1e-6)
     assert result["num_trades"] == num_trades(sample_trades)
-    assert pytest.approx(result["avg_trade_duration_days"], rel=1e-6) == avg_trade_duration(sample_trades)
+    assert math.isclose(result["avg_trade_duration_days"], avg_trade_duration(sample_trades), rel_tol=1e-6)
+
+
+def test_calculate_all_unsorted_trades(sample_trades):
+    """Test calculate_all on trades not in entry-date order."""
+    shuffled = sample_trades.iloc[[3, 0, 4, 2, 1]].reset_index(drop=True)
+
+    assert calculate_all(shuffled) == pytest.approx(calculate_all(sample_trades), rel=1e-12)
+    assert calculate_all(shuffled)["max_drawdown"] == pytest.approx(max_drawdown(sample_trades))
 
 
 def test_empty_trades(empty_trades):
@@ -1,60 +1,71 @@
 """Unit tests for Run class."""
 
-from datetime import datetime
+import itertools
+import re
+from datetime import datetime, timedelta
 
 import pandas as pd
 import pytest
 
-from lynx.exceptions import ValidationError
+import lynx
+import lynx.metrics
+from lynx.config import get_data_dir
+from lynx.exceptions import RunNotFoundError, ValidationError
+from lynx.run import Run, RunSummary, _generate_run_id, _generate_run_ids, _validate_trades
+from lynx.storage import parquet, sqlite
 
+# Format: {strategy}_{YYYYMMDD_HHMMSS}_{4-char-random}
+_RUN_ID_RE = re.compile(r"^(?P<strategy>.+)_(?P<date>\d{8})_(?P<time>\d{6})_(?P<suffix>[a-z0-9]{4})$")
 
-class TestTradesValidation:
-    """Test trades DataFrame validation."""
 
-    def test_validate_trades_valid_df(self, sample_trades_df):
-        """Valid trades DataFrame should pass validation."""
-        from lynx.run import _validate_trades
+def _count_artifact_rows(run_id: str) -> int:
+    """Count a run's rows in the artifacts table without loading them."""
+    conn = sqlite.get_connection()
+    count = conn.execute("SELECT COUNT(*) FROM artifacts WHERE run_id = ?", (run_id,)).fetchone()[0]
+    conn.close()
+    return count
 
-        # Should not raise any exception
-        _validate_trades(sample_trades_df)
 
-    def test_validate_trades_missing_column(self, sample_trades_df):
-        """Missing required column should raise ValidationError."""
-        from lynx.run import _validate_trades
+@pytest.fixture
+def ticking_clock(monkeypatch):
+    """Make lynx.run's clock advance one second on every reading."""
+    ticks = itertools.count()
 
-        # Remove a required column
-        invalid_df = sample_trades_df.drop(columns=["symbol"])
+    class TickingDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2024, 1, 1) + timedelta(seconds=next(ticks))
 
-        with pytest.raises(ValidationError) as exc_info:
-            _validate_trades(invalid_df)
+    monkeypatch.setattr("lynx.run.datetime", TickingDatetime)
 
-        assert "missing required columns" in str(exc_info.value).lower()
-        assert "symbol" in str(exc_info.value)
 
-    def test_validate_trades_multiple_missing_columns(self, sample_trades_df):
-        """Multiple missing columns should be reported."""
-        from lynx.run import _validate_trades
+class TestTradesValidation:
+    """Test trades DataFrame validation."""
 
-        invalid_df = sample_trades_df.drop(columns=["symbol", "entry_date"])
+    def test_validate_trades_valid_df(self, sample_trades_df):
+        """Valid trades DataFrame should pass validation."""
+        # Should not raise any exception
+        _validate_trades(sample_trades_df)
+
+    @pytest.mark.parametrize("missing", [["symbol"], ["symbol", "entry_date"]])
+    def test_validate_trades_missing_columns(self, sample_trades_df, missing):
+        """Every missing required column should be reported in a ValidationError."""
+        invalid_df = sample_trades_df.drop(columns=missing)
 
         with pytest.raises(ValidationError) as exc_info:
             _validate_trades(invalid_df)
 
         error_msg = str(exc_info.value).lower()
-        assert "symbol" in error_msg
-        assert "entry_date" in error_msg
+        assert "missing required columns" in error_msg
+        assert all(column in error_msg for column in missing)
 
     def test_validate_trades_empty_df(self, empty_trades_df):
         """Empty DataFrame with correct schema should pass."""
-        from lynx.run import _validate_trades
-
         # Should not raise exception
         _validate_trades(empty_trades_df)
 
     def test_validate_trades_not_dataframe(self):
         """Non-DataFrame input should raise ValidationError."""
-        from lynx.run import _validate_trades
-
         with pytest.raises(ValidationError) as exc_info:
             _validate_trades([1, 2, 3])  # type: ignore
 
@@ -62,8 +73,6 @@ class TestTradesValidation:
 
     def test_validate_trades_extra_columns_allowed(self, sample_trades_df):
         """Extra columns should be allowed."""
-        from lynx.run import _validate_trades
-
         df_with_extra = sample_trades_df.copy()
         df_with_extra["extra_column"] = "extra_data"
 
@@ -74,49 +83,30 @@ class TestTradesValidation:
 class TestRunIDGeneration:
     """Test Run ID generation."""
 
-    def test_generate_run_id_format(self):
-        """Run ID should match the expected format."""
-        import re
-
-        from lynx.run import _generate_run_id
-
-        run_id = _generate_run_id("my_strategy")
+    @pytest.mark.parametrize("strategy", ["my_strategy", "margin_transactions"])
+    def test_generate_run_id(self, strategy):
+        """Run ID should be the strategy name, current timestamp and a random suffix."""
+        now = datetime.now()
+        run_id = _generate_run_id(strategy)
 
-        # Format: {strategy}_{YYYYMMDD_HHMMSS}_{4-char-random}
-        pattern = r"^my_strategy_\d{8}_\d{6}_[a-z0-9]{4}$"
-        assert re.match(pattern, run_id), f"Invalid run_id format: {run_id}"
+        match = _RUN_ID_RE.match(run_id)
+        assert match, f"Invalid run_id format: {run_id}"
+        assert match["strategy"] == strategy
+        assert match["date"] == now.strftime("%Y%m%d")
 
     def test_generate_run_id_uniqueness(self):
-        """Multiple calls should generate unique IDs."""
-        from lynx.run import _generate_run_id
-
-        ids = [_generate_run_id("test") for _ in range(100)]
+        """A batch of IDs for one strategy should be unique."""
+        ids = _generate_run_ids(["test"] * 100)
         assert len(set(ids)) == 100, "Run IDs should be unique"
 
-    def test_generate_run_id_timestamp(self):
-        """Run ID should contain current timestamp."""
-        from datetime import datetime
-
-        from lynx.run import _generate_run_id
-
-        now = datetime.now()
-        run_id = _generate_run_id("test")
-
-        # Extract timestamp from run_id
-        parts = run_id.split("_")
-        date_part = parts[1]  # YYYYMMDD
-        time_part = parts[2]  # HHMMSS
-
-        # Check date matches (YYYYMMDD)
-        expected_date = now.strftime("%Y%m%d")
-        assert date_part == expected_date
+    def test_generate_run_ids_redraws_repeated_suffix(self, monkeypatch):
+        """A suffix that repeats an earlier ID in the batch is drawn again."""
+        suffixes = iter(["aaaa", "aaaa", "bbbb"])
+        monkeypatch.setattr("lynx.run._random_suffix", lambda: next(suffixes))
 
-    def test_generate_run_id_strategy_name(self):
-        """Run ID should start with strategy name."""
-        from lynx.run import _generate_run_id
+        ids = _generate_run_ids(["test", "test"])
 
-        run_id = _generate_run_id("margin_transactions")
-        assert run_id.startswith("margin_transactions_")
+        assert [run_id[-4:] for run_id in ids] == ["aaaa", "bbbb"]
 
 
 class TestRunClass:
@@ -124,8 +114,6 @@ class TestRunClass:
 
     def test_run_init_basic(self):
         """Test basic Run initialization."""
-        from lynx.run import Run
-
         run = Run("test_strategy")
         assert run.strategy_name == "test_strategy"
         assert run.id is None  # ID not set until save()
@@ -135,16 +123,12 @@ class TestRunClass:
 
     def test_run_init_with_params(self):
         """Test Run initialization with parameters."""
-        from lynx.run import Run
-
         params = {"threshold": 50, "lookback": 20}
         run = Run("test_strategy", params=params)
         assert run.params == params
 
     def test_run_init_with_tags_and_notes(self):
         """Test Run initialization with tags and notes."""
-        from lynx.run import Run
-
         tags = ["production", "v1.0"]
         notes = "Test run notes"
         run = Run("test_strategy", tags=tags, notes=notes)
@@ -154,8 +138,6 @@ class TestRunClass:
 
     def test_run_trades_method(self, sample_trades_df):
         """Test trades() method sets trades and returns self."""
-        from lynx.run import Run
-
         run = Run("test_strategy")
         result = run.trades(sample_trades_df)
 
@@ -167,10 +149,6 @@ class TestRunClass:
 
     def test_run_trades_validates_input(self):
         """Test trades() method validates input."""
-        import pandas as pd
-
-        from lynx.run import Run
-
         run = Run("test_strategy")
         invalid_df = pd.DataFrame({"invalid": [1, 2, 3]})
 
@@ -179,8 +157,6 @@ class TestRunClass:
 
     def test_run_signal_method(self, sample_signal_df):
         """Test signal() method adds signal artifact."""
-        from lynx.run import Run
-
         run = Run("test_strategy")
         result = run.signal("entry", sample_signal_df)
 
@@ -192,8 +168,6 @@ class TestRunClass:
 
     def test_run_data_method(self, sample_price_df):
         """Test data() method adds data artifact."""
-        from lynx.run import Run
-
         run = Run("test_strategy")
         result = run.data("close_price", sample_price_df)
 
@@ -205,8 +179,6 @@ class TestRunClass:
 
     def test_run_method_chaining(self, sample_trades_df, sample_signal_df):
         """Test that methods can be chained."""
-        from lynx.run import Run
-
         run = Run("test_strategy").trades(sample_trades_df).signal("entry", sample_signal_df)
 
         assert run._trades_df is not None
@@ -214,8 +186,6 @@ class TestRunClass:
 
     def test_run_save_without_trades_raises_error(self):
         """Test that save() without trades raises ValidationError."""
-        from lynx.run import Run
-
         run = Run("test_strategy")
 
         with pytest.raises(ValidationError) as exc_info:
@@ -223,65 +193,43 @@ class TestRunClass:
 
         assert "trades must be set" in str(exc_info.value).lower()
 
-    def test_run_get_trades_before_save(self, sample_trades_df):
+    def test_run_get_trades_before_save(self, sample_trades_df, assert_frame_hash_equal):
         """Test get_trades() returns in-memory data before save."""
-        from lynx.run import Run
-
         run = Run("test_strategy").trades(sample_trades_df)
         retrieved = run.get_trades()
 
-        pd.testing.assert_frame_equal(
+        assert_frame_hash_equal(
             retrieved.reset_index(drop=True),
             sample_trades_df.reset_index(drop=True),
         )
 
-    def test_run_get_signal_before_save(self, sample_trades_df, sample_signal_df):
-        """Test get_signal() returns in-memory data before save."""
-        from lynx.run import Run
-
-        run = Run("test_strategy").trades(sample_trades_df).signal("entry", sample_signal_df)
-        retrieved = run.get_signal("entry")
-
-        pd.testing.assert_frame_equal(retrieved, sample_signal_df)
-
-    def test_run_get_data_before_save(self, sample_trades_df, sample_price_df):
-        """Test get_data() returns in-memory data before save."""
-        from lynx.run import Run
-
-        run = Run("test_strategy").trades(sample_trades_df).data("close_price", sample_price_df)
-        retrieved = run.get_data("close_price")
+    @pytest.mark.parametrize(
+        ("kind", "fixture_name"),
+        [("signal", "sample_signal_df"), ("data", "sample_price_df")],
+    )
+    def test_run_get_artifact_before_save(self, request, sample_trades_df, kind, fixture_name):
+        """Test get_signal()/get_data() return in-memory data before save."""
+        df = request.getfixturevalue(fixture_name)
+        run = getattr(Run("test_strategy").trades(sample_trades_df), kind)("artifact", df)
+        retrieved = getattr(run, f"get_{kind}")("artifact")
 
-        pd.testing.assert_frame_equal(retrieved, sample_price_df)
+        pd.testing.assert_frame_equal(retrieved, df)
 
     def test_run_list_artifacts_before_save(self, sample_trades_df, sample_signal_df):
         """Test list_artifacts() returns in-memory artifacts before save."""
-        from lynx.run import Run
-
         run = Run("test_strategy").trades(sample_trades_df).signal("entry", sample_signal_df)
         artifacts = run.list_artifacts()
 
         assert "trades" in artifacts
         assert "entry" in artifacts
 
-    def test_run_get_nonexistent_signal_raises_error(self, sample_trades_df):
-        """Test get_signal() for non-existent signal raises error."""
-        from lynx.run import Run
-
+    @pytest.mark.parametrize("getter", ["get_signal", "get_data"])
+    def test_run_get_nonexistent_artifact_raises_error(self, sample_trades_df, getter):
+        """Test get_signal()/get_data() for a non-existent artifact raise an error."""
         run = Run("test_strategy").trades(sample_trades_df)
 
         with pytest.raises(ValidationError) as exc_info:
-            run.get_signal("nonexistent")
-
-        assert "not found" in str(exc_info.value).lower()
-
-    def test_run_get_nonexistent_data_raises_error(self, sample_trades_df):
-        """Test get_data() for non-existent data raises error."""
-        from lynx.run import Run
-
-        run = Run("test_strategy").trades(sample_trades_df)
-
-        with pytest.raises(ValidationError) as exc_info:
-            run.get_data("nonexistent")
+            getattr(run, getter)("nonexistent")
 
         assert "not found" in str(exc_info.value).lower()
 
@@ -291,8 +239,6 @@ class TestRunSummary:
 
     def test_runsummary_init(self):
         """Test RunSummary initialization."""
-        from lynx.run import RunSummary
-
         summary = RunSummary(
             id="test_strategy_20241214_153042_a7b2",
             strategy_name="test_strategy",
@@ -311,13 +257,10 @@ class TestRunSummary:
         assert summary.metrics == {"total_return": 0.25, "sharpe_ratio": 1.5}
         assert summary.tags == ["test", "v1"]
 
-    def test_runsummary_load(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("initialized_db")
+    def test_runsummary_load(self, sample_trades_df, assert_frame_hash_equal):
         """Test RunSummary.load() returns full Run object."""
-        from lynx.run import Run, RunSummary
-        from lynx.storage import sqlite
-
         # Create and save a run
-        sqlite.init_db()
         run = Run("test_strategy", params={"threshold": 50}, tags=["test"])
         run.trades(sample_trades_df).save()
 
@@ -338,35 +281,30 @@ class TestRunSummary:
         assert isinstance(loaded, Run)
         assert loaded.id == run.id
         assert loaded.strategy_name == run.strategy_name
-        pd.testing.assert_frame_equal(
+        assert_frame_hash_equal(
             loaded.get_trades().reset_index(drop=True),
             sample_trades_df.reset_index(drop=True),
         )
 
 
+@pytest.mark.usefixtures("initialized_db")
 class TestDataAccessAPI:
     """Test lynx.runs(), lynx.load(), and lynx.delete() functions."""
 
-    def test_runs_empty_database(self, temp_data_dir):
+    def test_runs_empty_database(self):
         """Test lynx.runs() returns empty list when no runs exist."""
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
         runs = lynx.runs()
 
         assert runs == []
 
-    def test_runs_returns_all_runs(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_runs_returns_all_runs(self, sample_trades_df):
         """Test lynx.runs() returns all saved runs."""
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         # Save multiple runs
-        run1 = lynx.log("strategy1", trades=sample_trades_df)
-        run2 = lynx.log("strategy2", trades=sample_trades_df)
+        run1, run2 = lynx.log_many([
+            {"name": "strategy1", "trades": sample_trades_df},
+            {"name": "strategy2", "trades": sample_trades_df},
+        ])
 
         # List all runs
         runs = lynx.runs()
@@ -376,17 +314,90 @@ class TestDataAccessAPI:
         assert run1.id in run_ids
         assert run2.id in run_ids
 
-    def test_runs_filter_by_strategy(self, temp_data_dir, sample_trades_df):
-        """Test lynx.runs() filters by strategy name."""
-        import lynx
-        from lynx.storage import sqlite
+    def test_log_many_saves_all_runs(self, sample_trades_df, sample_signal_df):
+        """Test lynx.log_many() saves every run with its artifacts."""
+        logged = lynx.log_many([
+            {"name": "strategy1", "trades": sample_trades_df, "params": {"window": 20}},
+            {"name": "strategy2", "trades": sample_trades_df, "entry_signal": sample_signal_df},
+        ])
+
+        assert [r.strategy_name for r in logged] == ["strategy1", "strategy2"]
+        assert {r.id for r in lynx.runs()} == {r.id for r in logged}
+        assert lynx.load(logged[0].id).params == {"window": 20}
+        assert "entry_signal" in lynx.load(logged[1].id).list_artifacts()
+
+    def test_log_many_rolls_back_on_failure(self, sample_trades_df, monkeypatch):
+        """Test lynx.log_many() keeps nothing when one run fails to save."""
+        real_save = parquet.save_artifact
+        calls = []
+
+        def failing_save(run_id, name, df):
+            calls.append(run_id)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return real_save(run_id, name, df)
+
+        monkeypatch.setattr(parquet, "save_artifact", failing_save)
+        with pytest.raises(OSError):
+            lynx.log_many([
+                {"name": "strategy1", "trades": sample_trades_df},
+                {"name": "strategy2", "trades": sample_trades_df},
+            ])
+
+        assert lynx.runs() == []
+        assert not (get_data_dir() / "artifacts" / calls[0]).exists()
+
+    def test_resave_keeps_stored_artifacts(self, sample_trades_df):
+        """Test that re-saving a stored run fails without overwriting its artifacts."""
+        import sqlite3
+
+        run = lynx.log("strategy1", trades=sample_trades_df)
+        stored_return = run.metrics["total_return"]
+        changed = sample_trades_df.assign(**{"return": -0.5})
+
+        run.trades(changed)
+        with pytest.raises(sqlite3.IntegrityError):
+            run.save()
 
-        sqlite.init_db()
+        loaded = lynx.load(run.id)
+        pd.testing.assert_series_equal(loaded.get_trades()["return"], sample_trades_df["return"])
+        assert loaded.metrics["total_return"] == stored_return
+
+    def test_id_collision_keeps_stored_run(
+        self, sample_trades_df, monkeypatch, assert_frame_hash_equal
+    ):
+        """Test that a save failing on a duplicate id leaves the stored run intact."""
+        import sqlite3
+
+        stored = lynx.log("strategy1", trades=sample_trades_df)
+        monkeypatch.setattr(lynx.run, "_generate_run_ids", lambda names: [stored.id])
+
+        clashing = Run("strategy1").trades(sample_trades_df.assign(**{"return": -0.5}))
+        with pytest.raises(sqlite3.IntegrityError):
+            clashing.save()
+
+        assert clashing.id is None
+        assert_frame_hash_equal(lynx.load(stored.id).get_trades(), sample_trades_df)
+
+    def test_log_without_metrics(self, sample_trades_df, monkeypatch):
+        """Test lynx.log(compute_metrics=False) skips the metrics calculation."""
+        def fail(trades):
+            raise AssertionError("metrics should not be calculated")
 
+        monkeypatch.setattr(lynx.metrics, "calculate_all", fail)
+        run = lynx.log("strategy1", trades=sample_trades_df, compute_metrics=False)
+
+        assert run.metrics == {}
+        assert lynx.load(run.id).metrics == {}
+
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_runs_filter_by_strategy(self, sample_trades_df):
+        """Test lynx.runs() filters by strategy name."""
         # Save runs with different strategies
-        run1 = lynx.log("strategy1", trades=sample_trades_df)
-        run2 = lynx.log("strategy2", trades=sample_trades_df)
-        run3 = lynx.log("strategy1", trades=sample_trades_df)
+        lynx.log_many([
+            {"name": name, "trades": sample_trades_df}
+            for name in ["strategy1", "strategy2", "strategy1"]
+        ])
 
         # Filter by strategy
         strategy1_runs = lynx.runs(strategy="strategy1")
@@ -395,36 +406,23 @@ class TestDataAccessAPI:
         for run in strategy1_runs:
             assert run.strategy_name == "strategy1"
 
-    def test_runs_limit(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_runs_limit(self, sample_trades_df):
         """Test lynx.runs() limits number of results."""
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         # Save multiple runs
-        for i in range(5):
-            lynx.log(f"strategy{i}", trades=sample_trades_df)
+        lynx.log_many([{"name": f"strategy{i}", "trades": sample_trades_df} for i in range(5)])
 
         # Limit results
         runs = lynx.runs(limit=3)
 
         assert len(runs) == 3
 
-    def test_runs_order_by_created_at_descending(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_runs_order_by_created_at_descending(self, sample_trades_df, ticking_clock):
         """Test lynx.runs() orders by created_at descending by default."""
-        import time
-
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
-        # Save runs with delays
+        # Each run gets a later created_at from the ticking clock
         run1 = lynx.log("strategy1", trades=sample_trades_df)
-        time.sleep(0.01)
         run2 = lynx.log("strategy2", trades=sample_trades_df)
-        time.sleep(0.01)
         run3 = lynx.log("strategy3", trades=sample_trades_df)
 
         # Default order should be descending by created_at
@@ -434,20 +432,12 @@ class TestDataAccessAPI:
         assert runs[1].id == run2.id
         assert runs[2].id == run1.id
 
-    def test_runs_order_by_created_at_ascending(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_runs_order_by_created_at_ascending(self, sample_trades_df, ticking_clock):
         """Test lynx.runs() can order by created_at ascending."""
-        import time
-
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
-        # Save runs with delays
+        # Each run gets a later created_at from the ticking clock
         run1 = lynx.log("strategy1", trades=sample_trades_df)
-        time.sleep(0.01)
         run2 = lynx.log("strategy2", trades=sample_trades_df)
-        time.sleep(0.01)
         run3 = lynx.log("strategy3", trades=sample_trades_df)
 
         # Order ascending
@@ -457,13 +447,8 @@ class TestDataAccessAPI:
         assert runs[1].id == run2.id
         assert runs[2].id == run3.id
 
-    def test_load_existing_run(self, temp_data_dir, sample_trades_df, sample_signal_df):
+    def test_load_existing_run(self, sample_trades_df, sample_signal_df, assert_frame_hash_equal):
         """Test lynx.load() loads a complete run."""
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         # Save a run with artifacts
         run = lynx.log(
             "test_strategy",
@@ -482,7 +467,7 @@ class TestDataAccessAPI:
         assert "total_return" in loaded.metrics
 
         # Verify trades loaded
-        pd.testing.assert_frame_equal(
+        assert_frame_hash_equal(
             loaded.get_trades().reset_index(drop=True),
             sample_trades_df.reset_index(drop=True),
         )
@@ -495,27 +480,40 @@ class TestDataAccessAPI:
             check_freq=False,  # Don't check index frequency
         )
 
-    def test_load_nonexistent_run_raises_error(self, temp_data_dir):
-        """Test lynx.load() raises RunNotFoundError for invalid ID."""
-        import lynx
-        from lynx.exceptions import RunNotFoundError
-        from lynx.storage import sqlite
+    def test_load_defers_artifact_reads(
+        self, sample_trades_df, sample_signal_df, monkeypatch
+    ):
+        """Test lynx.load() reads no Parquet files until an artifact is needed."""
+        run = lynx.log("test_strategy", trades=sample_trades_df, entry_signal=sample_signal_df)
 
-        sqlite.init_db()
+        reads = []
+        load_artifact = parquet.load_artifact
 
+        def counting_load_artifact(file_path, columns=None):
+            reads.append((file_path, columns))
+            return load_artifact(file_path, columns=columns)
+
+        monkeypatch.setattr(parquet, "load_artifact", counting_load_artifact)
+
+        loaded = lynx.load(run.id)
+        loaded.stats()
+        assert reads == []
+
+        # explain() reads just the requested symbol's column of each signal
+        timeline = loaded.explain("2330")
+        assert [columns for _, columns in reads] == [["2330"]]
+        assert timeline["entry_signal"].tolist() == sample_signal_df["2330"].tolist()
+
+    def test_load_nonexistent_run_raises_error(self):
+        """Test lynx.load() raises RunNotFoundError for invalid ID."""
         with pytest.raises(RunNotFoundError) as exc_info:
             lynx.load("nonexistent_run_id")
 
         assert "nonexistent_run_id" in str(exc_info.value)
 
-    def test_delete_existing_run(self, temp_data_dir, sample_trades_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_delete_existing_run(self, sample_trades_df):
         """Test lynx.delete() removes run from database and filesystem."""
-        import lynx
-        from lynx.config import get_data_dir
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         # Save a run
         run = lynx.log("test_strategy", trades=sample_trades_df)
         run_id = run.id
@@ -533,26 +531,16 @@ class TestDataAccessAPI:
         # Verify artifacts directory is deleted
         assert not artifacts_dir.exists()
 
-    def test_delete_nonexistent_run_raises_error(self, temp_data_dir):
+    def test_delete_nonexistent_run_raises_error(self):
         """Test lynx.delete() raises RunNotFoundError for invalid ID."""
-        import lynx
-        from lynx.exceptions import RunNotFoundError
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         with pytest.raises(RunNotFoundError) as exc_info:
             lynx.delete("nonexistent_run_id")
 
         assert "nonexistent_run_id" in str(exc_info.value)
 
-    def test_delete_cascades_to_artifacts(self, temp_data_dir, sample_trades_df, sample_signal_df):
+    @pytest.mark.usefixtures("skip_parquet_writes")
+    def test_delete_cascades_to_artifacts(self, sample_trades_df, sample_signal_df):
         """Test lynx.delete() cascades to all artifacts."""
-        import lynx
-        from lynx.storage import sqlite
-
-        sqlite.init_db()
-
         # Save a run with multiple artifacts
         run = lynx.log(
             "test_strategy",
@@ -562,12 +550,10 @@ class TestDataAccessAPI:
         run_id = run.id
 
         # Verify artifacts exist in database
-        artifacts = sqlite.get_artifacts(run_id)
-        assert len(artifacts) > 0
+        assert _count_artifact_rows(run_id) == 2
 
         # Delete the run
         lynx.delete(run_id)
 
         # Verify artifacts are deleted from database
-        artifacts = sqlite.get_artifacts(run_id)
-        assert len(artifacts) == 0
+        assert _count_artifact_rows(run_id) == 0
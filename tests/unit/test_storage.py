@@ -1,62 +1,106 @@
 """Tests for lynx storage layer."""
 
-import os
+import shutil
 from datetime import datetime
 
 import pandas as pd
 import pytest
 
-from lynx.config import config, reset_config
+from lynx.config import config
 from lynx.storage import delete_artifacts, init_db, load_artifact, save_artifact
 from lynx.storage.sqlite import (
     delete_run,
     get_artifacts,
+    get_db_path,
     get_run,
     insert_artifact,
+    insert_artifacts_bulk,
     insert_run,
+    insert_runs_bulk,
     list_runs,
+    transaction,
 )
 
 
 @pytest.fixture
-def temp_storage_dir(tmp_path):
-    """Create a temporary storage directory for tests."""
-    reset_config()
-    if "LYNX_DATA_DIR" in os.environ:
-        del os.environ["LYNX_DATA_DIR"]
-    config(data_dir=tmp_path)
-    init_db()
-    yield tmp_path
-    reset_config()
+def temp_storage_dir(tmp_path, db_template, monkeypatch):
+    """Create a temporary storage directory holding a copy of the template database."""
+    monkeypatch.delenv("LYNX_DATA_DIR", raising=False)
+    with config(data_dir=tmp_path):
+        shutil.copyfile(db_template, get_db_path())
+        yield tmp_path
 
 
 class TestSQLiteStorage:
     """Tests for SQLite storage operations."""
 
-    def test_init_db_creates_tables(self, temp_storage_dir):
+    def test_init_db_creates_tables(self, tmp_path):
         """Test that init_db creates the required tables."""
         from lynx.storage.sqlite import get_connection
 
-        conn = get_connection()
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        )
-        tables = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        with config(data_dir=tmp_path):
+            init_db()
+            conn = get_connection()
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+            )
+            tables = [row[0] for row in cursor.fetchall()]
+            conn.close()
 
         assert "runs" in tables
         assert "artifacts" in tables
 
-    def test_insert_run(self, temp_storage_dir):
-        """Test inserting a run record."""
+    def test_test_mode_pragmas(self, temp_storage_dir, monkeypatch):
+        """Test that LYNX_TEST=1 enables WAL and relaxed fsync."""
+        from lynx.storage.sqlite import get_connection
+
+        monkeypatch.setenv("LYNX_TEST", "1")
+        init_db()
+
+        conn = get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 0  # OFF
+
+    def test_default_pragmas_without_test_flag(self, temp_storage_dir, monkeypatch):
+        """Test that normal connections use WAL with synchronous=NORMAL."""
+        from lynx.storage.sqlite import get_connection
+
+        monkeypatch.delenv("LYNX_TEST", raising=False)
+        init_db()
+
+        conn = get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    @pytest.mark.parametrize(
+        "optional",
+        [
+            pytest.param(
+                {
+                    "params": {"threshold": 0.5, "window": 10},
+                    "tags": ["test", "experiment"],
+                    "notes": "Test run",
+                },
+                id="all-fields",
+            ),
+            pytest.param({}, id="required-only"),
+        ],
+    )
+    def test_insert_run(self, temp_storage_dir, optional):
+        """Test inserting a run record and retrieving it by ID."""
         run_id = "test_strategy_20241214_120000_abc"
         strategy_name = "test_strategy"
         created_at = datetime(2024, 12, 14, 12, 0, 0)
         updated_at = datetime(2024, 12, 14, 12, 30, 0)
-        params = {"threshold": 0.5, "window": 10}
         metrics = {"sharpe_ratio": 1.5, "total_return": 0.25}
-        tags = ["test", "experiment"]
-        notes = "Test run"
 
         insert_run(
             run_id=run_id,
@@ -64,9 +108,7 @@ class TestSQLiteStorage:
             created_at=created_at,
             updated_at=updated_at,
             metrics=metrics,
-            params=params,
-            tags=tags,
-            notes=notes,
+            **optional,
         )
 
         # Verify the run was inserted
@@ -76,31 +118,9 @@ class TestSQLiteStorage:
         assert run["strategy_name"] == strategy_name
         assert run["created_at"] == created_at
         assert run["updated_at"] == updated_at
-        assert run["params"] == params
         assert run["metrics"] == metrics
-        assert run["tags"] == tags
-        assert run["notes"] == notes
-
-    def test_get_run_by_id(self, temp_storage_dir):
-        """Test retrieving a run by ID."""
-        run_id = "test_strategy_20241214_120001_xyz"
-        strategy_name = "test_strategy"
-        created_at = datetime(2024, 12, 14, 12, 0, 1)
-        updated_at = datetime(2024, 12, 14, 12, 0, 1)
-        metrics = {"sharpe_ratio": 2.0}
-
-        insert_run(
-            run_id=run_id,
-            strategy_name=strategy_name,
-            created_at=created_at,
-            updated_at=updated_at,
-            metrics=metrics,
-        )
-
-        run = get_run(run_id)
-        assert run is not None
-        assert run["id"] == run_id
-        assert run["strategy_name"] == strategy_name
+        for field in ("params", "tags", "notes"):
+            assert run[field] == optional.get(field)
 
     def test_get_run_not_found(self, temp_storage_dir):
         """Test that get_run returns None for non-existent run."""
@@ -142,6 +162,77 @@ class TestSQLiteStorage:
         assert artifacts[0]["rows"] == 100
         assert len(artifacts[0]["columns"]) == 6
 
+    def test_insert_runs_bulk(self, temp_storage_dir):
+        """Test inserting several runs and their artifacts in one batch."""
+        created_at = datetime(2024, 12, 14, 12, 0, 0)
+        run_ids = [f"bulk_20241214_120000_{i:03d}" for i in range(3)]
+
+        insert_runs_bulk(
+            {
+                "run_id": run_id,
+                "strategy_name": "bulk",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "metrics": {"sharpe_ratio": float(i)},
+                "params": {"window": i} if i else None,
+            }
+            for i, run_id in enumerate(run_ids)
+        )
+        insert_artifacts_bulk(
+            {
+                "run_id": run_id,
+                "name": "trades",
+                "artifact_type": "trades",
+                "file_path": f"artifacts/{run_id}/trades.parquet",
+                "rows": 10,
+                "columns": ["symbol"],
+            }
+            for run_id in run_ids
+        )
+
+        runs = {run["id"]: run for run in list_runs(strategy="bulk")}
+        assert set(runs) == set(run_ids)
+        assert runs[run_ids[0]]["params"] is None
+        assert runs[run_ids[2]]["params"] == {"window": 2}
+        assert runs[run_ids[1]]["metrics"] == {"sharpe_ratio": 1.0}
+        assert all(len(get_artifacts(run_id)) == 1 for run_id in run_ids)
+
+    def test_transaction_rolls_back_on_error(self, temp_storage_dir):
+        """Test that an exception inside transaction() discards its writes."""
+        created_at = datetime(2024, 12, 14, 12, 0, 0)
+
+        with pytest.raises(RuntimeError), transaction() as conn:
+            insert_run(
+                run_id="tx_20241214_120000_abc",
+                strategy_name="tx",
+                created_at=created_at,
+                updated_at=created_at,
+                metrics={},
+                conn=conn,
+            )
+            raise RuntimeError("abort")
+
+        assert get_run("tx_20241214_120000_abc") is None
+
+    def test_insert_runs_bulk_is_atomic(self, temp_storage_dir):
+        """Test that a failing row leaves none of the batch behind."""
+        import sqlite3
+
+        created_at = datetime(2024, 12, 14, 12, 0, 0)
+        record = {
+            "run_id": "dup_20241214_120000_abc",
+            "strategy_name": "dup",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "metrics": {},
+        }
+        other = {**record, "run_id": "dup_20241214_120000_def"}
+
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_runs_bulk([other, record, record])
+
+        assert list_runs(strategy="dup") == []
+
     def test_get_artifacts_by_run_id(self, temp_storage_dir):
         """Test getting all artifacts for a run."""
         run_id = "test_strategy_20241214_120003_ghi"
@@ -150,33 +241,38 @@ class TestSQLiteStorage:
         updated_at = datetime(2024, 12, 14, 12, 0, 3)
         metrics = {"sharpe_ratio": 1.2}
 
-        # Insert run
-        insert_run(
-            run_id=run_id,
-            strategy_name=strategy_name,
-            created_at=created_at,
-            updated_at=updated_at,
-            metrics=metrics,
-        )
-
-        # Insert multiple artifacts
-        insert_artifact(
-            run_id=run_id,
-            name="trades",
-            artifact_type="trades",
-            file_path="artifacts/run/trades.parquet",
-            rows=50,
-            columns=["symbol", "entry_date"],
-        )
+        # Insert the run and multiple artifacts in one transaction
+        with transaction() as conn:
+            insert_run(
+                run_id=run_id,
+                strategy_name=strategy_name,
+                created_at=created_at,
+                updated_at=updated_at,
+                metrics=metrics,
+                conn=conn,
+            )
 
-        insert_artifact(
-            run_id=run_id,
-            name="signals",
-            artifact_type="signal",
-            file_path="artifacts/run/signals.parquet",
-            rows=100,
-            columns=["2330", "2317"],
-        )
+            insert_artifacts_bulk(
+                [
+                    {
+                        "run_id": run_id,
+                        "name": "trades",
+                        "artifact_type": "trades",
+                        "file_path": "artifacts/run/trades.parquet",
+                        "rows": 50,
+                        "columns": ["symbol", "entry_date"],
+                    },
+                    {
+                        "run_id": run_id,
+                        "name": "signals",
+                        "artifact_type": "signal",
+                        "file_path": "artifacts/run/signals.parquet",
+                        "rows": 100,
+                        "columns": ["2330", "2317"],
+                    },
+                ],
+                conn=conn,
+            )
 
         # Verify we get all artifacts
         artifacts = get_artifacts(run_id)
@@ -191,23 +287,26 @@ class TestSQLiteStorage:
         updated_at = datetime(2024, 12, 14, 12, 0, 4)
         metrics = {"sharpe_ratio": 1.8}
 
-        # Insert run and artifact
-        insert_run(
-            run_id=run_id,
-            strategy_name=strategy_name,
-            created_at=created_at,
-            updated_at=updated_at,
-            metrics=metrics,
-        )
+        # Insert run and artifact in one transaction
+        with transaction() as conn:
+            insert_run(
+                run_id=run_id,
+                strategy_name=strategy_name,
+                created_at=created_at,
+                updated_at=updated_at,
+                metrics=metrics,
+                conn=conn,
+            )
 
-        insert_artifact(
-            run_id=run_id,
-            name="trades",
-            artifact_type="trades",
-            file_path="artifacts/run/trades.parquet",
-            rows=75,
-            columns=["symbol"],
-        )
+            insert_artifact(
+                run_id=run_id,
+                name="trades",
+                artifact_type="trades",
+                file_path="artifacts/run/trades.parquet",
+                rows=75,
+                columns=["symbol"],
+                conn=conn,
+            )
 
         # Verify artifact exists
         artifacts = get_artifacts(run_id)
@@ -229,94 +328,74 @@ class TestSQLiteStorage:
         deleted = delete_run("nonexistent_run_id")
         assert deleted is False
 
-    def test_list_runs(self, temp_storage_dir):
-        """Test listing runs."""
-        # Insert multiple runs
-        for i in range(3):
-            run_id = f"test_strategy_2024121412000{i}_run{i}"
-            created_at = datetime(2024, 12, 14, 12, 0, i)
-            insert_run(
-                run_id=run_id,
-                strategy_name="test_strategy",
-                created_at=created_at,
-                updated_at=created_at,
-                metrics={"sharpe_ratio": float(i)},
-            )
 
+# (seconds past 12:00, strategy) in insertion order, deliberately not chronological
+_LISTED_RUNS = [
+    (2, "strategy_a"),
+    (0, "strategy_b"),
+    (4, "strategy_a"),
+    (1, "strategy_a"),
+    (3, "strategy_b"),
+]
+
+
+@pytest.fixture(scope="class")
+def listed_runs(tmp_path_factory, db_template):
+    """Database holding _LISTED_RUNS, shared by the read-only list_runs tests."""
+    data_dir = tmp_path_factory.mktemp("listed_runs")
+    with pytest.MonkeyPatch.context() as mp, config(data_dir=data_dir):
+        mp.delenv("LYNX_DATA_DIR", raising=False)
+        shutil.copyfile(db_template, get_db_path())
+        insert_runs_bulk([
+            {
+                "run_id": f"{strategy}_20241214_12000{second}_run{i}",
+                "strategy_name": strategy,
+                "created_at": datetime(2024, 12, 14, 12, 0, second),
+                "updated_at": datetime(2024, 12, 14, 12, 0, second),
+                "metrics": {"sharpe_ratio": float(i)},
+            }
+            for i, (second, strategy) in enumerate(_LISTED_RUNS)
+        ])
+        yield data_dir
+
+
+@pytest.mark.usefixtures("listed_runs")
+class TestListRuns:
+    """Tests for list_runs against one shared set of runs."""
+
+    def test_list_runs(self):
+        """Test listing runs."""
         runs = list_runs()
-        assert len(runs) == 3
+        assert len(runs) == len(_LISTED_RUNS)
 
-    def test_list_runs_filtered_by_strategy(self, temp_storage_dir):
+    def test_list_runs_filtered_by_strategy(self):
         """Test listing runs filtered by strategy."""
-        # Insert runs for different strategies
-        insert_run(
-            run_id="strategy_a_20241214_120000_a",
-            strategy_name="strategy_a",
-            created_at=datetime(2024, 12, 14, 12, 0, 0),
-            updated_at=datetime(2024, 12, 14, 12, 0, 0),
-            metrics={"sharpe_ratio": 1.0},
-        )
-
-        insert_run(
-            run_id="strategy_b_20241214_120001_b",
-            strategy_name="strategy_b",
-            created_at=datetime(2024, 12, 14, 12, 0, 1),
-            updated_at=datetime(2024, 12, 14, 12, 0, 1),
-            metrics={"sharpe_ratio": 2.0},
-        )
-
-        insert_run(
-            run_id="strategy_a_20241214_120002_c",
-            strategy_name="strategy_a",
-            created_at=datetime(2024, 12, 14, 12, 0, 2),
-            updated_at=datetime(2024, 12, 14, 12, 0, 2),
-            metrics={"sharpe_ratio": 1.5},
-        )
-
-        # Filter by strategy_a
         runs = list_runs(strategy="strategy_a")
-        assert len(runs) == 2
+        assert len(runs) == 3
         assert all(r["strategy_name"] == "strategy_a" for r in runs)
 
-    def test_list_runs_with_limit(self, temp_storage_dir):
+    def test_list_runs_with_limit(self):
         """Test listing runs with limit."""
-        # Insert multiple runs
-        for i in range(5):
-            created_at = datetime(2024, 12, 14, 12, 0, i)
-            insert_run(
-                run_id=f"test_strategy_2024121412000{i}_lim{i}",
-                strategy_name="test_strategy",
-                created_at=created_at,
-                updated_at=created_at,
-                metrics={"sharpe_ratio": float(i)},
-            )
-
         runs = list_runs(limit=3)
         assert len(runs) == 3
 
-    def test_list_runs_ordered(self, temp_storage_dir):
+    def test_list_runs_ordered(self):
         """Test that runs are ordered by updated_at descending by default."""
-        # Insert runs in non-chronological order
-        times = [
-            datetime(2024, 12, 14, 12, 0, 2),
-            datetime(2024, 12, 14, 12, 0, 0),
-            datetime(2024, 12, 14, 12, 0, 1),
+        runs = list_runs()
+        # Should be ordered by updated_at, newest to oldest
+        assert [r["updated_at"] for r in runs] == [
+            datetime(2024, 12, 14, 12, 0, second) for second in range(4, -1, -1)
         ]
 
-        for i, created_at in enumerate(times):
-            insert_run(
-                run_id=f"test_strategy_{created_at.isoformat()}_ord{i}",
-                strategy_name="test_strategy",
-                created_at=created_at,
-                updated_at=created_at,
-                metrics={"sharpe_ratio": float(i)},
-            )
+    def test_list_runs_ordered_by_metric_with_limit(self):
+        """Test that a metrics sort is applied before the limit."""
+        runs = list_runs(order_by="sharpe_ratio", limit=2)
+        assert [r["metrics"]["sharpe_ratio"] for r in runs] == [4.0, 3.0]
+        assert runs[0]["id"] == "strategy_b_20241214_120003_run4"
+        assert runs[0]["updated_at"] == datetime(2024, 12, 14, 12, 0, 3)
 
-        runs = list_runs()
-        # Should be ordered by updated_at, newest to oldest
-        assert runs[0]["updated_at"] == datetime(2024, 12, 14, 12, 0, 2)
-        assert runs[1]["updated_at"] == datetime(2024, 12, 14, 12, 0, 1)
-        assert runs[2]["updated_at"] == datetime(2024, 12, 14, 12, 0, 0)
+        runs = list_runs(strategy="strategy_a", order_by="sharpe_ratio", descending=False)
+        assert [r["metrics"]["sharpe_ratio"] for r in runs] == [0.0, 2.0, 3.0]
 
 
 class TestParquetStorage:
@@ -341,7 +420,9 @@ class TestParquetStorage:
         full_path = get_artifacts_dir() / run_id / f"{artifact_name}.parquet"
         assert full_path.exists()
 
-    def test_load_artifact_returns_dataframe(self, temp_storage_dir, sample_trades_df):
+    def test_load_artifact_returns_dataframe(
+        self, temp_storage_dir, sample_trades_df, assert_frame_hash_equal
+    ):
         """Test that load_artifact returns the correct DataFrame."""
         run_id = "test_run_456"
         artifact_name = "trades"
@@ -353,8 +434,32 @@ class TestParquetStorage:
         loaded_df = load_artifact(file_path)
 
         # Verify data matches
-        pd.testing.assert_frame_equal(loaded_df, sample_trades_df)
+        assert_frame_hash_equal(loaded_df, sample_trades_df)
+
+    def test_load_artifact_selected_columns(self, temp_storage_dir, sample_signal_df):
+        """Test that load_artifact reads only the requested columns, skipping unknown ones."""
+        file_path = save_artifact("test_run_cols", "entry", sample_signal_df)
+
+        loaded_df = load_artifact(file_path, columns=["2330", "9999"])
+
+        pd.testing.assert_frame_equal(loaded_df, sample_signal_df[["2330"]], check_freq=False)
 
+    @pytest.mark.parametrize("compression", ["snappy", None])
+    def test_save_artifact_uses_configured_compression(
+        self, temp_storage_dir, sample_trades_df, compression
+    ):
+        """Test that save_artifact writes with the configured Parquet codec."""
+        import pyarrow.parquet as pq
+
+        with config(parquet_compression=compression):
+            file_path = save_artifact("test_run_codec", "trades", sample_trades_df)
+
+        metadata = pq.ParquetFile(temp_storage_dir / file_path).metadata
+        codec = metadata.row_group(0).column(0).compression
+        assert codec == (compression or "uncompressed").upper()
+        pd.testing.assert_frame_equal(load_artifact(file_path), sample_trades_df)
+
+    @pytest.mark.usefixtures("skip_parquet_writes")
     def test_delete_artifacts_removes_directory(self, temp_storage_dir, sample_trades_df):
         """Test that delete_artifacts removes the run's artifact directory."""
         run_id = "test_run_789"
@@ -379,7 +484,9 @@ class TestParquetStorage:
         # Should not raise an error
         delete_artifacts("nonexistent_run_id")
 
-    def test_save_artifact_with_index(self, temp_storage_dir, sample_signal_df):
+    def test_save_artifact_with_index(
+        self, temp_storage_dir, sample_signal_df, assert_frame_hash_equal
+    ):
         """Test that save_artifact preserves DataFrame index."""
         run_id = "test_run_index"
         artifact_name = "signals"
@@ -390,7 +497,4 @@ class TestParquetStorage:
         # Verify index values are preserved (freq attribute may differ after roundtrip)
         assert list(loaded_df.index) == list(sample_signal_df.index)
         # Verify data is preserved
-        pd.testing.assert_frame_equal(
-            loaded_df.reset_index(drop=True),
-            sample_signal_df.reset_index(drop=True)
-        )
+        assert_frame_hash_equal(loaded_df, sample_signal_df, check_freq=False)